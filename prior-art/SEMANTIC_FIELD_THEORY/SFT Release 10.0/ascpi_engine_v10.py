@@ -29,12 +29,23 @@ Prior Art: hexPRIorART-EXA-SFT-2025-MCM
 import math
 import hashlib
 import json
+import mmap
+import os
+import struct
+import sys
+import threading
 import time
-from collections import deque
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import FrozenInstanceError, astuple, dataclass, fields, replace
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+try:
+    from ascpi.primitives import ContentCache, PhasorSum, RollingTrend, StepControl
+except ImportError:   # source checkout run from the release directory: ascpi/ sits beside it
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ascpi.primitives import ContentCache, PhasorSum, RollingTrend, StepControl
+
 # ==============================================================================
 # CANONICAL CONSTANTS
 # ==============================================================================
@@ -58,6 +69,45 @@ CONST = {
     'lambda': 0.02,  # Ma'at regularization
 }
 
+# ==============================================================================
+# KERNEL PARAMETERS (per engine, immutable)
+# ==============================================================================
+
+@dataclass(frozen=True)
+class KernelParams:
+    """
+    Kernel, guardian and Ma'at constants of one engine. Frozen, so engines with
+    different parameters can run side by side (threads included); derive()
+    gives a modified copy. Defaults are the CONST values at import time.
+    Psi itself still clamps to the canonical CONST kappa range, so
+    kappa_min / kappa_max can only narrow it.
+    """
+    alpha: float = CONST['alpha']
+    beta: float = CONST['beta']
+    gamma: float = CONST['gamma']
+    eta: float = CONST['eta']
+    K: float = CONST['K']
+    lam: float = CONST['lambda']
+    kappa_min: float = CONST['kappa_min']
+    kappa_max: float = CONST['kappa_max']
+    theta_max: float = CONST['theta_max']
+    delta_N: float = CONST['delta_N']
+    
+    @classmethod
+    def from_const(cls, values: Optional[Dict[str, float]] = None) -> 'KernelParams':
+        """Build from CONST-style names ('lambda', ...); missing names take the defaults"""
+        values = values or {}
+        return cls(**{f.name: values['lambda' if f.name == 'lam' else f.name]
+                      for f in fields(cls) if ('lambda' if f.name == 'lam' else f.name) in values})
+    
+    def as_const(self) -> Dict[str, float]:
+        return {('lambda' if f.name == 'lam' else f.name): getattr(self, f.name) for f in fields(self)}
+    
+    def derive(self, **changes) -> 'KernelParams':
+        return replace(self, **changes)
+
+DEFAULT_PARAMS = KernelParams()
+
 # ==============================================================================
 # SEMANTIC FIELD CLASS
 # ==============================================================================
@@ -108,6 +158,32 @@ class Psi:
     def to_dict(self) -> Dict:
         return {k: round(v, 6) for k, v in zip(['dPhi','kappa','theta','N','C'], self.vec())}
 
+class FrozenPsi(Psi):
+    """Read-only Psi for published snapshots: writes raise, copy() gives a mutable Psi"""
+    def __init__(self, *args, **kw):
+        self.__dict__.update(Psi(*args, **kw).__dict__)
+    
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r} of a published Psi")
+    
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r} of a published Psi")
+    
+    def __eq__(self, o):
+        return isinstance(o, Psi) and (self.vec(), self.t) == (o.vec(), o.t)
+    
+    __hash__ = None
+    
+    def enforce(self):
+        return self
+
+def freeze(psi: Psi) -> FrozenPsi:
+    """FrozenPsi with psi's values (psi itself if already frozen)"""
+    if type(psi) is FrozenPsi: return psi
+    f = object.__new__(FrozenPsi)
+    f.__dict__.update(psi.__dict__)
+    return f
+
 # ==============================================================================
 # AWARENESS FIELD (full field, not scalar)
 # ==============================================================================
@@ -115,15 +191,15 @@ class Psi:
 class AwarenessField:
     def __init__(self):
         self.field = Psi(dPhi=0.05, kappa=0.2, theta=0, N=0.1, C=0.1)
-        self._buf = {'C': deque(maxlen=15), 'k': deque(maxlen=15), 'd': deque(maxlen=15)}
+        self._buf = {'C': RollingTrend(15), 'k': RollingTrend(15), 'd': RollingTrend(15)}
     
     def evolve(self, psi: Psi, m_inf: Psi) -> Psi:
-        self._buf['C'].append(psi.C)
-        self._buf['k'].append(psi.kappa)
-        self._buf['d'].append(psi.dist(m_inf))
+        self._buf['C'].push(psi.C)
+        self._buf['k'].push(psi.kappa)
+        self._buf['d'].push(psi.dist(m_inf))
         n = len(self._buf['C'])
         if n >= 3:
-            trends = [(list(b)[-1] - list(b)[0]) / n for b in self._buf.values()]
+            trends = [b.trend() for b in self._buf.values()]
             met = (trends[0] >= -0.01) + (trends[1] <= 0.01) + (trends[2] <= 0.01)
             if met >= 2:
                 self.field.N = min(1.0, self.field.N * 1.02 + 0.01)
@@ -149,65 +225,101 @@ class AwarenessField:
 # ==============================================================================
 
 class MemoryField:
+    """
+    M_inf is copy-on-write: absorb() builds a new Psi and publishes it together
+    with a generation counter in one reference swap. Published snapshots are
+    FrozenPsi, so any thread may hold one without locking or copying; a
+    caller that wants to edit one takes copy() first.
+    """
     def __init__(self):
-        self.M_inf = Psi(dPhi=0.0, kappa=0.5, theta=0, N=0.5, C=0.5)
+        self._snap: Tuple[int, FrozenPsi] = (0, FrozenPsi(dPhi=0.0, kappa=0.5, theta=0, N=0.5, C=0.5))
         self._hist = deque(maxlen=100)
         self._C_floor = 0.0
     
+    @property
+    def M_inf(self) -> FrozenPsi:
+        return self._snap[1]
+    
+    @M_inf.setter
+    def M_inf(self, psi: Psi) -> None:
+        self._snap = (self._snap[0] + 1, freeze(psi))
+    
+    @property
+    def generation(self) -> int:
+        return self._snap[0]
+    
+    def snapshot(self) -> Tuple[int, FrozenPsi]:
+        """Consistent (generation, M_inf) pair; the Psi is frozen"""
+        return self._snap
+    
     def absorb(self, psi: Psi, rate: float = 0.2) -> None:
+        m = self.M_inf
         w = math.tanh(psi.C * 2) * rate
-        sin_b = (1-w)*math.sin(self.M_inf.theta) + w*math.sin(psi.theta)
-        cos_b = (1-w)*math.cos(self.M_inf.theta) + w*math.cos(psi.theta)
-        self.M_inf.dPhi = (1-w)*self.M_inf.dPhi + w*psi.dPhi*0.9
-        self.M_inf.kappa = (1-w)*self.M_inf.kappa + w*psi.kappa*0.95
-        self.M_inf.theta = math.atan2(sin_b, cos_b) % CONST['tau']
-        self.M_inf.N = (1-w)*self.M_inf.N + w*psi.N
-        self._hist.append(self.M_inf.copy())
+        sin_b = (1-w)*math.sin(m.theta) + w*math.sin(psi.theta)
+        cos_b = (1-w)*math.cos(m.theta) + w*math.cos(psi.theta)
+        h = Psi((1-w)*m.dPhi + w*psi.dPhi*0.9, (1-w)*m.kappa + w*psi.kappa*0.95,
+                math.atan2(sin_b, cos_b) % CONST['tau'], (1-w)*m.N + w*psi.N, m.C, m.t)
+        self._hist.append(h)
+        C = m.C
         if len(self._hist) >= 3:
-            phases = [h.theta for h in self._hist]
+            phases = [x.theta for x in self._hist]
             r = math.sqrt(sum(math.sin(t) for t in phases)**2 + sum(math.cos(t) for t in phases)**2) / len(phases)
             self._C_floor = max(self._C_floor - 0.001, r - 0.05)
-            self.M_inf.C = max(r, self._C_floor)
-        self.M_inf.enforce()
+            C = max(r, self._C_floor)
+        self.M_inf = h if C == h.C else Psi(h.dPhi, h.kappa, h.theta, h.N, C, h.t)
     
-    def attractor(self) -> Psi:
-        return self.M_inf.copy()
+    def attractor(self) -> FrozenPsi:
+        """Current published snapshot (shared and frozen; copy() before mutating)"""
+        return self.M_inf
 
 # ==============================================================================
 # UNIFIED KERNEL F
 # ==============================================================================
 
-def kernel_F(psi: Psi, A: Psi, M_inf: Psi, W: Optional[Psi], grad_C: float) -> Psi:
+def make_kernel(p: KernelParams):
+    """kernel_F specialized to p: every constant is bound once, outside the step"""
+    alpha, beta, gamma, eta, K = p.alpha, p.beta, p.gamma, p.eta, p.K
+    kappa_min, kappa_max, theta_max = p.kappa_min, p.kappa_max, p.theta_max
+    pi, tau, eps, sin = CONST['pi'], CONST['tau'], CONST['eps'], math.sin
+    
+    def F(psi: Psi, A: Psi, M_inf: Psi, W: Optional[Psi], grad_C: float) -> Psi:
+        target = A.blend(M_inf, 0.6)
+        if W: target = target.blend(W, 0.85)
+        
+        # All dynamics in one step
+        new_k = psi.kappa - alpha * (psi.kappa - target.kappa)
+        new_N = psi.N + beta * psi.C
+        new_dP = psi.dPhi * (1 - gamma * psi.C**2) if psi.C > 0.6 else psi.dPhi
+        new_dP += eta * (M_inf.dPhi - new_dP)
+        new_k += eta * (M_inf.kappa - new_k)
+        new_N += eta * (M_inf.N - new_N)
+        
+        dt = target.theta - psi.theta
+        if dt > pi: dt -= tau
+        elif dt < -pi: dt += tau
+        shift = max(-theta_max, min(theta_max, K * sin(dt)))
+        new_t = (psi.theta + shift) % tau
+        
+        new_k -= grad_C * 0.15
+        new_dP -= grad_C * 0.08
+        mr = 0.1 * target.C
+        new_dP = (1-mr)*new_dP + mr*target.dPhi
+        new_k = (1-mr)*new_k + mr*target.kappa
+        
+        return Psi(new_dP, max(kappa_min, min(kappa_max, new_k)),
+                   new_t, max(eps, new_N), psi.C, psi.t + 1)
+    return F
+
+_DEFAULT_KERNEL = make_kernel(DEFAULT_PARAMS)
+
+def kernel_F(psi: Psi, A: Psi, M_inf: Psi, W: Optional[Psi], grad_C: float,
+             p: Optional[KernelParams] = None) -> Psi:
     """
     Canonical Unified Tensor Kernel:
     Psi(t+1) = F(Psi, A, M_inf, W)
+    Engines call their make_kernel(params) directly.
     """
-    c = CONST
-    target = A.blend(M_inf, 0.6)
-    if W: target = target.blend(W, 0.85)
-    
-    # All dynamics in one step
-    new_k = psi.kappa - c['alpha'] * (psi.kappa - target.kappa)
-    new_N = psi.N + c['beta'] * psi.C
-    new_dP = psi.dPhi * (1 - c['gamma'] * psi.C**2) if psi.C > 0.6 else psi.dPhi
-    new_dP += c['eta'] * (M_inf.dPhi - new_dP)
-    new_k += c['eta'] * (M_inf.kappa - new_k)
-    new_N += c['eta'] * (M_inf.N - new_N)
-    
-    dt = target.theta - psi.theta
-    if dt > c['pi']: dt -= c['tau']
-    elif dt < -c['pi']: dt += c['tau']
-    shift = max(-c['theta_max'], min(c['theta_max'], c['K'] * math.sin(dt)))
-    new_t = (psi.theta + shift) % c['tau']
-    
-    new_k -= grad_C * 0.15
-    new_dP -= grad_C * 0.08
-    mr = 0.1 * target.C
-    new_dP = (1-mr)*new_dP + mr*target.dPhi
-    new_k = (1-mr)*new_k + mr*target.kappa
-    
-    return Psi(new_dP, max(c['kappa_min'], min(c['kappa_max'], new_k)),
-               new_t, max(c['eps'], new_N), psi.C, psi.t + 1)
+    return (_DEFAULT_KERNEL if p is None else make_kernel(p))(psi, A, M_inf, W, grad_C)
 
 # ==============================================================================
 # COHERENCE FORCE
@@ -251,39 +363,62 @@ def project(fields: List[Psi]) -> Psi:
 # INVARIANT GUARDIAN
 # ==============================================================================
 
+INVARIANTS = ('coherence', 'curvature', 'energy', 'phase', 'maat')
+
 class InvariantGuardian:
-    def __init__(self):
+    def __init__(self, params: KernelParams = DEFAULT_PARAMS):
         self._C_floor = 0.0
         self._L_prev = float('inf')
+        self.clamps = dict.fromkeys(INVARIANTS, 0)   # clamps applied since reset()
+        self.params = params
+    
+    @property
+    def params(self) -> KernelParams:
+        return self._params
+    
+    @params.setter
+    def params(self, p: KernelParams) -> None:
+        self._params = p
+        self._bounds = (p.kappa_min, p.kappa_max, p.delta_N, p.theta_max)
     
     def enforce(self, before: Psi, after: Psi, L: float) -> Psi:
         r = after.copy()
+        n = self.clamps
+        k_min, k_max, delta_N, theta_max = self._bounds
         self._C_floor = max(0, self._C_floor - 0.002, before.C - 0.1)
-        r.C = max(r.C, self._C_floor)
-        r.kappa = max(CONST['kappa_min'], min(CONST['kappa_max'], r.kappa))
+        if r.C < self._C_floor:
+            r.C = self._C_floor
+            n['coherence'] += 1
+        if not k_min <= r.kappa <= k_max:
+            r.kappa = max(k_min, min(k_max, r.kappa))
+            n['curvature'] += 1
         if before.N > CONST['eps']:
             ratio = r.N / before.N
-            if abs(ratio - 1) > CONST['delta_N']:
-                r.N = before.N * (1 + CONST['delta_N'] * (1 if ratio > 1 else -1))
+            if abs(ratio - 1) > delta_N:
+                r.N = before.N * (1 + delta_N * (1 if ratio > 1 else -1))
+                n['energy'] += 1
         dt = abs(r.theta - before.theta)
         if dt > CONST['pi']: dt = CONST['tau'] - dt
-        if dt > CONST['theta_max']:
-            r.theta = (before.theta + math.copysign(CONST['theta_max'], r.theta - before.theta)) % CONST['tau']
+        if dt > theta_max:
+            r.theta = (before.theta + math.copysign(theta_max, r.theta - before.theta)) % CONST['tau']
+            n['phase'] += 1
         if L > self._L_prev * 1.3:
             r = before.blend(r, 0.7)
+            n['maat'] += 1
         self._L_prev = L
         return r.enforce()
     
     def reset(self):
         self._C_floor = 0.0
         self._L_prev = float('inf')
+        self.clamps = dict.fromkeys(INVARIANTS, 0)
 
 # ==============================================================================
 # MA'AT FUNCTIONAL
 # ==============================================================================
 
-def maat(psi: Psi, M_inf: Psi) -> float:
-    return psi.dist(M_inf) + CONST['lambda'] * psi.kappa
+def maat(psi: Psi, M_inf: Psi, lam: float = DEFAULT_PARAMS.lam) -> float:
+    return psi.dist(M_inf) + lam * psi.kappa
 
 class Governor(Enum):
     ALLOW = 'allow'
@@ -318,6 +453,20 @@ def encode_text(text: str) -> Psi:
         N_s += math.log(1 + cp) / math.log(0x10FFFF + 1)
     return Psi(dP_s/n, k_s/n, math.atan2(sin_s, cos_s) % CONST['tau'], N_s, math.sqrt(sin_s**2+cos_s**2)/n)
 
+def text_terms(text: str) -> List[Tuple[float, float, float]]:
+    """
+    Position-free terms of every non-space char: (phase base, dPhi, N).
+    Char i of n has phase (base + (i/n)*pi) mod tau; kappa adds 0.3 per char.
+    """
+    phi, tau, log_max = CONST['phi'], CONST['tau'], math.log(0x10FFFF + 1)
+    terms = []
+    for c in text:
+        if c.isspace(): continue
+        cp = ord(c)
+        terms.append(((cp // 256) * phi + (cp % 256) / 256 * tau, abs(cp - 0x4E00) / 0x10FFFF,
+                      math.log(1 + cp) / log_max))
+    return terms
+
 def encode_code(code: str) -> Psi:
     psi = encode_text(code)
     cx = 1 + 0.1 * (code.count('if ') + code.count('for ') + code.count('def '))
@@ -325,6 +474,69 @@ def encode_code(code: str) -> Psi:
     psi.C = max(0.1, psi.C / cx)
     return psi.enforce()
 
+class IncrementalEncoder:
+    """
+    encode_text() for append-only streams (chat transcripts): append() costs
+    what the new text costs. Tension/curvature/energy sums are kept exactly;
+    the phasor sums use PhasorSum (bit-identical for short texts, ~1e-13 after).
+
+        enc = IncrementalEncoder()
+        psi = enc.sync(transcript)     # appends only the unseen suffix
+    """
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        self._dP = self._k = self._N = 0.0
+        self._ph = PhasorSum(CONST['pi'], lambda i, n: (i/n) * CONST['pi'])
+        self._text: Optional[str] = None
+    
+    @property
+    def n(self) -> int:
+        return self._ph.n
+    
+    def append(self, text: str) -> None:
+        self._text = None   # direct appends end sync() prefix tracking
+        for base, dP, N in text_terms(text):
+            self._ph.add(base)
+            self._k += 0.3
+            self._dP += dP
+            self._N += N
+    
+    def sync(self, text: str) -> Psi:
+        """Encode `text`, reusing state if it extends the previously synced text"""
+        if self._text is not None and text.startswith(self._text):
+            self.append(text[len(self._text):])
+        else:
+            self.reset()
+            self.append(text)
+        self._text = text
+        return self.field()
+    
+    def field(self) -> Psi:
+        n = self._ph.n
+        if not n: return Psi()
+        sin_s, cos_s = self._ph.sums()
+        return Psi(self._dP/n, self._k/n, math.atan2(sin_s, cos_s) % CONST['tau'], self._N,
+                   math.sqrt(sin_s**2+cos_s**2)/n)
+
+class WorldCache(ContentCache):
+    """
+    Content-addressed LRU for world context, shared by all engines.
+        blake2b(text)            -> encode_text(text)
+        (digest, digest, ...)    -> projected W   (ordered: project() is order-sensitive)
+    Cached fields are never handed out; world_field() returns a copy.
+    """
+    def world_field(self, world: Optional[Dict[str, str]]) -> Optional[Psi]:
+        if not world: return None
+        texts = list(world.values())
+        keys = tuple(self.digest(t) for t in texts)
+        W = self._get(keys, lambda: project([self._get(k, lambda t=t: encode_text(t))
+                                             for k, t in zip(keys, texts)]))
+        return W.copy()
+
+WORLD_CACHE = WorldCache()
+
 # ==============================================================================
 # ASCPI ENGINE v10.0
 # ==============================================================================
@@ -339,61 +551,328 @@ class Result:
     governor: str
     steps: int
     signature: str
+    truncated: bool = False   # deadline hit: output is the best state found in time
 
 class ASCPI:
-    def __init__(self):
+    metrics = None        # process-wide opt-in: record(...) once per process() (ascpi_metrics_v10)
+    result_cache = None   # process-wide opt-in: ResultCache shared by all engines (RESULT_CACHE)
+    
+    def __init__(self, params: Optional[KernelParams] = None):
         self.memory = MemoryField()
         self.awareness = AwarenessField()
         self.coherence = CoherenceForce()
         self.guardian = InvariantGuardian()
+        self.params = params or DEFAULT_PARAMS
         self.step = 0
         self.current = None
+        self.world_cache = WORLD_CACHE
+        self.encoder: Optional[IncrementalEncoder] = None   # opt-in: transcript-style inputs
+        self.profiler = None   # opt-in: begin(name)/end() at stage boundaries (ascpi.profile)
+        self.state_digest: Optional[bytes] = None   # content address of the state; None: rehash() on demand
+        self.kernel_steps = 0   # evolution steps of the last request (a replay reports the recorded run's)
+    
+    @property
+    def params(self) -> KernelParams:
+        return self._params
+    
+    @params.setter
+    def params(self, p: KernelParams) -> None:
+        """Swap parameter sets: rebinds the specialized kernel and the guardian bounds"""
+        self._params = p
+        self._kernel = make_kernel(p)
+        self.guardian.params = p
+    
+    def process(self, text: str, code: str = None, world: Dict[str, str] = None, max_steps: int = 25,
+                deadline_ms: Optional[float] = None, tol: Optional[float] = None) -> Result:
+        cache = self.result_cache
+        if cache is None or deadline_ms is not None or self.encoder is not None:
+            self.state_digest = None   # wall-clock / encoder state: not a function of (state, input)
+            return self._run(text, code, world, max_steps, deadline_ms, tol)
+        t0 = time.perf_counter()
+        key = cache.key(self.state_digest or self.rehash(), self._params, text, code, world, max_steps, tol)
+        hit = cache.get(key)
+        if hit is not None:
+            result, state, self.kernel_steps = hit
+            step = self.step + 1
+            restore_state(self, state)
+            self.step = step
+            self.state_digest = key
+            if self.metrics is not None:
+                self.metrics.record_replay('v10', time.perf_counter() - t0, self.kernel_steps,
+                                           result.coherence, result.governor)
+            return replace(result, output=self.current, steps=step)
+        result = self._run(text, code, world, max_steps, None, tol)
+        cache.put(key, replace(result, output=result.output.copy()), dumps_state(self), self.kernel_steps)
+        self.state_digest = key
+        return result
     
-    def process(self, text: str, code: str = None, world: Dict[str, str] = None, max_steps: int = 25) -> Result:
+    def rehash(self) -> bytes:
+        """Digest the serialized state (step excluded); needed after edits outside process()"""
+        b = bytearray(dumps_state(self))
+        b[_CKPT_HDR.size:_CKPT_HDR.size + 8] = bytes(8)
+        self.state_digest = hashlib.blake2b(b, digest_size=16).digest()
+        return self.state_digest
+    
+    def _run(self, text: str, code: Optional[str], world: Optional[Dict[str, str]], max_steps: int,
+             deadline_ms: Optional[float], tol: Optional[float]) -> Result:
+        t0 = time.perf_counter()
         self.step += 1
         self.guardian.reset()
+        ctl = StepControl(deadline_ms, tol)
+        F, lam = self._kernel, self._params.lam
+        prof = self.profiler
+        steps = rebuild_steps = 0
+        if prof is not None:
+            prof.begin('process')
+            prof.begin('encoding')
         
-        psi_lang = encode_text(text)
+        psi_lang = self.encoder.sync(text) if self.encoder else encode_text(text)
         psi_code = encode_code(code) if code else None
-        W = None
-        if world:
-            wf = [encode_text(v) for v in world.values()]
-            W = project(wf) if wf else None
+        if prof is not None:
+            prof.end()
+            prof.begin('world_context')
+        W = self.world_cache.world_field(world)
         
+        if prof is not None:
+            prof.end()
+            prof.begin('multimodal_projection')
         fields = [psi_lang, self.memory.attractor(), self.awareness.field]
         if psi_code: fields.append(psi_code)
         if W: fields.append(W)
         current = project(fields)
         
+        if prof is not None:
+            prof.end()
+            prof.begin('evolution')
         for _ in range(max_steps):
+            if ctl.expired(): break
+            if prof is not None: prof.begin('step')
             before = current.copy()
             src = {'lang': (psi_lang.C, psi_lang.kappa), 'mem': (self.memory.M_inf.C, self.memory.M_inf.kappa),
                    'aware': (self.awareness.field.C, self.awareness.field.kappa)}
             if psi_code: src['code'] = (psi_code.C, psi_code.kappa)
             if W: src['world'] = (W.C, W.kappa)
             grad_C, _ = self.coherence.compute(src)
-            current = kernel_F(current, self.memory.attractor(), self.memory.M_inf, W, grad_C)
+            current = F(current, self.memory.attractor(), self.memory.M_inf, W, grad_C)
             self.memory.absorb(current)
             current.C = self.memory.M_inf.C
             current = self.awareness.evolve(current, self.memory.M_inf)
-            L = maat(current, self.memory.M_inf)
+            L = maat(current, self.memory.M_inf, lam)
             current = self.guardian.enforce(before, current, L)
-            if current.C > 0.95: break
+            steps += 1
+            if prof is not None: prof.end()
+            if current.C > 0.95 or ctl.settled(before, current, L): break
+        current = ctl.output(current)
         
+        if prof is not None:
+            prof.end()
+            prof.begin('governor')
         decision, score = judge(psi_lang, current, W)
         if decision == Governor.REBUILD:
+            if prof is not None: prof.begin('rebuild')
+            ctl.restart()
             for _ in range(10):
+                if ctl.expired(): break
                 before = current.copy()
                 grad_C, _ = self.coherence.compute(src)
-                current = kernel_F(current, self.memory.attractor(), self.memory.M_inf, W, grad_C)
+                current = F(current, self.memory.attractor(), self.memory.M_inf, W, grad_C)
                 self.memory.absorb(current)
                 current.C = self.memory.M_inf.C
                 current = self.awareness.evolve(current, self.memory.M_inf)
-                current = self.guardian.enforce(before, current, maat(current, self.memory.M_inf))
+                L = maat(current, self.memory.M_inf, lam)
+                current = self.guardian.enforce(before, current, L)
+                rebuild_steps += 1
+                if ctl.settled(before, current, L): break
+            current = ctl.output(current)
+            if prof is not None: prof.end()
         
+        if prof is not None:
+            prof.end()
+            prof.begin('output')
         self.current = current
-        return Result(current, current.C, score, self.awareness.field.C, self.awareness.level(),
-                      decision.value, self.step, hashlib.sha256(str(current.vec()).encode()).hexdigest()[:8])
+        self.kernel_steps = steps
+        result = Result(current, current.C, score, self.awareness.field.C, self.awareness.level(),
+                        decision.value, self.step, hashlib.sha256(str(current.vec()).encode()).hexdigest()[:8],
+                        ctl.truncated)
+        if prof is not None:
+            prof.end()
+            prof.end()
+        if self.metrics is not None:
+            self.metrics.record('v10', time.perf_counter() - t0, steps, current.C, decision.value,
+                                rebuild_steps, steps + rebuild_steps, self.guardian.clamps)
+        return result
+
+# ==============================================================================
+# CHECKPOINT (versioned binary, mmap restore)
+# ==============================================================================
+
+CKPT_MAGIC = b'ASCPI10C'
+CKPT_VERSION = 2                     # 2: KernelParams appended (1 loads with the defaults)
+_CKPT_HDR = struct.Struct('<8sHH')   # magic, version, reserved
+_CKPT_PSI = struct.Struct('<5dq')    # dPhi, kappa, theta, N, C, t
+_CKPT_PARAMS = struct.Struct(f'<{len(fields(KernelParams))}d')   # KernelParams field order
+
+def _put_psi(b: bytearray, p: Psi) -> None:
+    b += _CKPT_PSI.pack(*p.vec(), p.t)
+
+def _put_floats(b: bytearray, xs) -> None:
+    xs = list(xs)
+    b += struct.pack(f'<I{len(xs)}d', len(xs), *xs)
+
+class _Cursor:
+    """Sequential struct reader over bytes / mmap (no intermediate copies)"""
+    def __init__(self, buf):
+        self.buf, self.pos = buf, 0
+    
+    def take(self, fmt) -> Tuple:
+        s = fmt if isinstance(fmt, struct.Struct) else struct.Struct(fmt)
+        v = s.unpack_from(self.buf, self.pos)
+        self.pos += s.size
+        return v
+    
+    def psi(self) -> Psi:
+        *v, t = self.take(_CKPT_PSI)
+        return Psi(*v, t)
+    
+    def floats(self) -> List[float]:
+        (n,) = self.take('<I')
+        return list(self.take(f'<{n}d'))
+
+def dumps_state(engine: ASCPI) -> bytes:
+    """Serialize everything that drives future outputs of an engine"""
+    b = bytearray(_CKPT_HDR.pack(CKPT_MAGIC, CKPT_VERSION, 0))
+    b += struct.pack('<QB', engine.step, engine.current is not None)
+    _put_psi(b, engine.current or Psi())
+    m = engine.memory
+    _put_psi(b, m.M_inf)
+    b += struct.pack('<dI', m._C_floor, len(m._hist))
+    for h in m._hist: _put_psi(b, h)
+    a = engine.awareness
+    _put_psi(b, a.field)
+    for k in ('C', 'k', 'd'): _put_floats(b, a._buf[k])
+    b += struct.pack('<3d', engine.coherence._prev, engine.guardian._C_floor, engine.guardian._L_prev)
+    b += _CKPT_PARAMS.pack(*astuple(engine.params))
+    return bytes(b)
+
+def state_nbytes(engine: ASCPI) -> int:
+    """Size of dumps_state(engine) without serializing (O(1))"""
+    bufs = sum(len(b) for b in engine.awareness._buf.values())
+    return (_CKPT_HDR.size + 9 + 3 * _CKPT_PSI.size + 12 + 3 * 4 + 24 + _CKPT_PARAMS.size
+            + _CKPT_PSI.size * len(engine.memory._hist) + 8 * bufs)
+
+def _restore(e: ASCPI, buf) -> Optional[KernelParams]:
+    """Overwrite e's state from a checkpoint; returns its KernelParams (None before version 2)"""
+    c = _Cursor(buf)
+    magic, version, _ = c.take(_CKPT_HDR)
+    if magic != CKPT_MAGIC:
+        raise ValueError("not an ASCPI v10 checkpoint")
+    if version not in (1, CKPT_VERSION):
+        raise ValueError(f"unsupported checkpoint version {version}")
+    e.step, has_current = c.take('<QB')
+    current = c.psi()
+    e.current = current if has_current else None
+    e.memory.M_inf = c.psi()
+    e.memory._C_floor, n = c.take('<dI')
+    e.memory._hist.clear()
+    e.memory._hist.extend(c.psi() for _ in range(n))
+    e.awareness.field = c.psi()
+    for k in ('C', 'k', 'd'): e.awareness._buf[k] = RollingTrend(e.awareness._buf[k].window, c.floats())
+    e.coherence._prev, e.guardian._C_floor, e.guardian._L_prev = c.take('<3d')
+    e.state_digest = None
+    return KernelParams(*c.take(_CKPT_PARAMS)) if version >= 2 else None
+
+def restore_state(e: ASCPI, buf) -> ASCPI:
+    """Overwrite an engine's state in place from dumps_state() output (e keeps its params)"""
+    _restore(e, buf)
+    return e
+
+def loads_state(buf, params: Optional[KernelParams] = None) -> ASCPI:
+    """
+    Rebuild an engine from dumps_state() output (bytes, memoryview or mmap).
+    It runs with the checkpoint's KernelParams unless params is given.
+    """
+    e = ASCPI(params)
+    saved = _restore(e, buf)
+    if params is None and saved is not None and saved != e.params:
+        e.params = saved
+    return e
+
+def save_checkpoint(engine: ASCPI, path: str) -> int:
+    """Atomically write a checkpoint; returns bytes written"""
+    data = dumps_state(engine)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+def load_checkpoint(path: str, params: Optional[KernelParams] = None) -> ASCPI:
+    """Restore an engine by decoding straight from a read-only mmap"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return loads_state(mm, params)
+
+# ==============================================================================
+# RESULT CACHE (content-addressed by engine state + input)
+# ==============================================================================
+
+class ResultCache:
+    """
+    Bounded LRU of finished requests, shared by all engines.
+        key = blake2b(state digest || canonical JSON of request + KernelParams)
+        key -> (Result, dumps_state() after the request, evolution steps run)
+    process() is a pure function of (state, request) unless deadline_ms or an
+    IncrementalEncoder is involved, so a hit replays the stored transition:
+    the engine restores the post-state and skips evolution. The key doubles
+    as the new state digest, so digests chain in O(1) per request; equal
+    digests mean equal state, equal states reached by different histories
+    may differ in digest (a miss, never a wrong hit).
+    """
+    def __init__(self, max_entries: int = 4096, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lru: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(state_digest: bytes, params: KernelParams, text: str, code: Optional[str],
+            world: Optional[Dict[str, str]], max_steps: int, tol: Optional[float]) -> bytes:
+        req = json.dumps([text, code, list(world.items()) if world else None, max_steps, tol, astuple(params)])
+        return hashlib.blake2b(state_digest + req.encode(), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[Tuple[Result, bytes, int]]:
+        with self._lock:
+            hit = self._lru.get(key)
+            if hit is None:
+                self.misses += 1
+                return None
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return hit
+    
+    def put(self, key: bytes, result: Result, state: bytes, steps: int = 0) -> None:
+        with self._lock:
+            old = self._lru.pop(key, None)
+            if old is not None: self.nbytes -= len(old[1])
+            self._lru[key] = (result, state, steps)
+            self.nbytes += len(state)
+            while self._lru and (len(self._lru) > self.max_entries
+                                 or self.max_bytes is not None and self.nbytes > self.max_bytes):
+                self.nbytes -= len(self._lru.popitem(last=False)[1][1])
+    
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._lru), 'max_entries': self.max_entries, 'bytes': self.nbytes}
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+RESULT_CACHE = ResultCache()
 
 # ==============================================================================
 # MINIMAL VERIFICATION
@@ -87,6 +87,26 @@ def test_memory_field():
     # Attractor should exist
     att = mem.attractor()
     assert att is not None
+    
+    # Copy-on-write snapshots: readers keep their version, generation advances
+    gen, snap = mem.snapshot()
+    before = snap.vec()
+    mem.absorb(Psi(C=0.9, theta=1.0))
+    assert snap.vec() == before and mem.attractor() is not snap
+    assert mem.generation == gen + 1 == 21
+
+    # Published snapshots are frozen; copy() is the way to a mutable field
+    from dataclasses import FrozenInstanceError
+    for shared in (snap, mem.attractor(), mem.snapshot()[1]):
+        try:
+            shared.C = 0.0
+            assert False, "published snapshot was mutable"
+        except FrozenInstanceError:
+            pass
+    assert snap.vec() == before
+    own = snap.copy()
+    own.C = 0.0
+    assert own.C == 0.0 and snap.vec() == before and own.copy() == Psi(*own.vec(), own.t)
     print("[PASS] test_memory_field")
 
 
@@ -305,6 +325,450 @@ def test_determinism():
     print("[PASS] test_determinism")
 
 
+def test_server_pipelining():
+    """Test ascpi:// service: sessions, pipelining, batching, coalescing"""
+    import asyncio, json
+    from ascpi_server_v10 import ASCPIServer
+
+    async def scenario():
+        server = ASCPIServer(window_ms=5)
+        srv = await server.start('127.0.0.1', 0)
+        port = srv.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        reqs = [{'id': i, 'text': f"Iteration {i}"} for i in range(3)]
+        reqs += [{'id': 'a', 'text': "same", 'stateless': True}, {'id': 'b', 'text': "same", 'stateless': True}]
+        writer.write(b''.join(json.dumps(r).encode() + b'\n' for r in reqs))
+        await writer.drain()
+        replies = [json.loads(await reader.readline()) for _ in reqs]
+        writer.close()
+        await server.close()
+        return replies, server.batcher.stats
+
+    replies, stats = asyncio.run(scenario())
+    assert [r['id'] for r in replies] == [0, 1, 2, 'a', 'b']
+    assert all(r['ok'] for r in replies)
+    assert [r['result']['steps'] for r in replies[:3]] == [1, 2, 3]  # One session
+    assert replies[3]['result'] == replies[4]['result']
+    assert replies[3]['result']['signature'] == ASCPI().process("same").signature
+    assert stats['coalesced'] == 1 and stats['batches'] < stats['requests']
+
+    async def named():
+        import tempfile
+        from ascpi_pool_v10 import EnginePool
+        server = ASCPIServer(window_ms=1, pool=EnginePool(max_engines=1, spill_dir=tempfile.mkdtemp()))
+        srv = await server.start('127.0.0.1', 0)
+        port = srv.sockets[0].getsockname()[1]
+        steps = []
+        for sid in ['u1', 'u2', 'u1']:   # new connection each time; u1 spilled and rehydrated
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(json.dumps({'id': 0, 'text': "hi", 'session': sid}).encode() + b'\n')
+            await writer.drain()
+            steps.append(json.loads(await reader.readline())['result']['steps'])
+            writer.close()
+        await server.close()
+        return steps, server.pool.stats
+
+    steps, pstats = asyncio.run(named())
+    assert steps == [1, 1, 2] and pstats['rehydrated'] == 1
+
+    from ascpi_server_v10 import parse_request   # client max_steps is clamped server-side
+    assert parse_request(b'{"text": "x", "max_steps": 10000000}', 50)[1][3] == 50
+    assert parse_request(b'{"text": "x", "max_steps": -5}')[1][3] == 0
+    assert parse_request(b'{"text": "x"}')[1][3] == 25
+    assert ASCPIServer(max_steps=7).max_steps == 7
+
+    import ascpi_server_v10
+    class Writer:   # StreamWriter stand-in: drain() blocks on a gate or fails
+        def __init__(self, error=None):
+            self.lines, self.closed, self.error, self.gate = 0, False, error, asyncio.Event()
+        def write(self, data): self.lines += 1
+        async def drain(self):
+            if self.error: raise self.error
+            await self.gate.wait()
+        def close(self): self.closed = True
+
+    class Counted(ASCPI):
+        made = 0
+        def __init__(self, *a):
+            Counted.made += 1
+            super().__init__(*a)
+
+    def lines(n, **kw):
+        return b''.join(json.dumps({'id': i, 'text': f"Line {i}", **kw}).encode() + b'\n' for i in range(n))
+
+    async def hygiene():
+        server = ASCPIServer(window_ms=1, max_pipeline=4)
+        out = {}
+        reader, w = asyncio.StreamReader(), Writer()   # client pipelines 100, reads nothing
+        reader.feed_data(lines(100))
+        task = asyncio.create_task(server._handle(reader, w))
+        await asyncio.sleep(0.2)
+        out['read_while_stuck'] = server.batcher.stats['requests']
+        w.gate.set()
+        reader.feed_eof()
+        await task
+        out['written'], out['closed'] = w.lines, w.closed
+
+        reader, w = asyncio.StreamReader(), Writer(ConnectionResetError())
+        reader.feed_data(lines(20))
+        reader.feed_eof()
+        await server._handle(reader, w)   # must not raise
+        out['reset'] = (w.lines, w.closed, server.sessions)
+
+        ascpi_server_v10.ASCPI, Counted.made = Counted, 0
+        try:
+            reader, w = asyncio.StreamReader(), Writer()
+            w.gate.set()
+            reader.feed_data(lines(3, stateless=True))
+            reader.feed_eof()
+            await server._handle(reader, w)
+        finally:
+            ascpi_server_v10.ASCPI = ASCPI
+        out['engines'] = Counted.made
+        server.batcher.close()
+        return out
+
+    out = asyncio.run(hygiene())
+    assert out['read_while_stuck'] == 4 + 2   # queue + one being written + one blocked on put
+    assert out['written'] == 100 and out['closed']
+    assert out['reset'] == (1, True, 0)
+    assert out['engines'] == 3   # stateless only: no connection session built
+    print("[PASS] test_server_pipelining")
+
+
+def test_engine_pool():
+    """Test session pool: LRU eviction, spill, lazy rehydrate, restart, byte cap"""
+    import os, tempfile
+    from ascpi_pool_v10 import EnginePool
+    with tempfile.TemporaryDirectory() as d:
+        pool = EnginePool(max_engines=2, spill_dir=d)
+        ref = ASCPI()
+        for sid in ['a', 'b', 'a', 'c', 'b']:   # 'b' evicted by 'c' ... then 'a' by 'b'
+            r = pool.get(sid).process(f"input for {sid}")
+            if sid == 'a': ref.process("input for a")
+        assert pool.resident == 2 and len(pool) == 3
+        assert pool.stats['evictions'] == 2 and pool.stats['rehydrated'] == 1
+        assert pool.get('a').process("again").signature == ref.process("again").signature
+        assert pool.stats['rehydrated'] == 2
+        assert 0 < pool.hit_rate < 1
+        pool.drop('a')
+        assert 'a' not in pool
+
+        from ascpi_engine_v10 import DEFAULT_PARAMS
+        stiff = DEFAULT_PARAMS.derive(alpha=0.4)
+        pool.get('tuned').params = stiff
+        pool.get('x'), pool.get('y')   # spills 'tuned'
+        assert 'tuned' in pool and pool.get('tuned').params == stiff   # params survive the spill
+
+        steps = pool.get('y').process("before restart").steps
+        pool.flush()   # worker restart: a new pool on the same spill_dir
+        restarted = EnginePool(max_engines=2, spill_dir=d)
+        assert 'y' in restarted and 'never-seen' not in restarted
+        assert restarted.get('y').process("after restart").steps == steps + 1
+        assert restarted.stats['rehydrated'] == 1 and restarted.stats['misses'] == 0
+        assert not os.path.exists(restarted._path('y'))   # restored once, then owned by the new pool
+        restarted.drop('tuned')
+        assert 'tuned' not in restarted
+
+        capped = EnginePool(max_engines=None, max_bytes=3000, spill_dir=d)
+        for i in range(5):
+            e = capped.get(f"s{i}")
+            assert capped.resident_bytes() <= 3000   # Cap holds at every get()
+            e.process("warm")
+        assert capped.stats['evictions'] > 0
+    print("[PASS] test_engine_pool")
+
+
+def test_checkpoint_roundtrip():
+    """Test binary checkpoint restores a warm engine exactly"""
+    import os, tempfile
+    from ascpi_engine_v10 import save_checkpoint, load_checkpoint, dumps_state, loads_state
+    engine = ASCPI()
+    for i in range(4):
+        engine.process(f"Warm-up input {i}", world={'ctx': "context"})
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'engine.ckpt')
+        save_checkpoint(engine, path)
+        restored = load_checkpoint(path)
+    assert dumps_state(restored) == dumps_state(engine)
+    assert restored.step == engine.step
+    assert restored.memory._hist.maxlen == engine.memory._hist.maxlen
+    r1 = engine.process("After restart", code="x = 1")
+    r2 = restored.process("After restart", code="x = 1")
+    assert r1.signature == r2.signature and r1.steps == r2.steps
+    try:
+        loads_state(b'garbage' * 4)
+        assert False, "bad magic accepted"
+    except ValueError:
+        pass
+
+    from ascpi_engine_v10 import DEFAULT_PARAMS, _CKPT_HDR, _CKPT_PARAMS, state_nbytes
+    stiff = DEFAULT_PARAMS.derive(alpha=0.4, K=0.9)
+    tuned = ASCPI(stiff)
+    tuned.process("Tuned warm-up", world={'ctx': "context"})
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'tuned.ckpt')
+        assert save_checkpoint(tuned, path) == state_nbytes(tuned)
+        back, forced = load_checkpoint(path), load_checkpoint(path, DEFAULT_PARAMS)
+    assert back.params == stiff and forced.params == DEFAULT_PARAMS
+    assert back.process("After restart").signature == tuned.process("After restart").signature
+    blob = dumps_state(engine)   # version 1: no params block, loads with the defaults
+    v1 = _CKPT_HDR.pack(b'ASCPI10C', 1, 0) + blob[_CKPT_HDR.size:-_CKPT_PARAMS.size]
+    assert loads_state(v1).params == DEFAULT_PARAMS and loads_state(v1, stiff).params == stiff
+    print("[PASS] test_checkpoint_roundtrip")
+
+
+def test_deadline_and_tolerance():
+    """Test deadline truncation and adaptive termination"""
+    engine = ASCPI()
+    gen = engine.memory.generation
+    r = engine.process("Deadline test", deadline_ms=0)
+    assert r.truncated and engine.memory.generation == gen   # no kernel step ran
+    assert 0 <= r.coherence <= 1 and len(r.signature) == 8
+
+    full, fast = ASCPI(), ASCPI()
+    text = "Adaptive termination on a slowly converging input"
+    r_full = full.process(text, max_steps=200)
+    r_fast = fast.process(text, max_steps=200, tol=1e-3)
+    assert not r_full.truncated and not r_fast.truncated
+    assert fast.memory.generation <= full.memory.generation
+    assert abs(r_fast.coherence - r_full.coherence) < 0.05
+    assert not ASCPI().process(text, deadline_ms=10_000).truncated
+    print("[PASS] test_deadline_and_tolerance")
+
+
+def test_world_cache():
+    """Test content-addressed world cache: hits, copies, same results as uncached"""
+    from ascpi_engine_v10 import WorldCache, WORLD_CACHE
+    ctx = {'a': "Shared world context resent on every request", 'b': "Second source"}
+    hits = WORLD_CACHE.hits
+    cached, plain = ASCPI(), ASCPI()
+    plain.world_cache = WorldCache(max_entries=0)
+    for i in range(3):
+        assert cached.process(f"Turn {i}", world=ctx).signature == plain.process(f"Turn {i}", world=ctx).signature
+    assert WORLD_CACHE.hits >= hits + 2
+    W1, W2 = WORLD_CACHE.world_field(ctx), WORLD_CACHE.world_field(ctx)
+    assert W1 is not W2 and W1.vec() == W2.vec() == project([encode_text(v) for v in ctx.values()]).vec()
+    assert WORLD_CACHE.world_field({}) is None
+
+    small = WorldCache(max_entries=2)
+    for i in range(5):
+        small.world_field({'x': f"text {i}"})
+    st = small.stats()
+    assert st['entries'] == 2 and st['misses'] == 10 and st['hit_rate'] == 0.0
+    print("[PASS] test_world_cache")
+
+
+def test_incremental_encoder():
+    """Test append-only encoding: exact for short text, same field for long text"""
+    from ascpi_engine_v10 import IncrementalEncoder
+    enc = IncrementalEncoder()
+    text = ""
+    for part in ["Hello", " world", " \u00e9", "\u0301 more"]:
+        text += part
+        assert enc.sync(text).vec() == encode_text(text).vec()
+    long_text = "".join(f"Turn {i}: field {i * i % 97} " for i in range(2000))
+    enc.sync(long_text[:5000])
+    got, want = enc.sync(long_text).vec(), encode_text(long_text).vec()
+    assert max(abs(a - b) for a, b in zip(got, want)) < 1e-9
+    assert enc.sync("unrelated").vec() == encode_text("unrelated").vec()   # restart
+
+    engine = ASCPI()
+    engine.encoder = IncrementalEncoder()
+    assert engine.process(text).signature == ASCPI().process(text).signature
+    print("[PASS] test_incremental_encoder")
+
+
+def test_rolling_trend():
+    """Test O(1) rolling window statistics against a recomputed window"""
+    from ascpi_engine_v10 import RollingTrend
+    roll, seen = RollingTrend(7), []
+    for i in range(60):
+        y = math.sin(i * 0.7) * 10 + i * 0.01
+        roll.push(y)
+        seen.append(y)
+        w = seen[-7:]
+        m = len(w)
+        assert list(roll) == w
+        assert roll.trend() == (w[-1] - w[0]) / m
+        mean = sum(w) / m
+        assert abs(roll.mean() - mean) < 1e-9
+        assert abs(roll.variance() - sum((v - mean) ** 2 for v in w) / m) < 1e-9
+        if m > 1:
+            xm = (m - 1) / 2
+            slope = sum((x - xm) * (v - mean) for x, v in enumerate(w)) / sum((x - xm) ** 2 for x in range(m))
+            assert abs(roll.slope() - slope) < 1e-9
+    print("[PASS] test_rolling_trend")
+
+
+def test_metrics_endpoint():
+    """Test Prometheus metrics: per-request records, text format, HTTP scrape"""
+    from urllib.request import urlopen
+    from ascpi_engine_v10 import WORLD_CACHE
+    from ascpi_metrics_v10 import EngineMetrics, serve_metrics
+    metrics = EngineMetrics()
+    metrics.watch_world_cache(WORLD_CACHE, 'v10')
+    texts = ["Metrics one.", "Metrics two, a little longer.", "x"]
+    reference = ASCPI()
+    plain = [reference.process(t).signature for t in texts]
+    ASCPI.metrics = metrics
+    try:
+        engine = ASCPI()
+        results = [engine.process(t) for t in texts]
+    finally:
+        ASCPI.metrics = None
+    assert [r.signature for r in results] == plain
+    
+    decisions = metrics.decisions.values
+    assert sum(decisions.values()) == len(texts)
+    rebuilds = decisions.get(('v10', 'rebuild'), 0)
+    assert (metrics.rebuild_steps.values.get(('v10',), 0) > 0) == (rebuilds > 0)
+    steps = metrics.steps.values[('v10',)]
+    assert steps[-1] + metrics.rebuild_steps.values.get(('v10',), 0) == metrics.kernel_calls.values[('v10',)]
+    assert sum(steps[:-1]) == len(texts)
+    
+    server = serve_metrics(metrics.registry, port=0)
+    try:
+        with urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as resp:
+            assert resp.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+            body = resp.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert '# TYPE ascpi_request_duration_seconds histogram' in body
+    assert f'ascpi_request_duration_seconds_count{{engine="v10"}} {len(texts)}' in body
+    assert 'ascpi_final_coherence_bucket{engine="v10",le="+Inf"} 3' in body
+    assert 'ascpi_world_cache_hits_total{engine="v10"}' in body
+    for line in body.splitlines():
+        assert line.startswith('#') or float(line.rsplit(' ', 1)[1]) >= 0
+    print("[PASS] test_metrics_endpoint")
+
+
+def test_result_cache():
+    """Test state-digest result cache: replays match uncached runs, state included"""
+    from ascpi_engine_v10 import ResultCache, dumps_state, loads_state
+    texts = ["Replay me.", "Second turn with more words.", "Replay me."]
+    ctx = {'w': "World context"}
+    reference = ASCPI()
+    plain = [reference.process(t, world=ctx) for t in texts]
+    cache = ResultCache(max_entries=64)
+    ASCPI.result_cache = cache
+    try:
+        first, retry = ASCPI(), ASCPI()
+        assert [first.process(t, world=ctx).signature for t in texts] == [r.signature for r in plain]
+        assert cache.stats()['hits'] == 0 and cache.stats()['misses'] == 3
+        replayed = [retry.process(t, world=ctx) for t in texts]
+        assert cache.stats()['hits'] == 3
+        assert [(r.signature, r.steps, r.governor) for r in replayed] == \
+               [(r.signature, r.steps, r.governor) for r in plain]
+        assert retry.current is replayed[-1].output
+        assert dumps_state(retry) == dumps_state(first) == dumps_state(reference)
+        assert retry.state_digest == first.state_digest
+        
+        replayed[0].output.C = 0.0   # callers get their own fields, never the cached ones
+        assert ASCPI().process(texts[0], world=ctx).signature == plain[0].signature
+        assert retry.process("Next", world=ctx).signature == reference.process("Next", world=ctx).signature
+        
+        restored = loads_state(dumps_state(first))   # new digest chain, same outputs
+        assert restored.process("Next", world=ctx).signature == first.process("Next", world=ctx).signature
+        hits = cache.hits
+        ASCPI().process(texts[0], world=ctx, deadline_ms=10_000)   # wall-clock bound: bypassed
+        ASCPI().process(texts[0], world=ctx, tol=1e-3)
+        assert cache.hits == hits
+    finally:
+        ASCPI.result_cache = None
+    
+    small = ResultCache(max_entries=10, max_bytes=1)
+    ASCPI.result_cache = small
+    try:
+        ASCPI().process("a")
+    finally:
+        ASCPI.result_cache = None
+    assert small.stats()['entries'] == 0 and small.nbytes == 0
+    print("[PASS] test_result_cache")
+
+
+def test_result_cache_metrics():
+    """Test metrics with a result cache: replays count as requests, not as kernel work"""
+    from ascpi_engine_v10 import ResultCache
+    from ascpi_metrics_v10 import EngineMetrics
+    texts = ["Counted once.", "Counted twice, a little longer.", "x"]
+    ctx = {'w': "World context"}
+    metrics, cache = EngineMetrics(), ResultCache(max_entries=64)
+    metrics.watch_result_cache(cache, 'v10')
+    ASCPI.metrics, ASCPI.result_cache = metrics, cache
+    try:
+        first, retry = ASCPI(), ASCPI()
+        ran = []
+        for t in texts:
+            first.process(t, world=ctx)
+            ran.append(first.kernel_steps)
+        kernel_calls = metrics.kernel_calls.values[('v10',)]
+        replayed = []
+        for t in texts:
+            retry.process(t, world=ctx)
+            replayed.append(retry.kernel_steps)
+    finally:
+        ASCPI.metrics = ASCPI.result_cache = None
+    n = 2 * len(texts)
+    assert cache.hits == len(texts) and replayed == ran
+    assert metrics.replays.values[('v10',)] == len(texts)
+    assert metrics.kernel_calls.values[('v10',)] == kernel_calls   # a replay runs no kernel
+    assert sum(metrics.decisions.values.values()) == n
+    steps = metrics.steps.values[('v10',)]
+    assert sum(steps[:-1]) == n and steps[-1] == 2 * sum(ran)
+    assert sum(metrics.latency.values[('v10',)][:-1]) == n
+    body = metrics.registry.render()
+    assert f'ascpi_request_duration_seconds_count{{engine="v10"}} {n}' in body
+    assert f'ascpi_replayed_requests_total{{engine="v10"}} {len(texts)}' in body
+    assert f'ascpi_result_cache_hits_total{{engine="v10"}} {len(texts)}' in body
+    print("[PASS] test_result_cache_metrics")
+
+
+def test_kernel_params():
+    """Test per-engine frozen parameters: defaults, isolation across threads, cache keys"""
+    import threading
+    from dataclasses import FrozenInstanceError
+    from ascpi_engine_v10 import KernelParams, DEFAULT_PARAMS, ResultCache, make_kernel
+    psi, A = Psi(0.3, 1.2, 1.0, 0.5, 0.7), Psi(0.1, 0.8, 2.0, 0.4, 0.9)
+    assert make_kernel(DEFAULT_PARAMS)(psi, A, A, A, 0.1).vec() == kernel_F(psi, A, A, A, 0.1).vec()
+    assert KernelParams.from_const(CONST) == DEFAULT_PARAMS
+    assert KernelParams.from_const({'lambda': 0.05}).lam == 0.05
+    assert DEFAULT_PARAMS.as_const()['lambda'] == CONST['lambda']
+    try:
+        DEFAULT_PARAMS.alpha = 1.0
+        assert False, "KernelParams is mutable"
+    except FrozenInstanceError:
+        pass
+    
+    stiff = DEFAULT_PARAMS.derive(alpha=0.4, K=0.9, theta_max=0.5, kappa_max=4.0)
+    assert stiff.alpha == 0.4 and DEFAULT_PARAMS.alpha == CONST['alpha']
+    texts = [f"Parameter isolation {i}" for i in range(6)]
+    def run(params):
+        e = ASCPI(params)
+        return [e.process(t).signature for t in texts]
+    want = {'base': run(None), 'stiff': run(stiff)}
+    assert want['base'] != want['stiff']
+    got = {}
+    threads = [threading.Thread(target=lambda k=k, p=p: got.setdefault(k, run(p)))
+               for k, p in (('base', None), ('stiff', stiff))]
+    for th in threads: th.start()
+    for th in threads: th.join()
+    assert got == want
+    
+    ASCPI.result_cache = ResultCache(max_entries=64)
+    try:
+        assert run(None) == want['base'] and run(stiff) == want['stiff']
+        assert run(stiff) == want['stiff'] and ASCPI.result_cache.hits == len(texts)
+    finally:
+        ASCPI.result_cache = None
+    
+    e = ASCPI()
+    e.params = stiff
+    assert e.guardian.params is stiff and [e.process(t).signature for t in texts] == want['stiff']
+    print("[PASS] test_kernel_params")
+
+
 def run_all_tests():
     """Execute all tests"""
     print("=" * 50)
@@ -328,6 +792,17 @@ def run_all_tests():
         test_full_pipeline,
         test_convergence,
         test_determinism,
+        test_server_pipelining,
+        test_checkpoint_roundtrip,
+        test_engine_pool,
+        test_deadline_and_tolerance,
+        test_world_cache,
+        test_incremental_encoder,
+        test_rolling_trend,
+        test_metrics_endpoint,
+        test_result_cache,
+        test_result_cache_metrics,
+        test_kernel_params,
     ]
     
     passed = 0
@@ -0,0 +1,225 @@
+"""
+ASCPI ENGINE v10.0 - PROMETHEUS METRICS
+=======================================
+
+Engine internals as Prometheus metrics, served by a stdlib HTTP endpoint in
+the text exposition format (version 0.0.4).
+
+Counters:    kernel calls, governor decisions (allow / rebuild / block),
+             rebuild steps, invariant clamps by invariant (InvariantGuardian /
+             InvariantEnforcer), replayed requests, world / result cache
+             hits / misses
+Histograms:  steps to convergence, final C, request latency (seconds)
+
+Engine hook: the v8 / v9 / v10 ASCPI classes have a `metrics` class attribute
+(None). Set it and every engine in the process ends process() with one
+metrics.record(...) call; nothing is done per step, and with None the cost
+is a single test. A v10 request answered from the result cache ends in
+metrics.record_replay(...) instead: it counts as a request (decision, steps,
+C, latency) but adds no kernel calls, rebuild steps or clamps. Updates and
+scrapes share one lock.
+
+Usage:
+    metrics = EngineMetrics()
+    ASCPI.metrics = metrics
+    metrics.watch_world_cache(WORLD_CACHE, 'v10')
+    serve_metrics(metrics.registry, port=9464)     # GET /metrics
+"""
+
+import bisect
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# ==============================================================================
+# METRIC TYPES
+# ==============================================================================
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = '') -> str:
+    parts = [f'{k}="{_escape(str(v))}"' for k, v in zip(names, values)]
+    if extra: parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+def _escape(s: str) -> str:
+    return s.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _num(x: float) -> str:
+    if x == math.inf: return '+Inf'
+    if isinstance(x, int) or x.is_integer(): return str(int(x))
+    return repr(x)
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self.values: Dict[Tuple, float] = {}
+
+    def inc(self, labels: Tuple = (), n: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + n
+
+    def samples(self) -> Iterable[str]:
+        for lv, v in sorted(self.values.items()):
+            yield f"{self.name}{_labels(self.labels, lv)} {_num(v)}"
+
+class Histogram:
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, buckets: Iterable[float], labels: Tuple[str, ...] = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self.bounds = sorted(buckets)
+        self.values: Dict[Tuple, list] = {}   # labels -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, x: float, labels: Tuple = ()) -> None:
+        h = self.values.get(labels)
+        if h is None:
+            h = self.values[labels] = [0] * (len(self.bounds) + 1) + [0.0]
+        h[bisect.bisect_left(self.bounds, x)] += 1
+        h[-1] += x
+
+    def samples(self) -> Iterable[str]:
+        for lv, h in sorted(self.values.items()):
+            cum = 0
+            for le, n in zip(self.bounds + [math.inf], h):
+                cum += n
+                tag = 'le="%s"' % _num(le)
+                yield f"{self.name}_bucket{_labels(self.labels, lv, tag)} {cum}"
+            yield f"{self.name}_sum{_labels(self.labels, lv)} {_num(h[-1])}"
+            yield f"{self.name}_count{_labels(self.labels, lv)} {cum}"
+
+class Registry:
+    """Metrics plus scrape-time collectors, rendered as Prometheus text"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics: List = []
+        self.collectors: List[Callable[[], Iterable[Tuple[str, str, str, Tuple, Tuple, float]]]] = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def collect(self, fn: Callable) -> None:
+        """fn() -> [(name, kind, help, label names, label values, value)] read at scrape time"""
+        self.collectors.append(fn)
+
+    def render(self) -> str:
+        out = []
+        with self.lock:
+            for m in self.metrics:
+                out.append(f"# HELP {m.name} {m.help}\n# TYPE {m.name} {m.kind}")
+                out.extend(m.samples())
+            collected: Dict[str, list] = {}
+            for fn in self.collectors:
+                for name, kind, help, names, values, v in fn():
+                    collected.setdefault(name, [kind, help, []])[2].append((names, values, v))
+        for name, (kind, help, rows) in collected.items():
+            out.append(f"# HELP {name} {help}\n# TYPE {name} {kind}")
+            out.extend(f"{name}{_labels(names, values)} {_num(v)}" for names, values, v in rows)
+        return '\n'.join(out) + '\n'
+
+# ==============================================================================
+# ENGINE METRICS
+# ==============================================================================
+
+STEP_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34)
+COHERENCE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+class EngineMetrics:
+    """The standard engine metric set; engines call record() once per process()"""
+    def __init__(self, registry: Optional[Registry] = None):
+        r = self.registry = registry or Registry()
+        self.kernel_calls = r.add(Counter('ascpi_kernel_calls_total',
+                                          "Unified kernel applications", ('engine',)))
+        self.decisions = r.add(Counter('ascpi_governor_decisions_total',
+                                       "Governor decisions", ('engine', 'decision')))
+        self.rebuild_steps = r.add(Counter('ascpi_rebuild_steps_total',
+                                           "Evolution steps run by governor REBUILD", ('engine',)))
+        self.clamps = r.add(Counter('ascpi_invariant_clamps_total',
+                                    "Invariant clamps applied to the evolved field", ('engine', 'invariant')))
+        self.steps = r.add(Histogram('ascpi_convergence_steps',
+                                     "Evolution steps before convergence or cut-off", STEP_BUCKETS, ('engine',)))
+        self.coherence = r.add(Histogram('ascpi_final_coherence',
+                                         "Coherence C of the returned field", COHERENCE_BUCKETS, ('engine',)))
+        self.latency = r.add(Histogram('ascpi_request_duration_seconds',
+                                       "process() wall time", LATENCY_BUCKETS, ('engine',)))
+        self.replays = r.add(Counter('ascpi_replayed_requests_total',
+                                     "Requests answered from the result cache", ('engine',)))
+
+    def record(self, engine: str, latency: float, steps: int, coherence: float, decision: str,
+               rebuild_steps: int, kernel_calls: int, clamps: Dict[str, int]) -> None:
+        key = (engine,)
+        with self.registry.lock:
+            self.kernel_calls.inc(key, kernel_calls)
+            self.decisions.inc((engine, decision))
+            if rebuild_steps: self.rebuild_steps.inc(key, rebuild_steps)
+            for inv, n in clamps.items():
+                if n: self.clamps.inc((engine, inv), n)
+            self.steps.observe(steps, key)
+            self.coherence.observe(coherence, key)
+            self.latency.observe(latency, key)
+
+    def record_replay(self, engine: str, latency: float, steps: int, coherence: float, decision: str) -> None:
+        """A request replayed from the result cache: steps are those of the recorded run"""
+        key = (engine,)
+        with self.registry.lock:
+            self.replays.inc(key)
+            self.decisions.inc((engine, decision))
+            self.steps.observe(steps, key)
+            self.coherence.observe(coherence, key)
+            self.latency.observe(latency, key)
+
+    def watch_world_cache(self, cache, engine: str) -> None:
+        """Export a release's WORLD_CACHE hit / miss / entry counts at scrape time"""
+        def collect():
+            st = cache.stats()
+            return [('ascpi_world_cache_hits_total', 'counter', "World context cache hits",
+                     ('engine',), (engine,), st['hits']),
+                    ('ascpi_world_cache_misses_total', 'counter', "World context cache misses",
+                     ('engine',), (engine,), st['misses']),
+                    ('ascpi_world_cache_entries', 'gauge', "Cached world context fields",
+                     ('engine',), (engine,), st['entries'])]
+        self.registry.collect(collect)
+
+    def watch_result_cache(self, cache, engine: str) -> None:
+        """Export a release's RESULT_CACHE hit / miss / entry / byte counts at scrape time"""
+        def collect():
+            st = cache.stats()
+            return [('ascpi_result_cache_hits_total', 'counter', "Requests replayed from the result cache",
+                     ('engine',), (engine,), st['hits']),
+                    ('ascpi_result_cache_misses_total', 'counter', "Result cache misses",
+                     ('engine',), (engine,), st['misses']),
+                    ('ascpi_result_cache_entries', 'gauge', "Cached request transitions",
+                     ('engine',), (engine,), st['entries']),
+                    ('ascpi_result_cache_bytes', 'gauge', "Post-state bytes held by the result cache",
+                     ('engine',), (engine,), st['bytes'])]
+        self.registry.collect(collect)
+
+# ==============================================================================
+# HTTP ENDPOINT
+# ==============================================================================
+
+def serve_metrics(registry: Registry, host: str = '127.0.0.1', port: int = 9464) -> ThreadingHTTPServer:
+    """Serve GET /metrics from a daemon thread; returns the server (shutdown() to stop)"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='ascpi-metrics', daemon=True).start()
+    return server
@@ -0,0 +1,154 @@
+"""
+ASCPI ENGINE v10.0 - BOUNDED SESSION POOL
+==========================================
+
+One ASCPI per end-user session, with a bounded resident set.
+
+Residency:   LRU over sessions, capped by count and/or checkpoint bytes
+             (checked on every get(); the engine just handed out may grow
+             until the next call)
+Eviction:    least-recently-used engines spill to binary checkpoints on disk
+Rehydrate:   a spilled session is restored lazily on its next get(); a pool
+             opened on the spill_dir of an earlier one (after flush(), e.g.
+             across a worker restart) picks its checkpoints up the same way
+Stats:       hits / rehydrations / misses / evictions, hit_rate
+
+Not thread-safe: drive a pool from a single thread (the server does so from
+its single executor worker).
+
+Usage:
+    pool = EnginePool(max_engines=10000, max_bytes=256 << 20, spill_dir='/var/ascpi')
+    r = pool.get("user-42").process("...")
+"""
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from ascpi_engine_v10 import ASCPI, save_checkpoint, load_checkpoint, state_nbytes
+
+# ==============================================================================
+# POOL
+# ==============================================================================
+
+class EnginePool:
+    def __init__(self, max_engines: Optional[int] = 1024, max_bytes: Optional[int] = None,
+                 spill_dir: Optional[str] = None):
+        if max_engines is not None and max_engines < 1:
+            raise ValueError("max_engines must be >= 1")
+        self.max_engines = max_engines
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix='ascpi-pool-')
+        os.makedirs(self.spill_dir, exist_ok=True)
+        self._resident: 'OrderedDict[str, ASCPI]' = OrderedDict()
+        self._spilled: Dict[str, str] = {}
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._last: Optional[str] = None
+        self.stats = {'hits': 0, 'rehydrated': 0, 'misses': 0, 'evictions': 0, 'spilled_bytes': 0}
+
+    def _path(self, sid: str) -> str:
+        return os.path.join(self.spill_dir, hashlib.sha1(sid.encode()).hexdigest() + '.ckpt')
+
+    def _find_spilled(self, sid: str) -> Optional[str]:
+        """Checkpoint path of a spilled session: this pool's or one left in spill_dir"""
+        path = self._spilled.get(sid)
+        if path is None and os.path.exists(self._path(sid)):
+            path = self._path(sid)
+        return path
+
+    def _measure(self, sid: str) -> None:
+        engine = self._resident.get(sid)
+        if engine is None: return
+        n = state_nbytes(engine)
+        self._bytes += n - self._sizes.get(sid, 0)
+        self._sizes[sid] = n
+
+    def _forget(self, sid: str) -> Optional[ASCPI]:
+        self._bytes -= self._sizes.pop(sid, 0)
+        return self._resident.pop(sid, None)
+
+    def get(self, sid: str) -> ASCPI:
+        """Engine for a session: resident, rehydrated from disk, or new"""
+        if self._last is not None:
+            self._measure(self._last)   # previous engine has grown since it was handed out
+        engine = self._resident.get(sid)
+        if engine is not None:
+            self.stats['hits'] += 1
+            self._resident.move_to_end(sid)
+        else:
+            path = self._find_spilled(sid)
+            self._spilled.pop(sid, None)
+            if path is not None:
+                self.stats['rehydrated'] += 1
+                engine = load_checkpoint(path)
+                os.remove(path)
+            else:
+                self.stats['misses'] += 1
+                engine = ASCPI()
+            self._resident[sid] = engine
+        self._measure(sid)
+        self._last = sid
+        self._evict(keep=sid)
+        return engine
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        while len(self._resident) > 1 and self._over():
+            sid = next(iter(self._resident))
+            if sid == keep: break
+            self._spill(sid, self._forget(sid))
+
+    def _over(self) -> bool:
+        if self.max_engines is not None and len(self._resident) > self.max_engines:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _spill(self, sid: str, engine: ASCPI) -> None:
+        path = self._path(sid)
+        self.stats['spilled_bytes'] += save_checkpoint(engine, path)
+        self.stats['evictions'] += 1
+        self._spilled[sid] = path
+
+    def drop(self, sid: str) -> None:
+        """Forget a session entirely (resident or spilled)"""
+        self._forget(sid)
+        path = self._find_spilled(sid)
+        self._spilled.pop(sid, None)
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def flush(self) -> None:
+        """Spill every resident session (e.g. before worker restart)"""
+        while self._resident:
+            sid = next(iter(self._resident))
+            self._measure(sid)
+            self._spill(sid, self._forget(sid))
+
+    def resident_bytes(self) -> int:
+        """Checkpoint bytes of resident sessions as of their last get()"""
+        if self._last is not None:
+            self._measure(self._last)
+        return self._bytes
+
+    def __contains__(self, sid: str) -> bool:
+        return sid in self._resident or self._find_spilled(sid) is not None
+
+    def __len__(self) -> int:
+        """Sessions resident or spilled by this pool (checkpoints inherited from an earlier pool count once restored)"""
+        return len(self._resident) + len(self._spilled)
+
+    @property
+    def resident(self) -> int:
+        return len(self._resident)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of get() served without touching disk"""
+        n = self.stats['hits'] + self.stats['rehydrated'] + self.stats['misses']
+        return self.stats['hits'] / n if n else 0.0
+
+    def report(self) -> Dict:
+        return {**self.stats, 'resident': self.resident, 'spilled': len(self._spilled),
+                'resident_bytes': self.resident_bytes(), 'hit_rate': round(self.hit_rate, 4)}
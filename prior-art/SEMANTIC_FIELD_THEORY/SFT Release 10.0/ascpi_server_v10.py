@@ -0,0 +1,297 @@
+"""
+ASCPI ENGINE v10.0 - LOCAL ascpi:// SERVICE
+============================================
+
+asyncio server exposing ASCPI.process over TCP or a Unix socket.
+
+Protocol: line-delimited JSON, one request per line, pipelined.
+    -> {"id": 1, "text": "...", "code": "...", "world": {...}, "max_steps": 25}
+    <- {"id": 1, "ok": true, "result": {...}}
+
+    "max_steps" is clamped to the server's limit (--max-steps, default
+    MAX_STEPS), so one request cannot hold the worker thread indefinitely.
+
+    "deadline_ms": <ms> bounds the kernel loop (time spent queued is not
+    counted); "truncated": true in the result marks a best-so-far answer.
+    "tol": <float> enables adaptive termination (see StepControl).
+
+    "stateless": true runs the request on a fresh engine instead of the
+    connection session; identical stateless requests in flight are coalesced.
+    "session": "<id>" runs it on a named session from the server's EnginePool,
+    which survives reconnects and is spilled to disk under memory pressure.
+
+Sessions:    one ASCPI (own memory + awareness field) per connection, or named
+             sessions from a bounded EnginePool (LRU + spill-to-disk)
+Pipelining:  responses are written in request order per connection; at most
+             max_pipeline replies wait per connection, beyond that the server
+             stops reading the socket (backpressure on the client)
+Batching:    requests arriving within window_ms are handed to the single
+             worker thread as one job, saving a thread handoff per request;
+             the job still runs them one after another (no evolution work
+             is shared between requests)
+
+Results:     --result-cache N replays repeated requests (same session state,
+             same request) from a shared cache of N transitions instead of
+             re-running evolution (ResultCache)
+
+Metrics:     --metrics HOST:PORT serves Prometheus metrics for every engine
+             in the process at http://HOST:PORT/metrics (ascpi_metrics_v10)
+
+Usage:
+    python ascpi_server_v10.py --tcp 127.0.0.1:8765
+    python ascpi_server_v10.py --unix /tmp/ascpi.sock
+    python ascpi_server_v10.py --metrics 127.0.0.1:9464
+    python ascpi_server_v10.py --result-cache 4096
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+from ascpi_engine_v10 import ASCPI, Result, ResultCache, WORLD_CACHE
+from ascpi_metrics_v10 import EngineMetrics, serve_metrics
+from ascpi_pool_v10 import EnginePool
+
+Target = Union[ASCPI, str, None]   # connection engine, pooled session id, or stateless
+
+MAX_STEPS = 1000   # default server-side cap on a request's max_steps
+
+# ==============================================================================
+# WIRE
+# ==============================================================================
+
+def result_to_dict(r: Result) -> Dict:
+    return {'output': r.output.to_dict(), 'coherence': r.coherence, 'maat_score': r.maat_score,
+            'awareness': r.awareness, 'awareness_level': r.awareness_level,
+            'governor': r.governor, 'steps': r.steps, 'signature': r.signature,
+            'truncated': r.truncated}
+
+def parse_request(line: bytes, max_steps: int = MAX_STEPS) -> Tuple[object, Tuple, bool, Optional[str]]:
+    """(id, process() args, stateless, session); the requested max_steps is clamped to [0, max_steps]"""
+    req = json.loads(line)
+    if not isinstance(req, dict) or not isinstance(req.get('text'), str):
+        raise ValueError("request must be an object with a 'text' string")
+    session = req.get('session')
+    if session is not None and not isinstance(session, str):
+        raise ValueError("'session' must be a string")
+    deadline, tol = req.get('deadline_ms'), req.get('tol')
+    steps = min(max(int(req.get('max_steps', 25)), 0), max_steps)
+    args = (req['text'], req.get('code'), req.get('world'), steps,
+            None if deadline is None else float(deadline), None if tol is None else float(tol))
+    return req.get('id'), args, bool(req.get('stateless', False)), session
+
+# ==============================================================================
+# MICRO-BATCHER
+# ==============================================================================
+
+def _resolve_engine(target: Target, pool: Optional[EnginePool]) -> ASCPI:
+    if target is None: return ASCPI()
+    if isinstance(target, str):
+        if pool is None: raise ValueError("named sessions need a server EnginePool")
+        return pool.get(target)
+    return target
+
+def _run_batch(jobs: List[Tuple[Target, Tuple]], pool: Optional[EnginePool] = None) -> List[Tuple[bool, object]]:
+    out = []
+    for target, args in jobs:
+        try:
+            out.append((True, _resolve_engine(target, pool).process(*args)))
+        except Exception as e:
+            out.append((False, e))
+    return out
+
+class MicroBatcher:
+    """
+    Groups requests arriving within window_ms into one executor job.
+    A single worker thread keeps batches (and so each session) strictly ordered,
+    and is the only thread that touches the EnginePool.
+    """
+    def __init__(self, window_ms: float = 2.0, max_batch: int = 64, pool: Optional[EnginePool] = None):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.pool = pool
+        self._pending: List[Tuple[Target, Tuple, asyncio.Future]] = []
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ascpi')
+        self.stats = {'requests': 0, 'batches': 0, 'coalesced': 0}
+
+    def submit(self, engine: Target, args: Tuple) -> asyncio.Future:
+        """Queue a request; engine=None means stateless (fresh engine, coalescable),
+        a str names a pooled session"""
+        loop = asyncio.get_running_loop()
+        self.stats['requests'] += 1
+        if engine is None:
+            key = json.dumps(args, sort_keys=True)
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.stats['coalesced'] += 1
+                return fut
+            fut = loop.create_future()
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            fut = loop.create_future()
+        self._pending.append((engine, args, fut))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return fut
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch: return
+        self.stats['batches'] += 1
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(self._executor, _run_batch,
+                                   [(e, a) for e, a, _ in batch], self.pool)
+        job.add_done_callback(lambda j: self._resolve(batch, j))
+
+    @staticmethod
+    def _resolve(batch, job: asyncio.Future) -> None:
+        try:
+            results = job.result()
+        except Exception as e:
+            results = [(False, e)] * len(batch)
+        for (_, _, fut), (ok, value) in zip(batch, results):
+            if fut.done(): continue
+            if ok: fut.set_result(value)
+            else: fut.set_exception(value)
+
+    def close(self) -> None:
+        self._flush()
+        self._executor.shutdown(wait=False)
+
+# ==============================================================================
+# SERVER
+# ==============================================================================
+
+class ASCPIServer:
+    def __init__(self, window_ms: float = 2.0, max_batch: int = 64, pool: Optional[EnginePool] = None,
+                 max_pipeline: int = 1024, max_steps: int = MAX_STEPS):
+        self.pool = pool
+        self.max_pipeline = max_pipeline
+        self.max_steps = max_steps
+        self.batcher = MicroBatcher(window_ms, max_batch, pool)
+        self.sessions = 0
+        self._conns = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @staticmethod
+    async def _write_loop(writer: asyncio.StreamWriter, replies: asyncio.Queue) -> None:
+        broken = False
+        while True:
+            item = await replies.get()
+            if item is None: break
+            if broken: continue   # peer gone: keep draining so the reader never blocks on put()
+            rid, fut = item
+            try:
+                msg = {'id': rid, 'ok': True, 'result': result_to_dict(await asyncio.shield(fut))}
+            except Exception as e:
+                msg = {'id': rid, 'ok': False, 'error': str(e)}
+            try:
+                writer.write(json.dumps(msg).encode() + b'\n')
+                await writer.drain()
+            except ConnectionError:
+                broken = True
+                writer.close()   # the reader sees EOF and the handler winds down
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        engine: Optional[ASCPI] = None   # connection session, built on first use
+        self.sessions += 1
+        self._conns.add(asyncio.current_task())
+        replies: asyncio.Queue = asyncio.Queue(maxsize=self.max_pipeline)
+        writer_task = asyncio.create_task(self._write_loop(writer, replies))
+        shutdown = False
+        try:
+            while True:
+                line = await reader.readline()
+                if not line: break
+                if not line.strip(): continue
+                try:
+                    rid, args, stateless, session = parse_request(line, self.max_steps)
+                except Exception as e:
+                    fut = asyncio.get_running_loop().create_future()
+                    fut.set_exception(ValueError(f"bad request: {e}"))
+                    await replies.put((None, fut))
+                    continue
+                if stateless:
+                    target = None
+                elif session is not None:
+                    target = session
+                else:
+                    if engine is None: engine = ASCPI()
+                    target = engine
+                await replies.put((rid, self.batcher.submit(target, args)))
+        except asyncio.CancelledError:
+            shutdown = True   # server shutdown: treat as EOF
+        except ConnectionError:
+            pass              # peer reset: treat as EOF
+        finally:
+            self.sessions -= 1
+            self._conns.discard(asyncio.current_task())
+        try:
+            if shutdown and replies.full():
+                writer_task.cancel()   # peer is not reading: don't hold shutdown on it
+            else:
+                await replies.put(None)
+            await writer_task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765, path: Optional[str] = None) -> asyncio.AbstractServer:
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        conns = list(self._conns)
+        for task in conns:
+            task.cancel()
+        await asyncio.gather(*conns, return_exceptions=True)
+        self.batcher.close()
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, path: Optional[str] = None,
+                pool: Optional[EnginePool] = None, max_steps: int = MAX_STEPS) -> None:
+    server = ASCPIServer(pool=pool, max_steps=max_steps)
+    srv = await server.start(host, port, path)
+    async with srv:
+        await srv.serve_forever()
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="ascpi:// v10 service")
+    ap.add_argument('--tcp', default='127.0.0.1:8765', help="HOST:PORT")
+    ap.add_argument('--unix', default=None, help="Unix socket path (overrides --tcp)")
+    ap.add_argument('--max-sessions', type=int, default=1024, help="resident named sessions")
+    ap.add_argument('--max-session-bytes', type=int, default=None, help="resident checkpoint bytes")
+    ap.add_argument('--spill-dir', default=None, help="directory for evicted sessions")
+    ap.add_argument('--metrics', default=None, help="HOST:PORT for the Prometheus /metrics endpoint")
+    ap.add_argument('--max-steps', type=int, default=MAX_STEPS, help="cap on a request's max_steps")
+    ap.add_argument('--result-cache', type=int, default=0, help="cached request transitions (0: off)")
+    a = ap.parse_args()
+    host, _, port = a.tcp.rpartition(':')
+    pool = EnginePool(a.max_sessions, a.max_session_bytes, a.spill_dir)
+    if a.result_cache:
+        ASCPI.result_cache = ResultCache(a.result_cache)
+    if a.metrics:
+        ASCPI.metrics = EngineMetrics()
+        ASCPI.metrics.watch_world_cache(WORLD_CACHE, 'v10')
+        if ASCPI.result_cache: ASCPI.metrics.watch_result_cache(ASCPI.result_cache, 'v10')
+        m_host, _, m_port = a.metrics.rpartition(':')
+        serve_metrics(ASCPI.metrics.registry, m_host or '127.0.0.1', int(m_port))
+        print(f"metrics on http://{a.metrics}/metrics")
+    print(f"ascpi:// serving on {a.unix or a.tcp} (spill: {pool.spill_dir})")
+    asyncio.run(serve(host, int(port), a.unix, pool, a.max_steps))
@@ -15,8 +15,14 @@ import random
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Tuple
+from collections import deque
 import hashlib
 
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback in CandidateEngine
+    np = None
+
 # =============================================================================
 # CONSTANTS — Physical Parameters
 # =============================================================================
@@ -35,6 +41,9 @@ BETA_BLOOM = 0.05  # Coherence amplification
 GAMMA_IMPLODE = 0.15  # Implosion rate
 EPSILON = 1e-9  # Numerical stability
 
+# Retention
+TRACE_RETAIN = 1000  # Memory traces kept (ring)
+
 # =============================================================================
 # CORE DATA STRUCTURES
 # =============================================================================
@@ -104,8 +113,8 @@ class SemanticMemory:
         self.energy_total: float = 0.0
         self.kappa_mean: float = 1.0
         self.theta_mean: float = 0.0
-        self.theta_history: List[float] = []
-        self.traces: List[MemoryTrace] = []
+        self.theta_history: deque = deque(maxlen=100)
+        self.traces: deque = deque(maxlen=TRACE_RETAIN)
         self.step_count: int = 0
         
     def integrate(self, state: FieldState, glyphs: List[SemanticGlyph]):
@@ -124,8 +133,6 @@ class SemanticMemory:
         
         # Track theta history for variance
         self.theta_history.append(state.theta)
-        if len(self.theta_history) > 100:
-            self.theta_history = self.theta_history[-100:]
             
         # Calculate variance
         theta_var = self._circular_variance()
@@ -305,15 +312,35 @@ class CoherentPredictor:
         if not candidates:
             return None
             
-        scored = [(self.score(c), c) for c in candidates]
-        scored.sort(key=lambda x: x[0])
-        
-        best = scored[0][1]
+        best = min(candidates, key=self.score)  # argmin: first minimum wins
+        self.commit(best)
+        return best
+    
+    def score_batch(self, kappa, coherence: float, delta_phi):
+        """
+        Vectorized score over candidate columns (numpy arrays or lists).
+        Same formula as score(); C is shared by all evolved candidates.
+        """
+        trend1 = None
+        if len(self.history) >= 2:
+            prev = self.history[-1]
+            trend1 = prev.delta_phi - self.history[-2].delta_phi
+        if np is not None and isinstance(kappa, np.ndarray):
+            scores = kappa**2 - coherence
+            if trend1 is not None:
+                scores = scores + 0.5 * (trend1 * (delta_phi - prev.delta_phi) < 0)
+            return scores
+        scores = [k**2 - coherence for k in kappa]
+        if trend1 is not None:
+            scores = [s + 0.5 if trend1 * (dp - prev.delta_phi) < 0 else s
+                      for s, dp in zip(scores, delta_phi)]
+        return scores
+    
+    def commit(self, best: FieldState):
+        """Append the selected state to the bounded history window"""
         self.history.append(best)
         if len(self.history) > self.window:
             self.history = self.history[-self.window:]
-            
-        return best
     
     def check_invariants(self) -> Dict[str, bool]:
         """Verify prediction invariants"""
@@ -349,6 +376,93 @@ class CoherentPredictor:
         
         return results
 
+# =============================================================================
+# CANDIDATE ENGINE
+# =============================================================================
+
+class CandidateEngine:
+    """
+    Batched candidate generation for 𝓟:
+    
+    Φᵢ = 𝔽(Φ + εᵢ),  εᵢ ~ N(0, σ),  σ = (σ_ΔΦ, σ_κ, σ_θ),  i = 1…n
+    Φ* = argmin score({Φ, Φ₁ … Φₙ, 𝔽(Φ)})
+    
+    Perturbations are drawn as one (n, 3) block from an engine-local
+    generator (numpy.random.Generator when available, random.Random
+    otherwise), so seeded engines are reproducible and independent of
+    the global RNG. Memory terms κₘ, θₘ and C_M are read once per step;
+    𝔽 and the score are applied column-wise and only the winner is
+    materialized as a FieldState.
+    """
+    
+    SIGMA = (0.1, 0.05, 0.1)  # ΔΦ, κ, θ
+    
+    def __init__(self, evolution: TimeEvolutionOperator,
+                 n_candidates: int = 5, seed: Optional[int] = None):
+        self.evolution = evolution
+        self.n = n_candidates
+        self.rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+        
+    def perturbations(self):
+        """(ΔΦ, κ, θ) noise columns for n candidates, plus a zero row for 𝔽(Φ)"""
+        if np is not None:
+            eps = np.vstack([self.rng.normal(0.0, self.SIGMA, size=(self.n, 3)),
+                             np.zeros((1, 3))])
+            return eps[:, 0], eps[:, 1], eps[:, 2]
+        g = self.rng.gauss
+        sd, sk, st = self.SIGMA
+        rows = [(g(0, sd), g(0, sk), g(0, st)) for _ in range(self.n)]
+        rows.append((0.0, 0.0, 0.0))
+        return tuple(list(c) for c in zip(*rows))
+        
+    def evolve_batch(self, state: FieldState, memory: SemanticMemory, eps):
+        """Apply 𝔽 to Φ + ε for every row; returns (ΔΦ, κ, θ) columns"""
+        ev = self.evolution
+        km, tm = memory.kappa_mean, memory.theta_mean
+        c = state.coherence
+        implode = (1 - ev.gamma * c**2) if c > 0.7 else 1.0
+        e_dp, e_k, e_t = eps
+        if np is not None:
+            kappa = state.kappa + e_k
+            kappa = kappa - ev.alpha * (kappa - km)
+            delta_phi = (state.delta_phi + e_dp) * implode
+            theta = state.theta + e_t
+            delta = tm - theta
+            delta = np.where(delta > PI, delta - TAU, np.where(delta < -PI, delta + TAU, delta))
+            theta = (theta + K_DEFAULT * np.sin(delta)) % TAU
+            return delta_phi, kappa, theta
+        delta_phi = [(state.delta_phi + d) * implode for d in e_dp]
+        kappa = [ev.dampen_dissonance(state.kappa + d, km) for d in e_k]
+        theta = [ev.kuramoto_sync(state.theta + d, tm) % TAU for d in e_t]
+        return delta_phi, kappa, theta
+        
+    def step(self, state: FieldState, memory: SemanticMemory,
+             predictor: CoherentPredictor) -> FieldState:
+        """Perturb, evolve and score all candidates; commit and return the argmin"""
+        delta_phi, kappa, theta = self.evolve_batch(state, memory, self.perturbations())
+        coherence = memory.get_coherence()
+        scores = predictor.score_batch(kappa, coherence, delta_phi)
+        if np is not None:
+            i = int(np.argmin(scores))
+            best_score = float(scores[i])
+        else:
+            i = min(range(len(scores)), key=scores.__getitem__)
+            best_score = scores[i]
+        
+        if predictor.score(state) <= best_score:  # unevolved Φ ranks first on ties
+            best = state
+        else:
+            best = FieldState(
+                delta_phi=float(delta_phi[i]),
+                kappa=float(kappa[i]),
+                theta=float(theta[i]),
+                energy=self.evolution.amplify_coherence(state.energy, state.coherence),
+                coherence=coherence,
+                timestamp=state.timestamp + 1
+            )
+        predictor.commit(best)
+        return best
+
 # =============================================================================
 # GLYPH FIELD PROCESSOR
 # =============================================================================
@@ -417,10 +531,13 @@ class SFTSimulationEngine:
     
     def __init__(self, alpha: float = ALPHA_DECAY,
                  beta: float = BETA_BLOOM,
-                 gamma: float = GAMMA_IMPLODE):
+                 gamma: float = GAMMA_IMPLODE,
+                 n_candidates: int = 5,
+                 seed: Optional[int] = None):
         self.memory = SemanticMemory()
         self.evolution = TimeEvolutionOperator(alpha, beta, gamma)
         self.predictor = CoherentPredictor()
+        self.candidates = CandidateEngine(self.evolution, n_candidates, seed)
         self.processor = GlyphFieldProcessor()
         self.history: List[Dict] = []
         
@@ -444,23 +561,8 @@ class SFTSimulationEngine:
             # Integrate into memory
             self.memory.integrate(state, glyphs)
             
-            # Generate candidates (small perturbations)
-            candidates = [state]
-            for _ in range(5):
-                perturbed = FieldState(
-                    delta_phi=state.delta_phi + random.gauss(0, 0.1),
-                    kappa=state.kappa + random.gauss(0, 0.05),
-                    theta=state.theta + random.gauss(0, 0.1),
-                    energy=state.energy,
-                    coherence=state.coherence,
-                    timestamp=state.timestamp
-                )
-                candidates.append(self.evolution.evolve(perturbed, self.memory))
-            
-            # Predict best next state
-            evolved = self.evolution.evolve(state, self.memory)
-            candidates.append(evolved)
-            state = self.predictor.predict(candidates)
+            # Generate, evolve and score candidates; select argmin
+            state = self.candidates.step(state, self.memory, self.predictor)
             
         # Final invariant check
         invariants = self.predictor.check_invariants()
@@ -39,12 +39,22 @@ from __future__ import annotations
 import math
 import hashlib
 import json
+import os
 import re
+import sys
 import unicodedata
+from array import array
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Tuple, Callable
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import random
+from collections import deque
+
+try:
+    from ascpi.primitives import PhasorSum, RollingTrend
+except ImportError:   # source checkout run from the release directory: ascpi/ sits beside it
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ascpi.primitives import PhasorSum, RollingTrend
 
 # =============================================================================
 # CONSTANTS — Physical & Mathematical Parameters
@@ -67,6 +77,9 @@ COHERENCE_THRESHOLD: float = 0.80         # Target coherence (lowered for faster
 CONVERGENCE_EPSILON: float = 1e-4         # Convergence tolerance (relaxed)
 MAX_ITERATIONS: int = 1000                # Safety limit
 
+# Retention (per-step histories of long-running engines)
+HISTORY_RETAIN: int = 1000                # Points kept per history (ring)
+
 # Initialize reproducible RNG
 random.seed(SEED)
 
@@ -313,6 +326,146 @@ class SemanticGlyph:
         return f"G('{self.cluster}' θ={self.theta:.3f} κ={self.kappa:.3f})"
 
 
+class GlyphBuffer:
+    """
+    Struct-of-arrays glyph sequence: the data of text_to_glyphs() without a
+    SemanticGlyph (cluster string + codepoint list) per grapheme.
+    
+    Columns (array('d'); numpy.frombuffer views them without copying):
+        theta, kappa, delta_phi, energy
+    Clusters:
+        starts  — array('q'), offset of each cluster in the source text
+        ids     — array('l'), index into `symbols` (interned distinct clusters)
+    
+    Position-free properties are computed once per distinct cluster, so a
+    1M-glyph text costs ~50 bytes per glyph. buffer[i] and buffer[a:b] build
+    SemanticGlyph objects on demand.
+    """
+    
+    def __init__(self):
+        self.theta, self.kappa = array('d'), array('d')
+        self.delta_phi, self.energy = array('d'), array('d')
+        self.starts, self.ids = array('q'), array('l')
+        self.symbols: List[str] = []
+        self._props: List[Tuple[float, float, float, float]] = []   # phase base, κ, ΔΦ, N
+        self._index: Dict[str, int] = {}
+    
+    @classmethod
+    def from_text(cls, text: str) -> GlyphBuffer:
+        """Same values as text_to_glyphs(text), column-wise"""
+        buf = cls()
+        clusters = grapheme_split(text)
+        total = max(len(clusters), 1)
+        pos = 0
+        for i, cluster in enumerate(clusters):
+            sid = buf._intern(cluster)
+            base, kappa, delta_phi, energy = buf._props[sid]
+            pos = text.find(cluster, pos)   # only skipped whitespace lies between clusters
+            buf.starts.append(pos)
+            pos += len(cluster)
+            buf.ids.append(sid)
+            buf.theta.append((base + (i / total) * TAU) % TAU)
+            buf.kappa.append(kappa)
+            buf.delta_phi.append(delta_phi)
+            buf.energy.append(energy)
+        return buf
+    
+    def _intern(self, cluster: str) -> int:
+        sid = self._index.get(cluster)
+        if sid is None:
+            g = SemanticGlyph.from_cluster(cluster)
+            cp = g.codepoints[0]
+            sid = self._index[cluster] = len(self.symbols)
+            self.symbols.append(cluster)
+            self._props.append(((cp // 256) * PHI + (cp % 256) / 256, g.kappa, g.delta_phi, g.energy))
+        return sid
+    
+    def cluster(self, i: int) -> str:
+        return self.symbols[self.ids[i]]
+    
+    @property
+    def nbytes(self) -> int:
+        """Column and index memory (interned symbols excluded)"""
+        cols = (self.theta, self.kappa, self.delta_phi, self.energy, self.starts, self.ids)
+        return sum(len(c) * c.itemsize for c in cols)
+    
+    def __len__(self) -> int:
+        return len(self.theta)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        cluster = self.symbols[self.ids[i]]
+        return SemanticGlyph(cluster=cluster, codepoints=[ord(c) for c in cluster],
+                             theta=self.theta[i], kappa=self.kappa[i],
+                             delta_phi=self.delta_phi[i], energy=self.energy[i])
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class CurvatureRows:
+    """
+    K_ij of CurvatureMatrix.from_glyphs computed on access from a GlyphBuffer's
+    theta/kappa columns, instead of n² stored floats. values[i][j] is O(1);
+    iterating gives the same numbers as the dense list of lists.
+    """
+    
+    def __init__(self, theta: array, kappa: array, scales: Tuple[float, ...] = ()):
+        self.theta, self.kappa, self.scales = theta, kappa, scales
+    
+    def entry(self, i: int, j: int) -> float:
+        if i == j:
+            k_ij = self.kappa[i]
+        else:
+            phase_diff = abs(self.theta[i] - self.theta[j])
+            if phase_diff > PI:
+                phase_diff = TAU - phase_diff
+            correlation = math.cos(phase_diff)
+            k_ij = 0.5 * (self.kappa[i] + self.kappa[j]) * correlation / (1 + abs(i - j))
+        for s in self.scales:
+            k_ij *= s
+        return k_ij
+    
+    def scaled(self, scale: float) -> CurvatureRows:
+        """Every entry multiplied by scale (as [[v * scale for v in row] ...])"""
+        return CurvatureRows(self.theta, self.kappa, self.scales + (scale,))
+    
+    def to_list(self) -> List[List[float]]:
+        return [list(row) for row in self]
+    
+    def __len__(self) -> int:
+        return len(self.kappa)
+    
+    def __getitem__(self, i: int) -> CurvatureRow:
+        n = len(self.kappa)
+        if not -n <= i < n:
+            raise IndexError("curvature row index out of range")
+        return CurvatureRow(self, i % n)
+    
+    def __iter__(self):
+        return (CurvatureRow(self, i) for i in range(len(self)))
+
+
+class CurvatureRow:
+    """Row i of a CurvatureRows view"""
+    
+    def __init__(self, rows: CurvatureRows, i: int):
+        self.rows, self.i = rows, i
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __getitem__(self, j: int) -> float:
+        n = len(self.rows)
+        if not -n <= j < n:
+            raise IndexError("curvature column index out of range")
+        return self.rows.entry(self.i, j % n)
+    
+    def __iter__(self):
+        return (self.rows.entry(self.i, j) for j in range(len(self.rows)))
+
+
 @dataclass
 class CurvatureMatrix:
     """
@@ -330,29 +483,32 @@ class CurvatureMatrix:
     
     @classmethod
     def from_glyphs(cls, glyphs: List[SemanticGlyph]) -> CurvatureMatrix:
-        """Construct curvature matrix from glyph sequence"""
+        """Construct curvature matrix from glyph sequence (or GlyphBuffer: lazy K)"""
         n = len(glyphs)
         if n == 0:
             return cls(dimensions=1, values=[[0.0]], trace=0.0, determinant=0.0)
         
         # Build n×n curvature matrix
         # K_ij = correlation of curvatures weighted by phase difference
-        values = []
-        for i, gi in enumerate(glyphs):
-            row = []
-            for j, gj in enumerate(glyphs):
-                if i == j:
-                    # Diagonal: self-curvature
-                    k_ij = gi.kappa
-                else:
-                    # Off-diagonal: phase-weighted correlation
-                    phase_diff = abs(gi.theta - gj.theta)
-                    if phase_diff > PI:
-                        phase_diff = TAU - phase_diff
-                    correlation = math.cos(phase_diff)
-                    k_ij = 0.5 * (gi.kappa + gj.kappa) * correlation / (1 + abs(i - j))
-                row.append(k_ij)
-            values.append(row)
+        if isinstance(glyphs, GlyphBuffer):
+            values = CurvatureRows(glyphs.theta, glyphs.kappa)   # same K_ij, on access
+        else:
+            values = []
+            for i, gi in enumerate(glyphs):
+                row = []
+                for j, gj in enumerate(glyphs):
+                    if i == j:
+                        # Diagonal: self-curvature
+                        k_ij = gi.kappa
+                    else:
+                        # Off-diagonal: phase-weighted correlation
+                        phase_diff = abs(gi.theta - gj.theta)
+                        if phase_diff > PI:
+                            phase_diff = TAU - phase_diff
+                        correlation = math.cos(phase_diff)
+                        k_ij = 0.5 * (gi.kappa + gj.kappa) * correlation / (1 + abs(i - j))
+                    row.append(k_ij)
+                values.append(row)
         
         # Compute trace (mean curvature)
         trace = sum(values[i][i] for i in range(n)) / n
@@ -453,8 +609,8 @@ class MultiLayerMemory:
         
         # Tracking
         self.step_count = 0
-        self.energy_history: List[float] = []
-        self.coherence_history: List[float] = []
+        self.energy_history: deque = deque(maxlen=HISTORY_RETAIN)
+        self.coherence_history: deque = deque(maxlen=HISTORY_RETAIN)
     
     def integrate(self, state: FieldState, K: CurvatureMatrix) -> None:
         """
@@ -668,9 +824,10 @@ class ConsciousPredictor:
         self.ops = operators
         
         # Error memory (for self-correction)
-        self.error_history: List[float] = []
-        self.coherence_history: List[float] = []
-        self.divergence_history: List[float] = []
+        self.error_history: deque = deque(maxlen=HISTORY_RETAIN)
+        self.coherence_history: deque = deque(maxlen=100)
+        self.coherence_trend = RollingTrend(5)
+        self.divergence_history: deque = deque(maxlen=HISTORY_RETAIN)
         
         # Dynamic parameter bounds
         self.alpha_range = (0.01, 0.5)
@@ -697,13 +854,8 @@ class ConsciousPredictor:
         if len(self.coherence_history) < 3:
             return 0.0
         
-        # Check for coherence drops
-        recent = self.coherence_history[-5:]
-        if len(recent) < 2:
-            return 0.0
-        
-        # Divergence = negative coherence trend
-        trend = (recent[-1] - recent[0]) / len(recent)
+        # Divergence = negative coherence trend (last 5 steps)
+        trend = self.coherence_trend.trend()
         if trend < 0:
             return abs(trend)
         return 0.0
@@ -740,7 +892,10 @@ class ConsciousPredictor:
         scale = target_trace / current_trace
         scale = max(0.5, min(2.0, scale))  # Bound scaling
         
-        new_values = [[v * scale for v in row] for row in K.values]
+        if isinstance(K.values, CurvatureRows):
+            new_values = K.values.scaled(scale)
+        else:
+            new_values = [[v * scale for v in row] for row in K.values]
         return CurvatureMatrix(
             dimensions=K.dimensions,
             values=new_values,
@@ -786,8 +941,7 @@ class ConsciousPredictor:
         
         # SELF-AWARENESS: Check for divergence and correct
         self.coherence_history.append(new_state.coherence)
-        if len(self.coherence_history) > 100:
-            self.coherence_history = self.coherence_history[-100:]
+        self.coherence_trend.push(new_state.coherence)
         
         divergence = self.detect_divergence()
         self.divergence_history.append(divergence)
@@ -853,28 +1007,56 @@ class UniversalGlyphProcessor:
         
         return glyphs
     
+    @staticmethod
+    def text_to_buffer(text: str) -> GlyphBuffer:
+        """text_to_glyphs() as a struct-of-arrays GlyphBuffer"""
+        return GlyphBuffer.from_text(text)
+    
+    @staticmethod
+    def glyph_terms(cluster: str) -> Tuple[float, float, float, float]:
+        """
+        Position-free terms of one cluster: (phase base, 1/κ, ΔΦ, N).
+        The glyph phase is θ = (phase base + (i/n)·τ) mod τ.
+        """
+        g = SemanticGlyph.from_cluster(cluster)
+        cp = g.codepoints[0]
+        base = (cp // 256) * PHI + (cp % 256) / 256
+        return base, 1 / max(g.kappa, EPSILON), g.delta_phi, g.energy
+    
+    @staticmethod
+    def text_terms(text: str) -> List[Tuple[float, float, float, float]]:
+        """glyph_terms of every cluster of text, in order"""
+        return [UniversalGlyphProcessor.glyph_terms(c) for c in grapheme_split(text)]
+    
     @staticmethod
     def glyphs_to_field(glyphs: List[SemanticGlyph]) -> FieldState:
-        """Compute aggregate field state from glyphs"""
+        """Compute aggregate field state from glyphs (list or GlyphBuffer)"""
         if not glyphs:
             return FieldState()
         
         n = len(glyphs)
+        if isinstance(glyphs, GlyphBuffer):
+            deltas, kappas, thetas, energies = glyphs.delta_phi, glyphs.kappa, glyphs.theta, glyphs.energy
+        else:
+            deltas = [g.delta_phi for g in glyphs]
+            kappas = [g.kappa for g in glyphs]
+            thetas = [g.theta for g in glyphs]
+            energies = [g.energy for g in glyphs]
         
         # Aggregate ΔΦ: mean tension
-        delta_phi = sum(g.delta_phi for g in glyphs) / n
+        delta_phi = sum(deltas) / n
         
         # Aggregate κ: harmonic mean (emphasizes low curvature)
-        kappa_inv_sum = sum(1 / max(g.kappa, EPSILON) for g in glyphs)
+        kappa_inv_sum = sum(1 / max(k, EPSILON) for k in kappas)
         kappa = n / kappa_inv_sum
         
         # Aggregate θ: circular mean
-        sin_sum = sum(math.sin(g.theta) for g in glyphs)
-        cos_sum = sum(math.cos(g.theta) for g in glyphs)
+        sin_sum = sum(math.sin(t) for t in thetas)
+        cos_sum = sum(math.cos(t) for t in thetas)
         theta = math.atan2(sin_sum, cos_sum) % TAU
         
         # Total energy
-        energy = sum(g.energy for g in glyphs)
+        energy = sum(energies)
         
         # Initial coherence: phase alignment (resultant length)
         r = math.sqrt(sin_sum**2 + cos_sum**2) / n
@@ -891,7 +1073,7 @@ class UniversalGlyphProcessor:
     
     @staticmethod
     def build_curvature_matrix(glyphs: List[SemanticGlyph]) -> CurvatureMatrix:
-        """Build curvature matrix from glyphs"""
+        """Build curvature matrix from glyphs (lazy K for a GlyphBuffer)"""
         return CurvatureMatrix.from_glyphs(glyphs)
     
     @staticmethod
@@ -901,6 +1083,78 @@ class UniversalGlyphProcessor:
         return hashlib.sha256(data.encode()).hexdigest()[:8]
 
 
+# =============================================================================
+# INCREMENTAL GLYPH FIELD (append-only streams)
+# =============================================================================
+
+class IncrementalGlyphField:
+    """
+    glyphs_to_field(text_to_glyphs(text)) for append-only text streams.
+    
+    An append costs what the new text costs: ΔΦ, 1/κ and N sums are kept
+    running, the positional phase (i/n)·τ goes through PhasorSum. The last
+    grapheme stays pending because appended marks/ZWJ/RI can extend it.
+    
+        stream = IncrementalGlyphField()
+        state = stream.sync(transcript)    # encodes only the unseen suffix
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        self._delta_phi = self._kappa_inv = self._energy = 0.0
+        self._phasors = PhasorSum(TAU, lambda i, n: (i / max(n, 1)) * TAU)
+        self._pending = ""                  # raw text from the last grapheme on
+        self._last: Optional[Tuple[float, float, float, float]] = None
+        self._text: Optional[str] = None
+    
+    @property
+    def n(self) -> int:
+        return self._phasors.n + (self._last is not None)
+    
+    def append(self, text: str) -> None:
+        self._text = None   # direct appends end sync() prefix tracking
+        raw = self._pending + text
+        clusters = grapheme_split(raw)
+        if not clusters:
+            self._pending, self._last = "", None
+            return
+        for cluster in clusters[:-1]:
+            base, kappa_inv, delta_phi, energy = UniversalGlyphProcessor.glyph_terms(cluster)
+            self._phasors.add(base)
+            self._delta_phi += delta_phi
+            self._kappa_inv += kappa_inv
+            self._energy += energy
+        self._pending = raw[raw.rfind(clusters[-1]):]
+        self._last = UniversalGlyphProcessor.glyph_terms(clusters[-1])
+    
+    def sync(self, text: str) -> FieldState:
+        """Field of `text`, reusing state if it extends the previously synced text"""
+        if self._text is not None and text.startswith(self._text):
+            self.append(text[len(self._text):])
+        else:
+            self.reset()
+            self.append(text)
+        self._text = text
+        return self.field()
+    
+    def field(self) -> FieldState:
+        if self._last is None:
+            return FieldState()
+        n = self.n
+        base, kappa_inv, delta_phi, energy = self._last
+        sin_sum, cos_sum = self._phasors.sums((base,))
+        return FieldState(
+            delta_phi=(self._delta_phi + delta_phi) / n,
+            kappa=n / (self._kappa_inv + kappa_inv),
+            theta=math.atan2(sin_sum, cos_sum) % TAU,
+            energy=self._energy + energy,
+            coherence=math.sqrt(sin_sum**2 + cos_sum**2) / n,
+            timestamp=0
+        )
+
+
 # =============================================================================
 # MA'AT FUNCTIONAL MINIMIZATION
 # =============================================================================
@@ -1007,7 +1261,7 @@ class ASCPiEngine:
         
         # State tracking
         self.trajectory: List[Dict] = []
-        self.glyphs: List[SemanticGlyph] = []
+        self.glyphs: GlyphBuffer = GlyphBuffer()
         self.current_state: Optional[FieldState] = None
         self.K: Optional[CurvatureMatrix] = None
         
@@ -1024,7 +1278,7 @@ class ASCPiEngine:
         memory state, invariant checks, and operator statistics.
         """
         # STAGE 1: Glyph extraction
-        self.glyphs = self.processor.text_to_glyphs(text)
+        self.glyphs = self.processor.text_to_buffer(text)
         
         if not self.glyphs:
             return self._empty_result(text)
@@ -1037,11 +1291,42 @@ class ASCPiEngine:
         
         # STAGE 4: Field evolution
         self.trajectory = []
+        self._evolve(steps)
         
-        for step in range(steps):
+        # STAGE 5-6: Verify invariants and compile result
+        return self._compile_result(text)
+    
+    def resume(self, text: str, steps: int = 5,
+               operators: Optional[FieldOperators] = None) -> Dict:
+        """
+        Continue evolving the current field without re-encoding.
+        
+        Reuses the cached glyphs and curvature matrix from the last
+        process() call. `operators` apply to this call only; the engine's
+        own operators keep their parameters (their counts absorb the run).
+        """
+        if self.current_state is None or self.K is None:
+            return self._empty_result(text)
+        
+        shared = self.predictor.ops
+        if operators is not None:
+            self.predictor.ops = operators
+        try:
+            self._evolve(steps)
+        finally:
+            if operators is not None:
+                self.predictor.ops = shared
+                for name in ("D_count", "A_count", "I_count", "M_count"):
+                    setattr(shared, name, getattr(shared, name) + getattr(operators, name))
+        
+        return self._compile_result(text)
+    
+    def _evolve(self, steps: int) -> None:
+        """Run up to `steps` evolution steps from the current state"""
+        for _ in range(steps):
             # Record current state
             self.trajectory.append({
-                "step": step,
+                "step": len(self.trajectory),
                 "state": self.current_state.to_dict(),
                 "memory": self.memory.export(),
                 "s8": self.processor.s8_hash(self.current_state),
@@ -1059,11 +1344,11 @@ class ASCPiEngine:
             # Check for early convergence
             if self._check_convergence():
                 break
-        
-        # STAGE 5: Verify invariants
+    
+    def _compile_result(self, text: str) -> Dict:
+        """Verify invariants and compile the result dictionary"""
         invariants = self._verify_invariants()
         
-        # STAGE 6: Compile result
         return {
             "input_text": text,
             "glyph_count": len(self.glyphs),
@@ -1173,7 +1458,7 @@ class ASCPiEngine:
         self.operators = FieldOperators(self.initial_alpha, self.initial_beta, self.initial_gamma)
         self.predictor = ConsciousPredictor(self.operators)
         self.trajectory = []
-        self.glyphs = []
+        self.glyphs = GlyphBuffer()
         self.current_state = None
         self.K = None
 
@@ -1411,9 +1696,93 @@ def run_v4_tests() -> Dict:
     for inv_name, inv_pass in invariants.items():
         if inv_name != "all_pass":
             log_test(f"maat_{inv_name}", inv_pass)
-    
+
     print()
-    
+
+    # -------------------------------------------------------------------------
+    # TEST 8: Incremental Glyph Field
+    # -------------------------------------------------------------------------
+    print("--- Test 8: Incremental Glyph Field ---")
+
+    def as_tuple(s: FieldState) -> Tuple[float, ...]:
+        return (s.delta_phi, s.kappa, s.theta, s.energy, s.coherence)
+
+    stream = IncrementalGlyphField()
+    transcript = ""
+    exact = True
+    for part in ["Hello ", "e", "́ 👨", "‍👩", "‍👧 🇪", "🇬 مرحبا"]:
+        transcript += part
+        direct = UniversalGlyphProcessor.glyphs_to_field(UniversalGlyphProcessor.text_to_glyphs(transcript))
+        exact &= as_tuple(stream.sync(transcript)) == as_tuple(direct)
+    log_test("incremental_exact_short", exact, f"{stream.n} glyphs")
+
+    long_text = "".join(f"Turn {i}: field κ={i * i % 97} ✓ " for i in range(400))
+    stream.sync(long_text[:3000])
+    got = as_tuple(stream.sync(long_text))
+    want = as_tuple(UniversalGlyphProcessor.glyphs_to_field(UniversalGlyphProcessor.text_to_glyphs(long_text)))
+    err = max(abs(a - b) for a, b in zip(got, want))
+    log_test("incremental_long_append", err < 1e-9, f"max error {err:.1e}")
+
+    print()
+
+    # -------------------------------------------------------------------------
+    # TEST 9: Glyph Buffer (struct-of-arrays)
+    # -------------------------------------------------------------------------
+    print("--- Test 9: Glyph Buffer ---")
+
+    text = "Glyph buffer 你好 👨‍👩‍👧 🇪🇬 é " * 3
+    glyphs = UniversalGlyphProcessor.text_to_glyphs(text)
+    buf = UniversalGlyphProcessor.text_to_buffer(text)
+    same_glyphs = buf[:] == glyphs and all(
+        text[buf.starts[i]:].startswith(buf.cluster(i)) for i in range(len(buf)))
+    log_test("buffer_glyphs", same_glyphs, f"{len(buf)} glyphs, {len(buf.symbols)} interned")
+    log_test("buffer_field",
+             UniversalGlyphProcessor.glyphs_to_field(buf) == UniversalGlyphProcessor.glyphs_to_field(glyphs))
+
+    dense = CurvatureMatrix.from_glyphs(glyphs)
+    lazy = CurvatureMatrix.from_glyphs(buf)
+    realigned = engine.predictor.realign_curvature_matrix(lazy, 0.5)
+    log_test("buffer_lazy_curvature",
+             lazy.values.to_list() == dense.values and
+             (lazy.trace, lazy.determinant, lazy.laplacian()) == (dense.trace, dense.determinant, dense.laplacian()) and
+             realigned.values.to_list() == engine.predictor.realign_curvature_matrix(dense, 0.5).values,
+             f"{buf.nbytes} bytes vs {len(glyphs)}² dense entries")
+
+    print()
+
+    # -------------------------------------------------------------------------
+    # TEST 10: Rolling Trend
+    # -------------------------------------------------------------------------
+    print("--- Test 10: Rolling Trend ---")
+
+    roll, seen, worst = RollingTrend(5), [], 0.0
+    for i in range(40):
+        y = math.cos(i * 1.3) + 0.02 * i
+        roll.push(y)
+        seen.append(y)
+        w = seen[-5:]
+        mu = sum(w) / len(w)
+        worst = max(worst, abs(roll.mean() - mu),
+                    abs(roll.variance() - sum((v - mu) ** 2 for v in w) / len(w)))
+    log_test("rolling_window", list(roll) == seen[-5:] and roll.trend() == (seen[-1] - seen[-5]) / 5)
+    log_test("rolling_moments", worst < 1e-9, f"max error {worst:.1e}")
+
+    predictor = ConsciousPredictor(engine.predictor.ops)
+    for c in (0.9, 0.85, 0.8, 0.7, 0.6, 0.5):
+        predictor.coherence_history.append(c)
+        predictor.coherence_trend.push(c)
+    log_test("rolling_divergence", abs(predictor.detect_divergence() - (0.85 - 0.5) / 5) < 1e-12)
+
+    memory = MultiLayerMemory()
+    engine.process("Retention probe", steps=1)
+    for _ in range(HISTORY_RETAIN + 10):
+        memory.integrate(engine.current_state, engine.K)
+    log_test("history_retention", len(memory.coherence_history) == HISTORY_RETAIN
+             and len(memory.energy_history) == HISTORY_RETAIN and memory.step_count == HISTORY_RETAIN + 10,
+             f"kept {len(memory.coherence_history)}/{memory.step_count}")
+
+    print()
+
     # -------------------------------------------------------------------------
     # SUMMARY
     # -------------------------------------------------------------------------
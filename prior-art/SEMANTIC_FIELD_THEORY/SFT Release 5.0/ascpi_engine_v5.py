@@ -33,8 +33,10 @@
 from __future__ import annotations
 import math
 import hashlib
+import hmac
 import json
 import random
+import struct
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Tuple, Set, Callable, Any
@@ -44,7 +46,7 @@ import time
 
 # Import v4.0 core components
 from ascpi_engine_v4 import (
-    PHI, PI, TAU, EPSILON, SEED,
+    PHI, PI, TAU, EPSILON, SEED, HISTORY_RETAIN,
     FieldState, SemanticGlyph, CurvatureMatrix,
     MultiLayerMemory, FieldOperators, ConsciousPredictor,
     UniversalGlyphProcessor, MaatFunctional, ASCPiEngine,
@@ -59,12 +61,20 @@ from ascpi_engine_v4 import (
 INCOHERENCE_THRESHOLD: float = 0.3      # World incoherence alarm level
 RESONANCE_COUPLING: float = 0.2          # Inter-agent coupling strength
 GOVERNOR_STRICTNESS: float = 0.7         # Ma'at Governor threshold
+REBUILD_STEPS: int = 5                   # Extra kernel steps on REBUILD
 
 # Temporal constants
 TEMPORAL_WINDOW: int = 100               # Phase history window
 PATTERN_MIN_LENGTH: int = 3              # Minimum pattern length
 CYCLE_DETECTION_THRESHOLD: float = 0.8   # Pattern similarity threshold
 
+# Retention (per-call records of long-running engines)
+DOMAIN_WINDOW: int = 100                 # Recent source fields per world domain
+RETAIN_JUDGMENTS: int = 1000             # Governor judgments kept (ring)
+RETAIN_SUPERPOSITIONS: int = 64          # QCB superpositions kept (ring)
+RETAIN_OUTPUTS: int = 100                # Engine results kept (ring)
+RETAIN_PATTERNS: int = 200               # Temporal patterns kept (ring)
+
 # Protocol identifiers
 PROTOCOL_FIELD = "field://"
 PROTOCOL_MAAT = "maat://"
@@ -72,6 +82,21 @@ PROTOCOL_COH = "coh://"
 PROTOCOL_DPHI = "ΔΦ://"
 PROTOCOL_ASCPI = "ascpi://"
 
+# Binary wire format
+WIRE_MAGIC: bytes = b"A5"
+WIRE_VERSION: int = 2                   # 2: 16-byte signature over header + body
+WIRE_BATCH_MAGIC: bytes = b"A5B1"
+WIRE_PROTOCOL_IDS = {
+    PROTOCOL_FIELD: 1, PROTOCOL_MAAT: 2, PROTOCOL_COH: 3,
+    PROTOCOL_DPHI: 4, PROTOCOL_ASCPI: 5
+}
+WIRE_FIELD_KEYS = ("delta_phi", "kappa", "theta", "energy", "coherence")
+WIRE_HAS_EXTENSION = 1 << 5             # Flag bit after the 5 field-presence bits
+WIRE_SIG_BYTES: int = 16                # Keyed BLAKE2b tag length
+WIRE_MIN_KEY_BYTES: int = 16            # Shortest accepted signing key
+DEFAULT_PROTOCOL_KEY: bytes = b"ascpi-v5-public-protocol-key"   # Published: reproducible, authenticates nothing
+PROTOCOL_LOG_SIZE: int = 1000           # Bounded packet log
+
 # =============================================================================
 # ENUMS AND TYPES
 # =============================================================================
@@ -142,7 +167,7 @@ class WorldCurvatureMatrix:
     
     def __init__(self):
         self.sources: Dict[str, FieldSource] = {}
-        self.domain_fields: Dict[FieldDomain, List[FieldState]] = {d: [] for d in FieldDomain}
+        self.domain_fields: Dict[FieldDomain, deque] = {d: deque(maxlen=DOMAIN_WINDOW) for d in FieldDomain}
         self.incoherence_map: List[IncoherencePoint] = []
         self.global_kappa: float = 1.0
         self.global_theta: float = 0.0
@@ -173,7 +198,7 @@ class WorldCurvatureMatrix:
     
     def compute_domain_coherence(self, domain: FieldDomain) -> Tuple[float, float]:
         """Compute coherence and incoherence within a domain"""
-        states = self.domain_fields[domain]
+        states = list(self.domain_fields[domain])
         if len(states) < 2:
             return 1.0, 0.0
         
@@ -344,7 +369,7 @@ class FieldAgent:
         self.engine = ASCPiEngine()
         self.local_state: Optional[FieldState] = None
         self.received_packets: deque = deque(maxlen=100)
-        self.coherence_history: List[float] = []
+        self.coherence_history: deque = deque(maxlen=HISTORY_RETAIN)
         self.peers: Set[str] = set()
         
     def process_input(self, text: str) -> Dict:
@@ -582,7 +607,7 @@ class ExtendedFieldMemory:
         
         # Tracking
         self.step_count = 0
-        self.coherence_history: List[float] = []
+        self.coherence_history: deque = deque(maxlen=HISTORY_RETAIN)
         
     def integrate_intuition(self, pattern: Dict) -> None:
         """Integrate pattern into pre-memory M₋₁"""
@@ -593,6 +618,8 @@ class ExtendedFieldMemory:
         # Extract intuitive seeds
         if "theta" in pattern:
             self.M_neg1["seeds"].append(pattern["theta"])
+            if len(self.M_neg1["seeds"]) > 50:
+                self.M_neg1["seeds"] = self.M_neg1["seeds"][-50:]
     
     def integrate(self, state: FieldState, world_context: Optional[Dict] = None) -> None:
         """Full memory integration across all layers"""
@@ -741,7 +768,10 @@ class TemporalPhaseLogic:
         self.phase_history: deque = deque(maxlen=window_size)
         self.kappa_history: deque = deque(maxlen=window_size)
         self.coherence_history: deque = deque(maxlen=window_size)
-        self.detected_patterns: List[TemporalPattern] = []
+        self.detected_patterns: deque = deque(maxlen=RETAIN_PATTERNS)   # most recent
+        self.patterns_total: int = 0
+        self.best_cycle: Optional[TemporalPattern] = None   # strongest cycle ever seen
+        self.drift_seen: bool = False
         self.step = 0
         
     def record(self, state: FieldState) -> None:
@@ -788,7 +818,8 @@ class TemporalPhaseLogic:
                     )
                     cycles.append(pattern)
         
-        self.detected_patterns.extend(cycles)
+        for pattern in cycles:
+            self._keep(pattern)
         return cycles
     
     def detect_drift(self, threshold: float = 0.1) -> Optional[TemporalPattern]:
@@ -823,11 +854,20 @@ class TemporalPhaseLogic:
                 confidence=min(1.0, abs(mean_drift) / 0.5),
                 signature=hashlib.md5(f"drift_{mean_drift:.4f}".encode()).hexdigest()[:8]
             )
-            self.detected_patterns.append(pattern)
+            self._keep(pattern)
             return pattern
         
         return None
     
+    def _keep(self, pattern: TemporalPattern) -> None:
+        """Ring the pattern; fold it into the whole-run summaries"""
+        self.detected_patterns.append(pattern)
+        self.patterns_total += 1
+        if pattern.pattern_type == "drift":
+            self.drift_seen = True
+        elif self.best_cycle is None or pattern.confidence > self.best_cycle.confidence:
+            self.best_cycle = pattern
+    
     def predict_phase(self, horizon: int = 5) -> List[float]:
         """Predict future phases based on detected patterns"""
         if not self.phase_history:
@@ -837,10 +877,8 @@ class TemporalPhaseLogic:
         predictions = []
         
         # Use strongest cycle if detected
-        cycles = [p for p in self.detected_patterns if p.pattern_type == "cycle"]
-        if cycles:
-            best_cycle = max(cycles, key=lambda x: x.confidence)
-            period = best_cycle.period
+        if self.best_cycle is not None:
+            period = self.best_cycle.period
             
             for h in range(1, horizon + 1):
                 idx = (len(self.phase_history) + h) % period
@@ -862,9 +900,9 @@ class TemporalPhaseLogic:
     def export(self) -> Dict:
         return {
             "history_length": len(self.phase_history),
-            "patterns_detected": len(self.detected_patterns),
+            "patterns_detected": self.patterns_total,
             "cycles": [p.period for p in self.detected_patterns if p.pattern_type == "cycle"],
-            "has_drift": any(p.pattern_type == "drift" for p in self.detected_patterns)
+            "has_drift": self.drift_seen
         }
 
 
@@ -882,6 +920,103 @@ class GovernorJudgment:
     timestamp: float
     adjustments: Optional[Dict] = None
 
+class StreamingManipulationDetector:
+    """
+    Online field-poisoning detector over a sliding window of states.
+    
+    Scores exactly what MaatGovernor.detect_manipulation scores, but every
+    push and every score is O(1):
+    - Phase discontinuity against the last state
+    - Max |ΔC| via a monotonic deque of consecutive coherence jumps
+    - Energy mean/variance via add/remove Welford updates
+    """
+    
+    def __init__(self, window: int = 100):
+        self.window = window
+        self.states: deque = deque()
+        self.jumps: deque = deque()          # (seq, |ΔC|), decreasing
+        self.seq: int = 0
+        self.energy_mean: float = 0.0
+        self.energy_m2: float = 0.0
+    
+    @property
+    def count(self) -> int:
+        return len(self.states)
+    
+    @property
+    def energy_variance(self) -> float:
+        return self.energy_m2 / self.count if self.count else 0.0
+    
+    @property
+    def max_coherence_jump(self) -> float:
+        return self.jumps[0][1] if self.jumps else 0.0
+    
+    def push(self, state: FieldState) -> None:
+        """Add a state to the window, evicting the oldest if full"""
+        if self.states:
+            jump = abs(state.coherence - self.states[-1].coherence)
+            while self.jumps and self.jumps[-1][1] <= jump:
+                self.jumps.pop()
+            self.jumps.append((self.seq, jump))
+        
+        self.states.append(state)
+        self.seq += 1
+        n = len(self.states)
+        d = state.energy - self.energy_mean
+        self.energy_mean += d / n
+        self.energy_m2 += d * (state.energy - self.energy_mean)
+        
+        if n > self.window:
+            old = self.states.popleft()
+            n -= 1
+            d = old.energy - self.energy_mean
+            self.energy_mean -= d / n
+            self.energy_m2 = max(0.0, self.energy_m2 - d * (old.energy - self.energy_mean))
+        
+        # Jump i lies between states i-1 and i; drop those leaving the window
+        first = self.seq - len(self.states) + 1
+        while self.jumps and self.jumps[0][0] < first:
+            self.jumps.popleft()
+    
+    def score(self, state: FieldState) -> float:
+        """Manipulation score of `state` against the current window"""
+        if self.count < 3:
+            return 0.0
+        
+        indicators = []
+        
+        phase_diff = abs(state.theta - self.states[-1].theta)
+        if phase_diff > PI:
+            phase_diff = TAU - phase_diff
+        if phase_diff > PI / 2:
+            indicators.append(phase_diff / PI)
+        
+        max_jump = self.max_coherence_jump
+        if max_jump > 0.3:
+            indicators.append(max_jump)
+        
+        if abs(state.energy - self.energy_mean) > self.energy_mean * 0.5:
+            indicators.append(0.5)
+        
+        return min(1.0, sum(indicators) / max(len(indicators), 1))
+    
+    @classmethod
+    def audit(cls, history: List[FieldState], window: int = 100) -> List[float]:
+        """
+        Offline audit: score every stored state against its preceding window.
+        
+        One pass over the history, O(N) instead of O(N·window).
+        """
+        detector = cls(window)
+        scores = []
+        for state in history:
+            scores.append(detector.score(state))
+            detector.push(state)
+        return scores
+    
+    def reset(self) -> None:
+        self.__init__(self.window)
+
 class MaatGovernor:
     """
     Ma'at Governor (MG) — Meta-level ethical alignment
@@ -902,10 +1037,12 @@ class MaatGovernor:
     
     def __init__(self, strictness: float = GOVERNOR_STRICTNESS):
         self.strictness = strictness
-        self.judgments: List[GovernorJudgment] = []
+        self.judgments: deque = deque(maxlen=RETAIN_JUDGMENTS)   # most recent
+        self.total_judgments: int = 0
         self.blocked_patterns: Set[str] = set()
         self.allowed_patterns: Set[str] = set()
         self.current_maat: float = 0.5
+        self.detector = StreamingManipulationDetector()
         
         # Detection thresholds
         self.manipulation_threshold = 0.7
@@ -990,6 +1127,10 @@ class MaatGovernor:
         
         return min(1.0, sum(indicators) / max(len(indicators), 1))
     
+    def observe(self, state: FieldState) -> None:
+        """Feed a state into the streaming manipulation detector"""
+        self.detector.push(state)
+    
     def judge(self,
               input_state: FieldState,
               output_state: FieldState,
@@ -997,6 +1138,9 @@ class MaatGovernor:
               history: Optional[List[FieldState]] = None) -> GovernorJudgment:
         """
         Make a judgment about whether to allow an output.
+        
+        With an explicit `history` the manipulation check scans it; without
+        one the streaming detector fed through observe() is used.
         """
         world_state = None
         if world_context and "global_state" in world_context:
@@ -1015,6 +1159,8 @@ class MaatGovernor:
         manipulation_score = 0.0
         if history:
             manipulation_score = self.detect_manipulation(output_state, history)
+        elif self.detector.count:
+            manipulation_score = self.detector.score(output_state)
         
         # Make decision
         if manipulation_score > self.manipulation_threshold:
@@ -1043,6 +1189,7 @@ class MaatGovernor:
         )
         
         self.judgments.append(judgment)
+        self.total_judgments += 1
         self.current_maat = maat_score
         
         return judgment
@@ -1059,11 +1206,11 @@ class MaatGovernor:
         return {
             "strictness": self.strictness,
             "current_maat": self.current_maat,
-            "total_judgments": len(self.judgments),
+            "total_judgments": self.total_judgments,
             "blocked_patterns": len(self.blocked_patterns),
             "recent_decisions": [
                 {"decision": j.decision.value, "maat": j.maat_score}
-                for j in self.judgments[-5:]
+                for j in list(self.judgments)[-5:]
             ]
         }
 
@@ -1095,7 +1242,9 @@ class QuantumCompressionBridge:
     
     def __init__(self, maat: MaatFunctional):
         self.maat = maat
-        self.superpositions: List[Superposition] = []
+        self.superpositions: deque = deque(maxlen=RETAIN_SUPERPOSITIONS)   # most recent
+        self.created: int = 0
+        self._collapsed_dropped: int = 0   # collapsed among those rotated out
         
     def create_superposition(self, candidates: List[FieldState]) -> Superposition:
         """Create a superposition from candidate states"""
@@ -1107,7 +1256,11 @@ class QuantumCompressionBridge:
         amplitudes = [1.0 / math.sqrt(n)] * n
         
         sup = Superposition(states=candidates, amplitudes=amplitudes)
-        self.superpositions.append(sup)
+        sups = self.superpositions
+        if len(sups) == sups.maxlen and sups[0].collapsed:
+            self._collapsed_dropped += 1
+        sups.append(sup)
+        self.created += 1
         return sup
     
     def evolve_amplitudes(self, sup: Superposition, 
@@ -1190,8 +1343,8 @@ class QuantumCompressionBridge:
     
     def export(self) -> Dict:
         return {
-            "superpositions_created": len(self.superpositions),
-            "collapsed": sum(1 for s in self.superpositions if s.collapsed),
+            "superpositions_created": self.created,
+            "collapsed": self._collapsed_dropped + sum(1 for s in self.superpositions if s.collapsed),
             "pending": sum(1 for s in self.superpositions if not s.collapsed)
         }
 
@@ -1223,9 +1376,34 @@ class ProtocolStack:
     - ascpi://    — Full ASCπ state transport
     
     These protocols transmit meaning-fields, not data.
+    
+    Wire format (little-endian, 76-byte fixed part):
+    - Header: magic "A5", version, protocol id, flags, source length,
+      destination length, pad, extension length (u32), timestamp (f64),
+      signature (16 bytes, keyed BLAKE2b)
+    - Body: ΔΦ, κ, θ, N, C as five float64
+    - Tail: source, destination, optional JSON extension block
+    
+    Flags bits 0-4 mark which field components the payload carried;
+    bit 5 marks an extension block holding any other payload keys.
+    
+    The signature covers protocol, source, destination, timestamp, flags,
+    body and extension, under a 16-64 byte key. Without one the stack signs
+    with DEFAULT_PROTOCOL_KEY: signatures stay reproducible across runs but
+    prove nothing, so pass your own key wherever packets cross a trust
+    boundary.
     """
     
-    def __init__(self):
+    HEADER = struct.Struct(f"<2sBBBBBxId{WIRE_SIG_BYTES}s")
+    BODY = struct.Struct("<5d")
+    BATCH = struct.Struct("<4sI")
+    SIGNED = struct.Struct("<BIIIId")   # flags, protocol / source / destination / extension lengths, timestamp
+    
+    def __init__(self, key: Optional[bytes] = None, log_size: int = PROTOCOL_LOG_SIZE):
+        if key is None:
+            key = DEFAULT_PROTOCOL_KEY
+        if not isinstance(key, (bytes, bytearray)) or not WIRE_MIN_KEY_BYTES <= len(key) <= 64:
+            raise ValueError(f"Signing key must be {WIRE_MIN_KEY_BYTES}-64 bytes")
         self.protocols = {
             PROTOCOL_FIELD: self._handle_field,
             PROTOCOL_MAAT: self._handle_maat,
@@ -1233,15 +1411,45 @@ class ProtocolStack:
             PROTOCOL_DPHI: self._handle_tension,
             PROTOCOL_ASCPI: self._handle_ascpi
         }
-        self.packet_log: List[ProtocolPacket] = []
-        
+        self.key = bytes(key)
+        self.packet_log: deque = deque(maxlen=log_size)
+        self.packets_created = 0
+        self._protocol_names = {v: k for k, v in WIRE_PROTOCOL_IDS.items()}
+    
+    def _split_payload(self, payload: Dict) -> Tuple[int, bytes, bytes]:
+        """Split payload into (flags, packed field body, extension bytes)"""
+        flags = 0
+        values = [0.0] * 5
+        extra = {}
+        for k, v in payload.items():
+            if k in WIRE_FIELD_KEYS and isinstance(v, (int, float)) and not isinstance(v, bool):
+                i = WIRE_FIELD_KEYS.index(k)
+                flags |= 1 << i
+                values[i] = float(v)
+            else:
+                extra[k] = v
+        ext = b""
+        if extra:
+            flags |= WIRE_HAS_EXTENSION
+            ext = json.dumps(extra, sort_keys=True, separators=(",", ":")).encode()
+        return flags, self.BODY.pack(*values), ext
+    
+    def _sign(self, protocol: str, source: str, destination: str, timestamp: float,
+              flags: int, body: bytes, ext: bytes) -> str:
+        """S8 signature: 16-byte keyed BLAKE2b over the header fields and the wire body"""
+        proto, src, dst = protocol.encode(), source.encode(), destination.encode()
+        h = hashlib.blake2b(self.SIGNED.pack(flags, len(proto), len(src), len(dst), len(ext), timestamp),
+                            digest_size=WIRE_SIG_BYTES, key=self.key)
+        for part in (proto, src, dst, body, ext):
+            h.update(part)
+        return h.hexdigest()
+    
     def create_packet(self, protocol: str, payload: Dict,
                       source: str, destination: str) -> ProtocolPacket:
         """Create a protocol packet"""
         payload_type = self._infer_payload_type(protocol, payload)
-        signature = hashlib.sha256(
-            json.dumps(payload, sort_keys=True).encode()
-        ).hexdigest()[:8]
+        timestamp = time.time()
+        signature = self._sign(protocol, source, destination, timestamp, *self._split_payload(payload))
         
         packet = ProtocolPacket(
             protocol=protocol,
@@ -1249,13 +1457,101 @@ class ProtocolStack:
             payload=payload,
             source=source,
             destination=destination,
-            timestamp=time.time(),
+            timestamp=timestamp,
             signature=signature
         )
         
         self.packet_log.append(packet)
+        self.packets_created += 1
         return packet
     
+    def verify(self, packet: ProtocolPacket) -> bool:
+        """Check a packet's signature against this stack's key"""
+        expected = self._sign(packet.protocol, packet.source, packet.destination, packet.timestamp,
+                              *self._split_payload(packet.payload))
+        return hmac.compare_digest(packet.signature, expected)
+    
+    def encode(self, packet: ProtocolPacket) -> bytes:
+        """Encode a packet into the binary wire format"""
+        proto_id = WIRE_PROTOCOL_IDS.get(packet.protocol)
+        if proto_id is None:
+            raise ValueError(f"Unknown protocol: {packet.protocol}")
+        src = packet.source.encode()
+        dst = packet.destination.encode()
+        if len(src) > 255 or len(dst) > 255:
+            raise ValueError("Source/destination exceed 255 bytes")
+        flags, body, ext = self._split_payload(packet.payload)
+        header = self.HEADER.pack(WIRE_MAGIC, WIRE_VERSION, proto_id, flags,
+                                  len(src), len(dst), len(ext), packet.timestamp,
+                                  bytes.fromhex(packet.signature))
+        return b"".join((header, body, src, dst, ext))
+    
+    def decode(self, buf, offset: int = 0) -> Tuple[ProtocolPacket, int]:
+        """
+        Decode one packet from `buf` at `offset` without copying the buffer.
+        
+        Returns (packet, offset of the next packet). Truncated or malformed
+        input raises ValueError; the signature is not checked here (verify()).
+        """
+        mv = memoryview(buf)
+        try:
+            magic, version, proto_id, flags, n_src, n_dst, n_ext, ts, sig = \
+                self.HEADER.unpack_from(mv, offset)
+            pos = offset + self.HEADER.size
+            values = self.BODY.unpack_from(mv, pos)
+        except struct.error:
+            raise ValueError(f"Truncated ASCπ v5 wire packet at offset {offset}") from None
+        if magic != WIRE_MAGIC or version != WIRE_VERSION:
+            raise ValueError("Not an ASCπ v5 wire packet")
+        protocol = self._protocol_names.get(proto_id)
+        if protocol is None:
+            raise ValueError(f"Unknown protocol id: {proto_id}")
+        
+        pos += self.BODY.size
+        if pos + n_src + n_dst + n_ext > len(mv):
+            raise ValueError(f"Truncated ASCπ v5 wire packet at offset {offset}")
+        payload = {k: values[i] for i, k in enumerate(WIRE_FIELD_KEYS) if flags & (1 << i)}
+        source = str(mv[pos:pos + n_src], "utf-8")
+        pos += n_src
+        destination = str(mv[pos:pos + n_dst], "utf-8")
+        pos += n_dst
+        if flags & WIRE_HAS_EXTENSION:
+            extension = json.loads(str(mv[pos:pos + n_ext], "utf-8"))
+            if not isinstance(extension, dict):
+                raise ValueError("ASCπ v5 wire extension must be a JSON object")
+            payload.update(extension)
+        pos += n_ext
+        
+        packet = ProtocolPacket(
+            protocol=protocol,
+            payload_type=self._infer_payload_type(protocol, payload),
+            payload=payload,
+            source=source,
+            destination=destination,
+            timestamp=ts,
+            signature=sig.hex()
+        )
+        return packet, pos
+    
+    def encode_batch(self, packets: List[ProtocolPacket]) -> bytes:
+        """Frame many packets into a single buffer"""
+        return self.BATCH.pack(WIRE_BATCH_MAGIC, len(packets)) + \
+            b"".join(self.encode(p) for p in packets)
+    
+    def decode_batch(self, buf) -> List[ProtocolPacket]:
+        """Decode a buffer produced by encode_batch"""
+        mv = memoryview(buf)
+        if len(mv) < self.BATCH.size:
+            raise ValueError("Truncated ASCπ v5 packet batch")
+        magic, count = self.BATCH.unpack_from(mv, 0)
+        if magic != WIRE_BATCH_MAGIC:
+            raise ValueError("Not an ASCπ v5 packet batch")
+        packets, pos = [], self.BATCH.size
+        for _ in range(count):
+            packet, pos = self.decode(mv, pos)
+            packets.append(packet)
+        return packets
+    
     def _infer_payload_type(self, protocol: str, payload: Dict) -> str:
         """Infer payload type from protocol and content"""
         type_map = {
@@ -1319,10 +1615,10 @@ class ProtocolStack:
     def export(self) -> Dict:
         return {
             "protocols_supported": list(self.protocols.keys()),
-            "packets_processed": len(self.packet_log),
+            "packets_processed": self.packets_created,
             "recent_packets": [
                 {"protocol": p.protocol, "type": p.payload_type}
-                for p in self.packet_log[-5:]
+                for p in list(self.packet_log)[-5:]
             ]
         }
 
@@ -1355,7 +1651,8 @@ class ASCPiEngineV5:
     """
     
     def __init__(self, agent_id: str = "primary",
-                 governor_strictness: float = GOVERNOR_STRICTNESS):
+                 governor_strictness: float = GOVERNOR_STRICTNESS,
+                 protocol_key: Optional[bytes] = None):
         # Core v4 engine
         self.v4_engine = ASCPiEngine()
         
@@ -1367,7 +1664,8 @@ class ASCPiEngineV5:
         self.governor = MaatGovernor(strictness=governor_strictness)
         self.maat = MaatFunctional()
         self.qcb = QuantumCompressionBridge(self.maat)
-        self.protocol = ProtocolStack()
+        # Packet signing key; None signs with the public DEFAULT_PROTOCOL_KEY
+        self.protocol = ProtocolStack(protocol_key)
         
         # Register self as agent
         self.agent_id = agent_id
@@ -1376,8 +1674,9 @@ class ASCPiEngineV5:
         # State tracking
         self.current_state: Optional[FieldState] = None
         self.world_state: Optional[FieldState] = None
-        self.history: List[FieldState] = []
-        self.output_history: List[Dict] = []
+        self.history: deque = deque(maxlen=100)
+        self.output_history: deque = deque(maxlen=RETAIN_OUTPUTS)   # recent results
+        self.outputs_generated: int = 0
         
     def add_world_source(self, source_id: str, domain: FieldDomain,
                          text: str, trust_weight: float = 1.0) -> None:
@@ -1419,8 +1718,7 @@ class ASCPiEngineV5:
         
         self.current_state = output_state
         self.history.append(input_state)
-        if len(self.history) > 100:
-            self.history = self.history[-100:]
+        self.governor.observe(input_state)
         
         result["v4_result"] = {
             "glyph_count": v4_result["glyph_count"],
@@ -1447,8 +1745,7 @@ class ASCPiEngineV5:
         judgment = self.governor.judge(
             input_state=input_state,
             output_state=output_state,
-            world_context=world_context,
-            history=self.history
+            world_context=world_context
         )
         result["governor"] = {
             "decision": judgment.decision.value,
@@ -1458,13 +1755,15 @@ class ASCPiEngineV5:
         
         # Handle rebuild if needed
         if judgment.decision == GovernorDecision.REBUILD and allow_rebuild:
-            # Re-process with stronger damping
-            self.v4_engine.operators.alpha *= 1.5
-            v4_result = self.v4_engine.process(text, steps=20)
+            # Warm-start: continue the evolved field with stronger damping
+            ops = self.v4_engine.operators
+            rebuild_ops = FieldOperators(ops.alpha * 1.5, ops.beta, ops.gamma)
+            v4_result = self.v4_engine.resume(text, steps=REBUILD_STEPS,
+                                              operators=rebuild_ops)
             output_state = FieldState(**v4_result["final_state"])
-            self.v4_engine.operators.alpha /= 1.5
             
             result["rebuilt"] = True
+            result["v4_result"]["convergence_step"] = v4_result["convergence_step"]
             result["v4_result"]["final_coherence"] = output_state.coherence
         
         # STAGE 6: Agent resonance
@@ -1493,6 +1792,7 @@ class ASCPiEngineV5:
         }
         
         self.output_history.append(result)
+        self.outputs_generated += 1
         return result
     
     def disambiguate(self, text: str, interpretations: List[str]) -> Dict:
@@ -1540,7 +1840,7 @@ class ASCPiEngineV5:
             "resonance": self.mafrl.export(),
             "qcb": self.qcb.export(),
             "protocol": self.protocol.export(),
-            "outputs_generated": len(self.output_history)
+            "outputs_generated": self.outputs_generated
         }
 
 
@@ -1671,7 +1971,18 @@ def run_v5_tests() -> Dict:
     
     predictions = engine.tpl.predict_phase(5)
     log_test("tpl_prediction", len(predictions) == 5, f"predictions={len(predictions)}")
-    
+
+    seen = list(engine.tpl.detected_patterns)
+    for i in range(RETAIN_PATTERNS):
+        engine.tpl.record(FieldState(theta=(i % 5) * 0.2 * TAU, coherence=0.8))
+        seen.extend(engine.tpl.detect_cycles(min_period=3, max_period=10))
+    strongest = max((p for p in seen if p.pattern_type == "cycle"), key=lambda p: p.confidence)
+    log_test("tpl_patterns_bounded",
+             len(engine.tpl.detected_patterns) == RETAIN_PATTERNS
+             and engine.tpl.patterns_total == len(seen) > RETAIN_PATTERNS
+             and engine.tpl.best_cycle is strongest,
+             f"kept={len(engine.tpl.detected_patterns)}/{engine.tpl.patterns_total}")
+
     print()
     
     # -------------------------------------------------------------------------
@@ -1695,6 +2006,17 @@ def run_v5_tests() -> Dict:
     log_test("governor_rebuild_bad", judgment.decision != GovernorDecision.ALLOW,
              f"decision={judgment.decision.value}")
     
+    # Streaming detector agrees with the full-history scan
+    rng = random.Random(SEED)
+    states = [FieldState(theta=rng.uniform(0, TAU), coherence=rng.random(),
+                         energy=rng.uniform(0.5, 2.0)) for _ in range(250)]
+    audit = StreamingManipulationDetector.audit(states, window=100)
+    reference = [engine.governor.detect_manipulation(s, states[max(0, i-100):i])
+                 for i, s in enumerate(states)]
+    log_test("governor_streaming_detector",
+             all(abs(a - r) < 1e-9 for a, r in zip(audit, reference)),
+             f"states={len(states)}")
+    
     print()
     
     # -------------------------------------------------------------------------
@@ -1743,6 +2065,72 @@ def run_v5_tests() -> Dict:
     
     log_test("protocol_stack", protocols_tested == 5, f"protocols={protocols_tested}/5")
     
+    # Binary wire format round-trip
+    stack = engine.protocol
+    packets = [stack.create_packet(PROTOCOL_ASCPI, FieldState(theta=0.1 * i).to_dict(),
+                                   "node_a", "node_b") for i in range(10)]
+    packets.append(stack.create_packet(PROTOCOL_MAAT, {"maat_score": 0.9, "note": "ΔΦ"},
+                                       "node_a", "node_b"))
+    wire = stack.encode_batch(packets)
+    decoded = stack.decode_batch(wire)
+    roundtrip = all(
+        d.payload == p.payload and d.signature == p.signature and d.protocol == p.protocol
+        for d, p in zip(decoded, packets)
+    ) and len(decoded) == len(packets) and all(stack.verify(d) for d in decoded)
+    log_test("protocol_wire_roundtrip", roundtrip, f"bytes={len(wire)}")
+    
+    # Signature binds the header fields; explicit keys must be 16-64 bytes
+    from dataclasses import replace
+    p = packets[-1]
+    tampered = [replace(p, source="node_x"), replace(p, destination="node_x"),
+                replace(p, timestamp=p.timestamp + 1), replace(p, protocol=PROTOCOL_COH),
+                replace(p, payload={**p.payload, "maat_score": 0.1})]
+    other = ProtocolStack(b"k" * 32)
+    key_errors = 0
+    for bad in (b"", b"short", b"k" * 65, "k" * 32):
+        try:
+            ProtocolStack(bad)
+        except ValueError:
+            key_errors += 1
+    log_test("protocol_signature_binding",
+             len(p.signature) == 2 * WIRE_SIG_BYTES and not any(stack.verify(t) for t in tampered)
+             and not other.verify(p) and key_errors == 4,
+             f"sig_bytes={len(p.signature) // 2}, key_errors={key_errors}")
+    
+    # Without a key both stacks sign with DEFAULT_PROTOCOL_KEY: reproducible
+    default_a, default_b = ProtocolStack(), ProtocolStack()
+    q = default_a.create_packet(PROTOCOL_MAAT, {"maat_score": 0.9}, "node_a", "node_b")
+    log_test("protocol_default_key",
+             default_b.verify(q) and stack.verify(q) and not other.verify(q),
+             f"key_bytes={len(DEFAULT_PROTOCOL_KEY)}")
+    
+    # Truncated input fails with ValueError, never struct.error or a short packet
+    one = stack.encode(p)
+    truncations = 0
+    for cut in range(len(one)):
+        try:
+            stack.decode(one[:cut])
+        except ValueError:
+            truncations += 1
+    for cut in (0, 3, stack.BATCH.size + 10, len(wire) - 1):
+        try:
+            stack.decode_batch(wire[:cut])
+        except ValueError:
+            truncations += 1
+    log_test("protocol_decode_truncated", truncations == len(one) + 4,
+             f"rejected={truncations}/{len(one) + 4}")
+    
+    # Valid JSON that is not an object is rejected as malformed, not a TypeError
+    rejected = 0
+    for ext in (b"[1]", b"1", b'"x"', b"null"):
+        head = stack.HEADER.pack(WIRE_MAGIC, WIRE_VERSION, WIRE_PROTOCOL_IDS[PROTOCOL_MAAT],
+                                 WIRE_HAS_EXTENSION, 1, 1, len(ext), 0.0, bytes(WIRE_SIG_BYTES))
+        try:
+            stack.decode(head + stack.BODY.pack(0, 0, 0, 0, 0) + b"ab" + ext)
+        except ValueError:
+            rejected += 1
+    log_test("protocol_decode_extension_type", rejected == 4, f"rejected={rejected}/4")
+    
     print()
     
     # -------------------------------------------------------------------------
@@ -1768,6 +2156,20 @@ def run_v5_tests() -> Dict:
     log_test("pipeline_resonance", "cluster_coherence" in result["resonance"])
     log_test("pipeline_protocol", "packet_signature" in result["protocol"])
     
+    # Warm-start REBUILD continues the trajectory with per-call operators;
+    # the reported convergence step counts the resumed steps too
+    first = ASCPiEngineV5(governor_strictness=1.0).process(
+        "What does this discovery mean for humanity?", allow_rebuild=False)
+    engine = ASCPiEngineV5(governor_strictness=1.0)
+    result = engine.process("What does this discovery mean for humanity?")
+    v4 = engine.v4_engine
+    log_test("pipeline_warm_rebuild",
+             result.get("rebuilt", False) and v4.predictor.ops is v4.operators and
+             len(v4.trajectory) == result["v4_result"]["convergence_step"] >
+             first["v4_result"]["convergence_step"] and
+             result["v4_result"]["final_coherence"] == result["final_state"]["coherence"],
+             f"steps={first['v4_result']['convergence_step']}->{len(v4.trajectory)}")
+    
     print()
     
     # -------------------------------------------------------------------------
@@ -1789,7 +2191,16 @@ def run_v5_tests() -> Dict:
     full_state = engine.export_full_state()
     log_test("stress_memory_intact", full_state["memory"]["step_count"] == 20,
              f"steps={full_state['memory']['step_count']}")
-    
+
+    engine.output_history = deque(engine.output_history, maxlen=5)
+    for i in range(8):
+        engine.process(f"Retention probe {i}.")
+    log_test("stress_retention_bounded",
+             len(engine.output_history) == 5 and full_state["outputs_generated"] == 20
+             and engine.export_full_state()["outputs_generated"] == 28
+             and engine.export_full_state()["governor"]["total_judgments"] == 28,
+             f"kept={len(engine.output_history)}/{engine.outputs_generated}")
+
     print()
     
     # -------------------------------------------------------------------------
@@ -98,16 +98,27 @@ from __future__ import annotations
 import math
 import hashlib
 import json
+import os
+import random
+import sys
 import time
 import uuid
+from array import array
 from datetime import datetime
-from dataclasses import dataclass, field as datafield
+from dataclasses import FrozenInstanceError, dataclass, field as datafield
 from typing import List, Dict, Optional, Tuple, Set, Any, Callable, Union
 from enum import Enum
 from collections import deque
+from itertools import islice
 from abc import ABC, abstractmethod
 import copy
 
+try:
+    from ascpi.primitives import ContentCache, RollingTrend
+except ImportError:   # source checkout run from the release directory: ascpi/ sits beside it
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ascpi.primitives import ContentCache, RollingTrend
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # §0 CONSTANTS — θ = 0.00π — κ = 0.05 — C = 0.98
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -150,6 +161,22 @@ WEIGHT_LANGUAGE: float = 0.4
 WEIGHT_CODE: float = 0.3
 WEIGHT_MEMORY: float = 0.3
 
+# Superposition beam (QCB)
+QCB_BEAM_WIDTH: int = 4
+QCB_BEAM_STEPS: int = 5
+
+# Attractor learning (bounded memory)
+ATTRACTOR_RESERVOIR: int = 1000         # Operational history sample size
+ATTRACTOR_PEAK_DECAY: float = 0.98      # Per-peak decay of peak weights
+ATTRACTOR_WINDOW: int = 50              # States per phase stability window
+
+# Retention (per-call records of long-running engines)
+RETAIN_JUDGMENTS: int = 1000            # Governor judgments kept (ring)
+RETAIN_SUPERPOSITIONS: int = 64         # QCB superpositions kept (ring)
+RETAIN_HISTORY: int = 200               # Engine input fields kept (ring)
+RETAIN_VIOLATIONS: int = 1000           # Forensic invariant violations kept (ring)
+TRAJECTORY_POINTS: int = 512            # Coherence trajectory points (decimated)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # §1 FIELD_CORE — θ = 0.05π — κ = 0.25 — C = 0.92
@@ -329,11 +356,100 @@ class SemanticField:
         return f"Ψ({self.source_type[:4]}|ΔΦ={self.delta_phi:.3f},κ={self.kappa:.3f},θ={self.theta:.3f},C={self.coherence:.3f})"
 
 
+class FrozenSemanticField(SemanticField):
+    """
+    Read-only Ψ published by memory layers (attractor snapshots).
+    
+    Writes raise FrozenInstanceError; copy() returns a mutable SemanticField.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self.__dict__.update(SemanticField(*args, **kwargs).__dict__)
+    
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r} of a published Ψ")
+    
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r} of a published Ψ")
+    
+    def __eq__(self, other):
+        return isinstance(other, SemanticField) and self.__dict__ == other.__dict__
+    
+    __hash__ = None
+    
+    def _enforce_invariants(self) -> None:
+        pass  # Enforced before publishing
+    
+    @classmethod
+    def of(cls, f: SemanticField) -> FrozenSemanticField:
+        """Frozen view of f's values (f itself if already frozen)"""
+        if type(f) is cls:
+            return f
+        frozen = object.__new__(cls)
+        frozen.__dict__.update(f.__dict__)
+        return frozen
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # §2 CURVATURE_MANIFOLD — θ = 0.10π — κ = 0.35 — C = 0.90
 # ═══════════════════════════════════════════════════════════════════════════════
 # Geometric structure encoding semantic relationships.
 
+class CurvatureRows:
+    """
+    K_ij of CurvatureManifold.from_fields computed on access from a
+    GlyphBuffer's θ/κ columns instead of n² stored floats.
+    matrix[i][j] is O(1); iteration yields the dense matrix's numbers.
+    """
+    
+    def __init__(self, theta: array, kappa: array):
+        self.theta, self.kappa = theta, kappa
+    
+    def entry(self, i: int, j: int) -> float:
+        if i == j:
+            return self.kappa[i]
+        phase_diff = abs(self.theta[i] - self.theta[j])
+        if phase_diff > π:
+            phase_diff = τ - phase_diff
+        correlation = math.cos(phase_diff)
+        distance_decay = 1.0 / (1 + abs(i - j))
+        return 0.5 * (self.kappa[i] + self.kappa[j]) * correlation * distance_decay
+    
+    def to_list(self) -> List[List[float]]:
+        return [list(row) for row in self]
+    
+    def __len__(self) -> int:
+        return len(self.kappa)
+    
+    def __getitem__(self, i: int) -> CurvatureRow:
+        n = len(self.kappa)
+        if not -n <= i < n:
+            raise IndexError("manifold row index out of range")
+        return CurvatureRow(self, i % n)
+    
+    def __iter__(self):
+        return (CurvatureRow(self, i) for i in range(len(self)))
+
+
+class CurvatureRow:
+    """Row i of a CurvatureRows view"""
+    
+    def __init__(self, rows: CurvatureRows, i: int):
+        self.rows, self.i = rows, i
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __getitem__(self, j: int) -> float:
+        n = len(self.rows)
+        if not -n <= j < n:
+            raise IndexError("manifold column index out of range")
+        return self.rows.entry(self.i, j % n)
+    
+    def __iter__(self):
+        return (self.rows.entry(self.i, j) for j in range(len(self.rows)))
+
+
 @dataclass
 class CurvatureManifold:
     """
@@ -429,10 +545,13 @@ class CurvatureManifold:
         Construct curvature manifold from field sequence.
         
         K_ij = phase-weighted correlation between fields i and j
+        A GlyphBuffer gives a lazy K (CurvatureRows) over its columns.
         """
         n = len(fields)
         if n == 0:
             return cls(dimension=0, matrix=[])
+        if isinstance(fields, GlyphBuffer):
+            return cls(dimension=n, matrix=CurvatureRows(fields.theta, fields.kappa))
         
         matrix = []
         for i, fi in enumerate(fields):
@@ -543,6 +662,82 @@ class MeaningCarrier:
         )
 
 
+class GlyphBuffer:
+    """
+    Struct-of-arrays carrier sequence: the fields of
+    [MeaningCarrier.from_grapheme(g, i, n) ...] without a MeaningCarrier and
+    SemanticField per grapheme.
+    
+    Columns (array('d'); numpy.frombuffer views them without copying):
+        theta, kappa, delta_phi, energy, coherence   (invariants enforced)
+    Clusters:
+        starts  — array('q'), offset of each grapheme in the source text
+        ids     — array('l'), index into `symbols` (interned distinct graphemes)
+    
+    Position-free properties are computed once per distinct grapheme:
+    ~56 bytes per glyph. buffer[i] builds the SemanticField on demand.
+    """
+    
+    def __init__(self, source: str = "language"):
+        self.source = source
+        self.theta, self.kappa, self.delta_phi = array('d'), array('d'), array('d')
+        self.energy, self.coherence = array('d'), array('d')
+        self.starts, self.ids = array('q'), array('l')
+        self.symbols: List[str] = []
+        self._props: List[Tuple[float, float, float, float, float]] = []   # θ base, κ, ΔΦ, N, C
+        self._index: Dict[str, int] = {}
+    
+    @classmethod
+    def from_graphemes(cls, text: str, graphemes: List[str], source: str = "language") -> GlyphBuffer:
+        """graphemes: the grapheme split of text, in order"""
+        buf = cls(source)
+        total = max(len(graphemes), 1)
+        pos = 0
+        for i, g in enumerate(graphemes):
+            sid = buf._intern(g)
+            base, kappa, delta_phi, energy, coherence = buf._props[sid]
+            pos = text.find(g, pos)   # only skipped whitespace lies between graphemes
+            buf.starts.append(pos)
+            pos += len(g)
+            buf.ids.append(sid)
+            buf.theta.append((base + (i / total) * τ / 2) % τ)
+            buf.kappa.append(kappa)
+            buf.delta_phi.append(delta_phi)
+            buf.energy.append(energy)
+            buf.coherence.append(coherence)
+        return buf
+    
+    def _intern(self, g: str) -> int:
+        sid = self._index.get(g)
+        if sid is None:
+            f = MeaningCarrier.from_grapheme(g, 0, 1, self.source).field
+            primary = ord(g[0])
+            sid = self._index[g] = len(self.symbols)
+            self.symbols.append(g)
+            self._props.append(((primary // 256) * φ + (primary % 256) / 256 * τ,
+                                f.kappa, f.delta_phi, f.energy, f.coherence))
+        return sid
+    
+    def symbol(self, i: int) -> str:
+        return self.symbols[self.ids[i]]
+    
+    @property
+    def nbytes(self) -> int:
+        """Column and index memory (interned symbols excluded)"""
+        cols = (self.theta, self.kappa, self.delta_phi, self.energy, self.coherence, self.starts, self.ids)
+        return sum(len(c) * c.itemsize for c in cols)
+    
+    def __len__(self) -> int:
+        return len(self.theta)
+    
+    def __getitem__(self, i: int) -> SemanticField:
+        return SemanticField(delta_phi=self.delta_phi[i], kappa=self.kappa[i], theta=self.theta[i],
+                             energy=self.energy[i], coherence=self.coherence[i], source_type=self.source)
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # §4 FIELD_OPERATORS — θ = 0.20π — κ = 0.45 — C = 0.87
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -564,6 +759,14 @@ class FieldOperator(ABC):
     @abstractmethod
     def symbol(self) -> str:
         pass
+    
+    def derive(self, **overrides) -> 'FieldOperator':
+        """Copy with some parameters overridden and its own application count (self is untouched)"""
+        op = copy.copy(self)
+        op.applications = 0
+        for k, v in overrides.items():
+            setattr(op, k, v)
+        return op
 
 
 class DampingOperator(FieldOperator):
@@ -855,45 +1058,114 @@ class PushforwardOperator:
 # ═══════════════════════════════════════════════════════════════════════════════
 # Multi-layer semantic memory with field absorption dynamics.
 
+class DecimatedSeries:
+    """
+    Whole-lifetime series in at most `capacity` points
+    
+    Every `stride`-th sample is kept. When the buffer is full, every other
+    point is dropped and the stride doubles, so the points stay evenly
+    spaced over everything seen: the full run at decreasing resolution.
+    `seen` counts all samples, `last` is the newest one.
+    """
+    __slots__ = ('capacity', 'stride', 'seen', 'last', '_points')
+    
+    def __init__(self, capacity: int):
+        self.capacity = max(2, capacity + capacity % 2)   # even: kept points stay on the stride grid
+        self.stride = 1
+        self.seen = 0
+        self.last: Optional[float] = None
+        self._points: List[float] = []
+    
+    def append(self, y: float) -> None:
+        if self.seen % self.stride == 0:
+            if len(self._points) == self.capacity:
+                del self._points[1::2]
+                self.stride *= 2
+            self._points.append(y)
+        self.seen += 1
+        self.last = y
+    
+    def __len__(self) -> int:
+        return len(self._points)
+    
+    def __iter__(self):
+        return iter(self._points)
+    
+    def __getitem__(self, i):
+        return self._points[i]
+    
+    def samples(self) -> List[Tuple[int, float]]:
+        """(sample index, value) of the kept points"""
+        return [(i * self.stride, y) for i, y in enumerate(self._points)]
+
+
 class MemoryLayer:
-    """Single memory layer with absorption dynamics"""
+    """
+    Single memory layer with absorption dynamics
+    
+    Copy-on-write: absorb() builds the next field version and publishes it
+    with a generation counter in one reference swap. Published fields are
+    FrozenSemanticField, so readers may hold them without copying or
+    locking; a caller that wants to edit one takes copy() first.
+    """
     
     def __init__(self, name: str, rate: float = 0.3):
         self.name = name
         self.rate = rate
-        self.field = SemanticField(source_type="memory")
+        self._snap: Tuple[int, FrozenSemanticField] = (0, FrozenSemanticField(source_type="memory"))
         self.history: deque = deque(maxlen=200)
         self.coherence_peaks: List[Tuple[int, float]] = []
     
+    @property
+    def field(self) -> FrozenSemanticField:
+        return self._snap[1]
+    
+    @field.setter
+    def field(self, value: SemanticField) -> None:
+        self._snap = (self._snap[0] + 1, FrozenSemanticField.of(value))
+    
+    @property
+    def generation(self) -> int:
+        return self._snap[0]
+    
+    def snapshot(self) -> Tuple[int, FrozenSemanticField]:
+        """Consistent (generation, field) pair — shared and frozen"""
+        return self._snap
+    
     def absorb(self, incoming: SemanticField) -> None:
         """Absorb incoming field"""
         α = self.rate
+        old = self.field
+        new = old.copy()
         
         # Energy absorption
-        self.field.energy = (1 - α) * self.field.energy + α * incoming.energy
+        new.energy = (1 - α) * old.energy + α * incoming.energy
         
         # Curvature absorption
-        self.field.kappa = (1 - α) * self.field.kappa + α * incoming.kappa
-        self.field.kappa = max(KAPPA_MIN, min(KAPPA_MAX, self.field.kappa))
+        new.kappa = (1 - α) * old.kappa + α * incoming.kappa
+        new.kappa = max(KAPPA_MIN, min(KAPPA_MAX, new.kappa))
         
         # Circular phase blend
-        sin_old = math.sin(self.field.theta)
-        cos_old = math.cos(self.field.theta)
+        sin_old = math.sin(old.theta)
+        cos_old = math.cos(old.theta)
         sin_new = math.sin(incoming.theta)
         cos_new = math.cos(incoming.theta)
         
         sin_blend = (1 - α) * sin_old + α * sin_new
         cos_blend = (1 - α) * cos_old + α * cos_new
-        self.field.theta = math.atan2(sin_blend, cos_blend) % τ
+        new.theta = math.atan2(sin_blend, cos_blend) % τ
         
         # Tension absorption
-        self.field.delta_phi = (1 - α) * self.field.delta_phi + α * incoming.delta_phi
+        new.delta_phi = (1 - α) * old.delta_phi + α * incoming.delta_phi
         
         # Update coherence
-        self.field.coherence = self.get_coherence()
+        new.coherence = self.get_coherence()
+        
+        # Track history (the layer's own version — never handed out or mutated again)
+        self.history.append(new)
         
-        # Track history
-        self.history.append(self.field.copy())
+        # Publish a frozen view
+        self.field = new
         
         # Track coherence peaks
         if self.field.coherence > 0.8:
@@ -934,7 +1206,7 @@ class SemanticMemory:
         self.M_inf = MemoryLayer("M∞", rate=0.15)
         
         self.step = 0
-        self.coherence_trajectory: List[float] = []
+        self.coherence_trajectory = DecimatedSeries(TRAJECTORY_POINTS)
         self.coherence_floor: float = 0.0
     
     def integrate(self, field: SemanticField, 
@@ -998,9 +1270,18 @@ class SemanticMemory:
         ]
         return sum(w * c for w, c in zip(weights, coherences))
     
-    def get_attractor(self) -> SemanticField:
-        """Get current attractor state"""
-        return self.M_inf.field.copy()
+    def get_attractor(self) -> FrozenSemanticField:
+        """Get current attractor state (shared and frozen — copy() before mutating)"""
+        return self.M_inf.field
+    
+    @property
+    def generation(self) -> int:
+        """Attractor version; changes whenever M∞ publishes"""
+        return self.M_inf.generation
+    
+    def attractor_snapshot(self) -> Tuple[int, FrozenSemanticField]:
+        """Consistent (generation, M∞) pair; the field is frozen"""
+        return self.M_inf.snapshot()
     
     def get_all_coherence_peaks(self) -> List[Tuple[int, float]]:
         """Get coherence peaks from all layers"""
@@ -1015,7 +1296,7 @@ class SemanticMemory:
             "coherence": self.get_coherence(),
             "coherence_floor": self.coherence_floor,
             "attractor": self.get_attractor().to_dict(),
-            "trajectory_length": len(self.coherence_trajectory),
+            "trajectory_length": self.coherence_trajectory.seen,
             "peak_count": len(self.get_all_coherence_peaks())
         }
 
@@ -1036,16 +1317,45 @@ class GlobalAttractorLearner:
     - Multi-agent resonance history
     
     This upgrades the simple absorption-based M∞ to a learned attractor.
+    
+    Bounded for long-lived engines — O(1) time per request, O(1) memory:
+    - operational history: uniform reservoir sample (Algorithm R) of all states
+    - coherence peaks: exponentially decayed, coherence-weighted running sums
+      (weight C·decayᵏ for the peak k peaks ago) give the peak average
+    - phase stability: tumbling windows of ATTRACTOR_WINDOW states from running
+      sin/cos sums; the last 50 window results, summarized when a window closes
+    - resonance: high-coherence share over the last 200 events, kept as a count
     """
     
-    def __init__(self, learning_rate: float = 0.1):
+    def __init__(self, learning_rate: float = 0.1,
+                 reservoir_size: int = ATTRACTOR_RESERVOIR,
+                 peak_decay: float = ATTRACTOR_PEAK_DECAY,
+                 seed: int = 0):
         self.learning_rate = learning_rate
+        self.reservoir_size = reservoir_size
+        self.peak_decay = peak_decay
+        self._rng = random.Random(seed)
         
         # History tracking
-        self.operational_history: deque = deque(maxlen=1000)
-        self.coherence_peaks: List[SemanticField] = []
-        self.phase_stability_windows: List[Tuple[float, float]] = []  # (mean_phase, variance)
-        self.resonance_history: List[Dict] = []
+        self.operational_history: List[SemanticField] = []   # reservoir sample
+        self.states_seen: int = 0
+        self.peaks_seen: int = 0
+        self.phase_stability_windows: deque = deque(maxlen=50)  # (mean_phase, variance)
+        
+        # Decayed peak sums: Σw, Σw·ΔΦ, Σw·κ, Σw·N, Σw·sinθ, Σw·cosθ, Σw·C
+        self._peak_sums = [0.0] * 7
+        self._last_peak: Optional[SemanticField] = None
+        self._peak_avg: Optional[SemanticField] = None
+        
+        # Current stability window, stable-phase sum over closed windows
+        self._win_sin = self._win_cos = 0.0
+        self._win_n = 0
+        self._stable_sum = 0.0
+        self._stable_n = 0
+        
+        # Resonance: high-coherence flags of the last 200 events
+        self._resonance_flags: deque = deque(maxlen=200)
+        self._resonance_high = 0
         
         # Learned attractor
         self.learned_attractor = SemanticField(source_type="learned_attractor")
@@ -1057,46 +1367,62 @@ class GlobalAttractorLearner:
     
     def record_state(self, field: SemanticField) -> None:
         """Record operational state"""
-        self.operational_history.append(field.copy())
+        self.states_seen += 1
+        if len(self.operational_history) < self.reservoir_size:
+            self.operational_history.append(field.copy())
+        else:
+            j = self._rng.randrange(self.states_seen)
+            if j < self.reservoir_size:
+                self.operational_history[j] = field.copy()
         
         # Track coherence peaks
         if field.coherence > 0.8:
-            self.coherence_peaks.append(field.copy())
-            if len(self.coherence_peaks) > 100:
-                self.coherence_peaks = self.coherence_peaks[-100:]
+            self._record_peak(field)
         
-        # Analyze phase stability periodically
-        if len(self.operational_history) >= 50 and len(self.operational_history) % 50 == 0:
+        # Phase stability over tumbling windows
+        self._win_sin += math.sin(field.theta)
+        self._win_cos += math.cos(field.theta)
+        self._win_n += 1
+        if self._win_n == ATTRACTOR_WINDOW:
             self._analyze_phase_stability()
     
+    def _record_peak(self, field: SemanticField) -> None:
+        d, w, s = self.peak_decay, field.coherence, self._peak_sums
+        for i, x in enumerate((1.0, field.delta_phi, field.kappa, field.energy,
+                               math.sin(field.theta), math.cos(field.theta), field.coherence)):
+            s[i] = s[i] * d + w * x
+        self.peaks_seen += 1
+        self._last_peak = field.copy()
+        self._peak_avg = None
+    
     def record_resonance(self, resonance_data: Dict) -> None:
         """Record multi-agent resonance event"""
-        self.resonance_history.append(resonance_data)
-        if len(self.resonance_history) > 200:
-            self.resonance_history = self.resonance_history[-200:]
+        flags = self._resonance_flags
+        if len(flags) == flags.maxlen:
+            self._resonance_high -= flags[0]
+        high = resonance_data.get("coherence", 0) > 0.7
+        flags.append(high)
+        self._resonance_high += high
     
     def _analyze_phase_stability(self) -> None:
-        """Analyze recent phase stability"""
-        recent = list(self.operational_history)[-50:]
-        phases = [s.theta for s in recent]
+        """Close the current phase window"""
+        sin_sum, cos_sum, n = self._win_sin, self._win_cos, self._win_n
+        self._win_sin = self._win_cos = 0.0
+        self._win_n = 0
         
-        # Compute circular mean and variance
-        sin_sum = sum(math.sin(t) for t in phases)
-        cos_sum = sum(math.cos(t) for t in phases)
+        # Circular mean and variance
         mean_phase = math.atan2(sin_sum, cos_sum) % τ
-        
-        # Circular variance
-        r = math.sqrt(sin_sum**2 + cos_sum**2) / len(phases)
+        r = math.sqrt(sin_sum**2 + cos_sum**2) / n
         variance = 1 - r  # Low r = high variance
         
-        self.phase_stability_windows.append((mean_phase, variance))
-        if len(self.phase_stability_windows) > 50:
-            self.phase_stability_windows = self.phase_stability_windows[-50:]
+        windows = self.phase_stability_windows
+        windows.append((mean_phase, variance))
         
-        # Update stability score
-        recent_variances = [v for _, v in self.phase_stability_windows[-10:]]
-        if recent_variances:
-            self.stability_score = 1 - sum(recent_variances) / len(recent_variances)
+        # Stable phases and stability score, refreshed once per window
+        stable = [p for p, v in windows if v < 0.3]
+        self._stable_sum, self._stable_n = sum(stable), len(stable)
+        recent = [v for _, v in islice(windows, max(0, len(windows) - 10), None)]
+        self.stability_score = 1 - sum(recent) / len(recent)
     
     def learn_attractor(self, memory: SemanticMemory) -> SemanticField:
         """
@@ -1111,31 +1437,26 @@ class GlobalAttractorLearner:
         self.update_count += 1
         
         # Start with memory's M∞
-        base_attractor = memory.get_attractor()
+        base_attractor = memory.get_attractor().copy()  # Nudged in place below
         
         # Incorporate coherence peaks
-        if self.coherence_peaks:
+        if self.peaks_seen:
             peak_avg = self._compute_peak_average()
             base_attractor = base_attractor.superpose(peak_avg, 0.7)
         
         # Incorporate phase stability
-        if self.phase_stability_windows:
-            stable_phases = [p for p, v in self.phase_stability_windows if v < 0.3]
-            if stable_phases:
-                target_phase = sum(stable_phases) / len(stable_phases)
-                # Nudge toward stable phase
-                phase_diff = target_phase - base_attractor.theta
-                if phase_diff > π: phase_diff -= τ
-                elif phase_diff < -π: phase_diff += τ
-                base_attractor.theta = (base_attractor.theta + 0.1 * phase_diff) % τ
+        if self._stable_n:
+            target_phase = self._stable_sum / self._stable_n
+            # Nudge toward stable phase
+            phase_diff = target_phase - base_attractor.theta
+            if phase_diff > π: phase_diff -= τ
+            elif phase_diff < -π: phase_diff += τ
+            base_attractor.theta = (base_attractor.theta + 0.1 * phase_diff) % τ
         
         # Incorporate resonance history
-        if self.resonance_history:
-            high_coherence_events = [r for r in self.resonance_history 
-                                      if r.get("coherence", 0) > 0.7]
-            if high_coherence_events:
-                resonance_boost = len(high_coherence_events) / len(self.resonance_history)
-                base_attractor.coherence = min(1.0, base_attractor.coherence + 0.1 * resonance_boost)
+        if self._resonance_high:
+            resonance_boost = self._resonance_high / len(self._resonance_flags)
+            base_attractor.coherence = min(1.0, base_attractor.coherence + 0.1 * resonance_boost)
         
         # Update learned attractor with learning rate
         self.learned_attractor = self.learned_attractor.superpose(
@@ -1144,52 +1465,41 @@ class GlobalAttractorLearner:
         )
         
         # Update confidence based on data quantity and stability
-        data_factor = min(1.0, len(self.operational_history) / 500)
+        data_factor = min(1.0, self.states_seen / 500)
         stability_factor = self.stability_score
-        peak_factor = min(1.0, len(self.coherence_peaks) / 50)
+        peak_factor = min(1.0, self.peaks_seen / 50)
         
         self.attractor_confidence = (data_factor + stability_factor + peak_factor) / 3
         
         return self.learned_attractor
     
     def _compute_peak_average(self) -> SemanticField:
-        """Compute weighted average of coherence peaks"""
-        if not self.coherence_peaks:
+        """Decayed, coherence-weighted average of coherence peaks (cached per peak)"""
+        if self._peak_avg is not None:
+            return self._peak_avg
+        if not self.peaks_seen:
             return SemanticField()
         
-        # Weight by coherence
-        weights = [p.coherence for p in self.coherence_peaks]
-        total_weight = sum(weights)
-        
-        if total_weight < ε:
-            return self.coherence_peaks[-1]
-        
-        # Weighted average
-        avg_phi = sum(p.delta_phi * w for p, w in zip(self.coherence_peaks, weights)) / total_weight
-        avg_kappa = sum(p.kappa * w for p, w in zip(self.coherence_peaks, weights)) / total_weight
-        avg_energy = sum(p.energy * w for p, w in zip(self.coherence_peaks, weights)) / total_weight
-        
-        # Circular weighted mean for phase
-        sin_sum = sum(math.sin(p.theta) * w for p, w in zip(self.coherence_peaks, weights))
-        cos_sum = sum(math.cos(p.theta) * w for p, w in zip(self.coherence_peaks, weights))
-        avg_theta = math.atan2(sin_sum, cos_sum) % τ
-        
-        avg_coherence = sum(p.coherence * w for p, w in zip(self.coherence_peaks, weights)) / total_weight
-        
-        return SemanticField(
-            delta_phi=avg_phi,
-            kappa=avg_kappa,
-            theta=avg_theta,
-            energy=avg_energy,
-            coherence=avg_coherence,
-            source_type="peak_average"
-        )
+        w, phi, kappa, energy, sin_sum, cos_sum, coh = self._peak_sums
+        if w < ε:
+            self._peak_avg = self._last_peak
+        else:
+            self._peak_avg = SemanticField(
+                delta_phi=phi / w,
+                kappa=kappa / w,
+                theta=math.atan2(sin_sum, cos_sum) % τ,   # circular weighted mean
+                energy=energy / w,
+                coherence=coh / w,
+                source_type="peak_average"
+            )
+        return self._peak_avg
     
     def to_dict(self) -> Dict:
         return {
             "update_count": self.update_count,
             "history_size": len(self.operational_history),
-            "peak_count": len(self.coherence_peaks),
+            "states_seen": self.states_seen,
+            "peak_count": self.peaks_seen,
             "stability_windows": len(self.phase_stability_windows),
             "stability_score": self.stability_score,
             "attractor_confidence": self.attractor_confidence,
@@ -1284,9 +1594,11 @@ class MaatGovernor:
     Enforces INV-5: L(Ψ_out) ≤ L(Ψ_in)
     """
     
-    def __init__(self, strictness: float = MAAT_THRESHOLD):
+    def __init__(self, strictness: float = MAAT_THRESHOLD, retain: int = RETAIN_JUDGMENTS):
         self.strictness = strictness
-        self.judgments: List[Dict] = []
+        self.judgments: deque = deque(maxlen=retain)   # most recent; totals below
+        self.total_judgments: int = 0
+        self.decision_counts: Dict[str, int] = {}
         self.current_maat: float = 0.5
         self.blocked_signatures: Set[str] = set()
     
@@ -1342,6 +1654,8 @@ class MaatGovernor:
         
         judgment["decision"] = decision.value
         self.judgments.append(judgment)
+        self.total_judgments += 1
+        self.decision_counts[decision.value] = self.decision_counts.get(decision.value, 0) + 1
         self.current_maat = maat_score
         
         return decision, judgment
@@ -1350,7 +1664,8 @@ class MaatGovernor:
         return {
             "strictness": self.strictness,
             "current_maat": self.current_maat,
-            "total_judgments": len(self.judgments),
+            "total_judgments": self.total_judgments,
+            "decisions": dict(self.decision_counts),
             "blocked_count": len(self.blocked_signatures)
         }
 
@@ -1367,6 +1682,7 @@ class FieldSuperposition:
         self.states = states
         n = len(states)
         self.amplitudes = [1.0 / math.sqrt(max(n, 1))] * n
+        self.origins = list(range(n))
         self.collapsed = False
         self.result: Optional[SemanticField] = None
     
@@ -1385,6 +1701,54 @@ class FieldSuperposition:
         if total > ε:
             self.amplitudes = [w / total for w in weights]
     
+    def evolve_beam(self, maat: MaatFunctional, memory: SemanticMemory,
+                    ops: Dict[str, FieldOperator],
+                    steps: int = QCB_BEAM_STEPS,
+                    beam_width: int = QCB_BEAM_WIDTH) -> None:
+        """
+        Evolve candidates through D → A → I → M → K before collapse.
+        
+        After every step amplitudes are Boltzmann-reweighted on Ma'at and
+        only the `beam_width` strongest branches survive, so the cost stays
+        near `beam_width` evolutions however many candidates entered.
+        `origins` maps each surviving state back to its input candidate.
+        """
+        if self.collapsed or not self.states:
+            return
+        
+        attractor = memory.get_attractor()
+        context = {
+            "attractor": attractor,
+            "kappa_target": attractor.kappa,
+            "theta_target": attractor.theta
+        }
+        β = 5.0
+        beam = list(zip(self.origins, self.states))
+        
+        for step in range(steps + 1):
+            if step > 0:
+                evolved = []
+                for origin, state in beam:
+                    for op_name in ['D', 'A', 'I', 'M', 'K']:
+                        state = ops[op_name].apply(state, context)
+                    evolved.append((origin, state))
+                beam = evolved
+            
+            # Boltzmann reweighting (shifted by the minimum for stability)
+            maat_values = [maat.compute(s, memory) for _, s in beam]
+            m_min = min(maat_values)
+            weights = [math.exp(-β * (m - m_min)) for m in maat_values]
+            
+            # Prune to beam
+            ranked = sorted(range(len(beam)), key=lambda i: weights[i], reverse=True)
+            keep = ranked[:max(1, beam_width)]
+            beam = [beam[i] for i in keep]
+            total = sum(weights[i] for i in keep)
+            self.amplitudes = [weights[i] / total for i in keep]
+        
+        self.origins = [origin for origin, _ in beam]
+        self.states = [state for _, state in beam]
+    
     def collapse(self) -> SemanticField:
         """Collapse to Ma'at-minimum state"""
         if self.collapsed:
@@ -1405,24 +1769,37 @@ class FieldSuperposition:
 class QuantumCompressionBridge:
     """Ma'at-guided superposition collapse"""
     
-    def __init__(self, maat: MaatFunctional):
+    def __init__(self, maat: MaatFunctional, retain: int = RETAIN_SUPERPOSITIONS):
         self.maat = maat
-        self.superpositions: List[FieldSuperposition] = []
+        self.superpositions: deque = deque(maxlen=retain)   # most recent
+        self.created: int = 0
+        self._collapsed_dropped: int = 0   # collapsed among those rotated out
     
     def create(self, candidates: List[SemanticField]) -> FieldSuperposition:
         sup = FieldSuperposition(candidates)
-        self.superpositions.append(sup)
+        sups = self.superpositions
+        if len(sups) == sups.maxlen and sups[0].collapsed:
+            self._collapsed_dropped += 1
+        sups.append(sup)
+        self.created += 1
         return sup
     
     def collapse_to_truth(self, sup: FieldSuperposition, 
-                          memory: SemanticMemory) -> SemanticField:
-        sup.evolve(self.maat, memory)
+                          memory: SemanticMemory,
+                          ops: Optional[Dict[str, FieldOperator]] = None,
+                          steps: int = QCB_BEAM_STEPS,
+                          beam_width: int = QCB_BEAM_WIDTH) -> SemanticField:
+        """Collapse; with operators given, evolve a pruned beam first"""
+        if ops is None:
+            sup.evolve(self.maat, memory)
+        else:
+            sup.evolve_beam(self.maat, memory, ops, steps, beam_width)
         return sup.collapse()
     
     def to_dict(self) -> Dict:
         return {
-            "total_superpositions": len(self.superpositions),
-            "collapsed": sum(1 for s in self.superpositions if s.collapsed)
+            "total_superpositions": self.created,
+            "collapsed": self._collapsed_dropped + sum(1 for s in self.superpositions if s.collapsed)
         }
 
 
@@ -1431,21 +1808,73 @@ class QuantumCompressionBridge:
 # ═══════════════════════════════════════════════════════════════════════════════
 # World Curvature Matrix for global incoherence detection.
 
+class WorldCache(ContentCache):
+    """
+    Content-addressed LRU of encoded world sources, shared by all engines:
+    blake2b(text) → SemanticField. Cached fields are shared and read-only.
+    """
+    
+    def field(self, text: str, encode: Callable[[str, str], Tuple[SemanticField, Any]]) -> SemanticField:
+        """Cached encode(text, "world")[0]; the manifold is not kept"""
+        return self._get(self.digest(text), lambda: encode(text, "world")[0])
+
+
+WORLD_CACHE = WorldCache()
+
+
+class DomainAggregate:
+    """
+    Aggregate-only record of the fields added to one domain: running sums
+    give the same average as the full list (summed in arrival order)
+    without keeping the fields.
+    """
+    __slots__ = ('count', 'delta_phi', 'kappa', 'sin', 'cos', 'energy', 'coherence')
+    
+    def __init__(self):
+        self.count = 0
+        self.delta_phi = self.kappa = self.sin = self.cos = self.energy = self.coherence = 0.0
+    
+    def add(self, f: SemanticField) -> None:
+        self.count += 1
+        self.delta_phi += f.delta_phi
+        self.kappa += f.kappa
+        self.sin += math.sin(f.theta)
+        self.cos += math.cos(f.theta)
+        self.energy += f.energy
+        self.coherence += f.coherence
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def average(self) -> SemanticField:
+        n = self.count
+        return SemanticField(
+            delta_phi=self.delta_phi / n,
+            kappa=self.kappa / n,
+            theta=math.atan2(self.sin, self.cos) % τ,
+            energy=self.energy / n,
+            coherence=self.coherence / n,
+            source_type="world_average"
+        )
+
+
 class WorldCurvatureMatrix:
     """Global field aggregation across sources and domains"""
     
     def __init__(self):
         self.sources: Dict[str, SemanticField] = {}
-        self.domains: Dict[str, List[SemanticField]] = {}
+        self.domains: Dict[str, DomainAggregate] = {}
         self.global_field = SemanticField(source_type="world")
         self.incoherence_points: List[Dict] = []
     
     def add_source(self, source_id: str, domain: str, field: SemanticField) -> None:
+        unchanged = self.sources.get(source_id) is field   # cached re-send
         self.sources[source_id] = field
         if domain not in self.domains:
-            self.domains[domain] = []
-        self.domains[domain].append(field)
-        self._update_global()
+            self.domains[domain] = DomainAggregate()
+        self.domains[domain].add(field)
+        if not unchanged:
+            self._update_global()
     
     def _update_global(self) -> None:
         if not self.sources:
@@ -1476,8 +1905,8 @@ class WorldCurvatureMatrix:
                 if not self.domains[d1] or not self.domains[d2]:
                     continue
                 
-                avg1 = self._average_fields(self.domains[d1])
-                avg2 = self._average_fields(self.domains[d2])
+                avg1 = self.domains[d1].average()
+                avg2 = self.domains[d2].average()
                 
                 distance = avg1.distance_to(avg2)
                 
@@ -1490,19 +1919,6 @@ class WorldCurvatureMatrix:
         
         return sorted(self.incoherence_points, key=lambda x: x["magnitude"], reverse=True)
     
-    def _average_fields(self, fields: List[SemanticField]) -> SemanticField:
-        n = len(fields)
-        sin_sum = sum(math.sin(f.theta) for f in fields)
-        cos_sum = sum(math.cos(f.theta) for f in fields)
-        return SemanticField(
-            delta_phi=sum(f.delta_phi for f in fields) / n,
-            kappa=sum(f.kappa for f in fields) / n,
-            theta=math.atan2(sin_sum, cos_sum) % τ,
-            energy=sum(f.energy for f in fields) / n,
-            coherence=sum(f.coherence for f in fields) / n,
-            source_type="world_average"
-        )
-    
     def to_dict(self) -> Dict:
         return {
             "source_count": len(self.sources),
@@ -1953,11 +2369,11 @@ class AwarenessLoop2:
         self.growth_rate = growth_rate
         self.decay_rate = decay_rate
         
-        # Tracking for criteria
-        self.coherence_history: deque = deque(maxlen=50)
-        self.divergence_history: deque = deque(maxlen=50)
-        self.curvature_history: deque = deque(maxlen=50)
-        self.alignment_history: deque = deque(maxlen=50)
+        # Tracking for criteria (trends over the last 5 steps)
+        self.coherence_history = RollingTrend(5)
+        self.divergence_history = RollingTrend(5)
+        self.curvature_history = RollingTrend(5)
+        self.alignment_history = RollingTrend(5)
         
         # State tracking
         self.step: int = 0
@@ -1982,39 +2398,35 @@ class AwarenessLoop2:
         self.step += 1
         
         # Record current state
-        self.coherence_history.append(current_field.coherence)
-        self.curvature_history.append(current_field.kappa)
+        self.coherence_history.push(current_field.coherence)
+        self.curvature_history.push(current_field.kappa)
         
         # Compute divergence (distance from attractor)
         divergence = current_field.distance_to(attractor)
-        self.divergence_history.append(divergence)
+        self.divergence_history.push(divergence)
         
         # Compute alignment (inner product with attractor)
         alignment = current_field.inner_product(attractor)
-        self.alignment_history.append(alignment)
+        self.alignment_history.push(alignment)
         
         # Evaluate criteria (need at least 5 history points)
         if len(self.coherence_history) < 5:
             return {"awareness": self.awareness, "criteria_met": 0, "status": "warming_up"}
         
         # Criterion 1: Coherence increasing
-        recent_coh = list(self.coherence_history)[-5:]
-        coh_trend = (recent_coh[-1] - recent_coh[0]) / len(recent_coh)
+        coh_trend = self.coherence_history.trend()
         self.criteria_met["coherence"] = coh_trend > 0
         
         # Criterion 2: Divergence decreasing
-        recent_div = list(self.divergence_history)[-5:]
-        div_trend = (recent_div[-1] - recent_div[0]) / len(recent_div)
+        div_trend = self.divergence_history.trend()
         self.criteria_met["divergence"] = div_trend < 0
         
         # Criterion 3: Curvature flattening
-        recent_kappa = list(self.curvature_history)[-5:]
-        kappa_trend = (recent_kappa[-1] - recent_kappa[0]) / len(recent_kappa)
+        kappa_trend = self.curvature_history.trend()
         self.criteria_met["curvature"] = kappa_trend < 0
         
         # Criterion 4: Alignment improving
-        recent_align = list(self.alignment_history)[-5:]
-        align_trend = (recent_align[-1] - recent_align[0]) / len(recent_align)
+        align_trend = self.alignment_history.trend()
         self.criteria_met["alignment"] = align_trend > 0
         
         # Count met criteria
@@ -2100,19 +2512,30 @@ class ConsciousPredictor:
         }
         
         self.awareness_loop = AwarenessLoop2()
-        self.coherence_history: deque = deque(maxlen=50)
+        self.coherence_history = RollingTrend(5)
         self.corrections: int = 0
         
         # Pushforward for coherence monotonicity
         self.pushforward = PushforwardOperator()
+        
+        # Stage profiler, set by ASCPiEngine5.process (None: disabled)
+        self.profiler = None
     
     def predict(self, field: SemanticField, memory: SemanticMemory,
-                manifold: Optional[CurvatureManifold] = None) -> Tuple[SemanticField, Dict]:
+                manifold: Optional[CurvatureManifold] = None,
+                ops: Optional[Dict[str, FieldOperator]] = None) -> Tuple[SemanticField, Dict]:
         """
         Conscious prediction with awareness update.
         
+        ops overrides the operator set for this call (e.g. REBUILD's derived
+        damping); self-correction then adjusts those operators.
+        
         Returns (predicted_field, awareness_report)
         """
+        ops = ops or self.ops
+        prof = self.profiler
+        if prof is not None:
+            prof.begin("predict")
         attractor = memory.get_attractor()
         context = {
             "attractor": attractor,
@@ -2125,21 +2548,29 @@ class ConsciousPredictor:
         
         # Apply operator sequence: D → A → I → M → K
         for op_name in ['D', 'A', 'I', 'M', 'K']:
-            current = self.ops[op_name].apply(current, context)
+            if prof is not None:
+                prof.begin(op_name)
+            current = ops[op_name].apply(current, context)
+            if prof is not None:
+                prof.end()
         
         # Update coherence from memory
         current.coherence = memory.get_coherence()
         
         # Track coherence
-        self.coherence_history.append(current.coherence)
+        self.coherence_history.push(current.coherence)
         
         # Self-correction check
         if self._detect_divergence():
-            self._self_correct()
+            if prof is not None:
+                prof.begin("self_correct")
+            self._self_correct(ops)
             self.corrections += 1
             # Re-apply with corrected parameters
-            current = self.ops['D'].apply(field, context)
-            current = self.ops['M'].apply(current, context)
+            current = ops['D'].apply(field, context)
+            current = ops['M'].apply(current, context)
+            if prof is not None:
+                prof.end()
         
         # Apply pushforward for coherence monotonicity (INV-1)
         def identity(f):
@@ -2147,20 +2578,24 @@ class ConsciousPredictor:
         current = self.pushforward.apply(current, identity)
         
         # Update awareness loop
+        if prof is not None:
+            prof.begin("awareness")
         awareness_report = self.awareness_loop.update(current, attractor, memory)
+        if prof is not None:
+            prof.end()
+            prof.end()
         
         return current, awareness_report
     
     def _detect_divergence(self) -> bool:
         if len(self.coherence_history) < 5:
             return False
-        recent = list(self.coherence_history)[-5:]
-        trend = (recent[-1] - recent[0]) / len(recent)
-        return trend < -0.05
+        return self.coherence_history.trend() < -0.05
     
-    def _self_correct(self) -> None:
-        self.ops['D'].alpha = min(0.5, self.ops['D'].alpha * 1.1)
-        self.ops['M'].eta = min(0.5, self.ops['M'].eta * 1.1)
+    def _self_correct(self, ops: Optional[Dict[str, FieldOperator]] = None) -> None:
+        ops = ops or self.ops
+        ops['D'].alpha = min(0.5, ops['D'].alpha * 1.1)
+        ops['M'].eta = min(0.5, ops['M'].eta * 1.1)
     
     def get_awareness(self) -> float:
         return self.awareness_loop.awareness
@@ -2200,8 +2635,9 @@ class ForensicLogger:
         self.start_time: float = time.time()
         self.entry_count: int = 0
         
-        # Invariant violation tracking
-        self.invariant_violations: List[Dict] = []
+        # Invariant violation tracking (most recent; total in violation_count)
+        self.invariant_violations: deque = deque(maxlen=RETAIN_VIOLATIONS)
+        self.violation_count: int = 0
     
     def log_transition(self,
                        before: SemanticField,
@@ -2234,6 +2670,7 @@ class ForensicLogger:
         
         # Track violations
         if not entry["invariants"]["all_satisfied"]:
+            self.violation_count += 1
             self.invariant_violations.append({
                 "entry_id": self.entry_count,
                 "violations": entry["invariants"]["violations"]
@@ -2306,7 +2743,7 @@ class ForensicLogger:
             "session_id": self.session_id,
             "start_time": self.start_time,
             "entry_count": self.entry_count,
-            "invariant_violations": len(self.invariant_violations),
+            "invariant_violations": self.violation_count,
             "entries": list(self.entries)
         }, indent=2)
     
@@ -2315,7 +2752,7 @@ class ForensicLogger:
         return {
             "session_id": self.session_id,
             "entry_count": self.entry_count,
-            "violation_count": len(self.invariant_violations),
+            "violation_count": self.violation_count,
             "duration": time.time() - self.start_time
         }
     
@@ -2401,6 +2838,8 @@ class ASCPiEngine5:
         self.tpl = TemporalPhaseLogic()
         self.wcm = WorldCurvatureMatrix()
         self.resonance = ResonanceNetwork()
+        self.world_cache = WORLD_CACHE
+        self.profiler = None    # opt-in stage profiler: begin(name) / end() (ascpi.profile)
         
         # New v5.0 components
         self.coherence_fusion = CoherenceFusion()
@@ -2416,7 +2855,7 @@ class ASCPiEngine5:
         # State tracking
         self.current_field: Optional[SemanticField] = None
         self.code_field: Optional[SemanticField] = None
-        self.history: List[SemanticField] = []
+        self.history: deque = deque(maxlen=RETAIN_HISTORY)   # recent input fields
         self.step: int = 0
         
         # Unicode handling
@@ -2493,20 +2932,18 @@ class ASCPiEngine5:
         if not graphemes:
             return SemanticField(source_type=source_type), CurvatureManifold(0, [])
         
-        glyphs = [MeaningCarrier.from_grapheme(g, i, len(graphemes), source_type) 
-                  for i, g in enumerate(graphemes)]
-        fields = [g.field for g in glyphs]
-        manifold = CurvatureManifold.from_fields(fields)
+        glyphs = GlyphBuffer.from_graphemes(text, graphemes, source_type)
+        manifold = CurvatureManifold.from_fields(glyphs)
         
-        n = len(fields)
-        sin_sum = sum(math.sin(f.theta) for f in fields)
-        cos_sum = sum(math.cos(f.theta) for f in fields)
+        n = len(glyphs)
+        sin_sum = sum(math.sin(t) for t in glyphs.theta)
+        cos_sum = sum(math.cos(t) for t in glyphs.theta)
         
         result = SemanticField(
-            delta_phi=sum(f.delta_phi for f in fields) / n,
-            kappa=n / sum(1 / max(f.kappa, ε) for f in fields),
+            delta_phi=sum(glyphs.delta_phi) / n,
+            kappa=n / sum(1 / max(k, ε) for k in glyphs.kappa),
             theta=math.atan2(sin_sum, cos_sum) % τ,
-            energy=sum(f.energy for f in fields),
+            energy=sum(glyphs.energy),
             coherence=math.sqrt(sin_sum**2 + cos_sum**2) / n,
             source_type=source_type
         )
@@ -2561,11 +2998,16 @@ class ASCPiEngine5:
         
         # Reset pushforward floor for new processing
         self.pushforward.reset_floor()
+        prof = self.predictor.profiler = self.profiler
         
         # ═══════════════════════════════════════════════════════════════════
         # STAGE 1: ENCODING
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.begin("process")
+            prof.begin("encoding")
+        
         f_language, manifold_lang = self.encode_text(text, "language")
         self.current_field = f_language
         self.history.append(f_language.copy())
@@ -2591,10 +3033,14 @@ class ASCPiEngine5:
         # STAGE 2: WORLD CONTEXT
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("world_context")
+        
         world_field = None
         if world_context:
             for sid, (domain, txt) in world_context.items():
-                sf, _ = self.encode_text(txt, "world")
+                sf = self.world_cache.field(txt, self.encode_text)
                 self.wcm.add_source(sid, domain, sf)
             world_field = self.wcm.global_field
             result["world"] = self.wcm.to_dict()
@@ -2603,6 +3049,10 @@ class ASCPiEngine5:
         # STAGE 3: MULTIMODAL PROJECTION
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("multimodal_projection")
+        
         f_memory = self.memory.get_attractor()
         
         if f_code:
@@ -2622,6 +3072,10 @@ class ASCPiEngine5:
         # STAGE 4: COHERENCE FUSION
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("coherence_fusion")
+        
         c_language = f_language.coherence
         c_code = f_code.coherence if f_code else 0.5
         c_memory = f_memory.coherence
@@ -2646,6 +3100,10 @@ class ASCPiEngine5:
         # STAGE 5: MEMORY INTEGRATION + ATTRACTOR LEARNING
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("memory")
+        
         self.memory.integrate(f_multimodal, world_field)
         
         # Record for attractor learning
@@ -2661,11 +3119,17 @@ class ASCPiEngine5:
         # STAGE 6: FIELD EVOLUTION
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("evolution")
+        
         current = f_multimodal.copy()
         trajectory = []
         awareness_reports = []
         
         for step in range(max_steps):
+            if prof is not None:
+                prof.begin("step")
             before = current.copy()
             
             # Record temporal
@@ -2688,6 +3152,8 @@ class ASCPiEngine5:
                 "field": current.to_dict(),
                 "awareness": awareness_report["awareness"]
             })
+            if prof is not None:
+                prof.end()
             
             # Check convergence
             if current.coherence > COLLAPSE_THRESHOLD:
@@ -2705,6 +3171,10 @@ class ASCPiEngine5:
         # STAGE 7: MA'AT GOVERNOR
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("governor")
+        
         decision, judgment = self.governor.judge(
             f_language, current, world_field, self.history
         )
@@ -2713,22 +3183,32 @@ class ASCPiEngine5:
         
         # Handle rebuild if needed
         if decision == GovernorDecision.REBUILD:
-            old_alpha = self.predictor.ops['D'].alpha
-            self.predictor.ops['D'].alpha *= 1.5
+            if prof is not None:
+                prof.begin("rebuild")
+            # Stronger damping on a derived operator; the predictor's own D
+            # is never modified, so an exception cannot leave it boosted
+            D = self.predictor.ops['D']
+            rebuild_ops = {**self.predictor.ops, 'D': D.derive(alpha=D.alpha * 1.5)}
             
             for _ in range(10):
                 before = current.copy()
                 self.memory.integrate(current, world_field)
-                current, _ = self.predictor.predict(current, self.memory, manifold_lang)
+                current, _ = self.predictor.predict(current, self.memory, manifold_lang, rebuild_ops)
                 self.logger.log_transition(before, current, "REBUILD_STEP")
             
-            self.predictor.ops['D'].alpha = old_alpha
+            D.applications += rebuild_ops['D'].applications
             result["rebuilt"] = True
+            if prof is not None:
+                prof.end()
         
         # ═══════════════════════════════════════════════════════════════════
         # STAGE 8: RESONANCE
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("resonance")
+        
         self.agent.field = current.copy()
         resonance_result = self.resonance.broadcast(self.agent_id)
         
@@ -2741,6 +3221,10 @@ class ASCPiEngine5:
         # STAGE 9: OUTPUT
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("output")
+        
         self.current_field = current
         
         result["output"] = {
@@ -2761,9 +3245,28 @@ class ASCPiEngine5:
         
         # Forensic summary
         result["forensic"] = self.logger.get_summary()
+        if prof is not None:
+            prof.end()
+            prof.end()
         
         return result
     
+    def disambiguate(self, candidates: List[str],
+                     steps: int = QCB_BEAM_STEPS,
+                     beam_width: int = QCB_BEAM_WIDTH) -> Dict:
+        """Select the interpretation whose evolved field best satisfies Ma'at"""
+        fields = [self.encode_text(c, "interpretation")[0] for c in candidates]
+        sup = self.qcb.create(fields)
+        chosen = self.qcb.collapse_to_truth(sup, self.memory, self.predictor.ops,
+                                            steps, beam_width)
+        
+        return {
+            "selected": candidates[sup.origins[0]] if candidates else None,
+            "field": chosen.to_dict(),
+            "beam": [candidates[i] for i in sup.origins],
+            "amplitudes": sup.amplitudes
+        }
+    
     def get_full_forensic_log(self) -> str:
         """Export complete forensic log as JSON"""
         return self.logger.export_json()
@@ -2916,6 +3419,23 @@ def example():
     log_test("attractor_learning", engine.attractor_learner.update_count > 0,
              f"confidence={engine.attractor_learner.attractor_confidence:.3f}")
     
+    learner = GlobalAttractorLearner(reservoir_size=20)
+    peaks = []
+    for i in range(300):
+        state = SemanticField(delta_phi=0.1 * (i % 7), kappa=0.5 + 0.01 * (i % 13),
+                              theta=0.4 + 0.05 * math.sin(i), coherence=0.6 + 0.35 * ((i * 37) % 11) / 10)
+        learner.record_state(state)
+        if state.coherence > 0.8:
+            peaks.append(state)
+    d = learner.peak_decay
+    weights = [p.coherence * d ** (len(peaks) - 1 - k) for k, p in enumerate(peaks)]
+    want_kappa = sum(w * p.kappa for w, p in zip(weights, peaks)) / sum(weights)
+    log_test("attractor_bounded",
+             len(learner.operational_history) == 20 and learner.states_seen == 300 and
+             len(learner.phase_stability_windows) == 300 // ATTRACTOR_WINDOW and
+             abs(learner._compute_peak_average().kappa - want_kappa) < 1e-9,
+             f"{learner.peaks_seen} peaks, stability={learner.stability_score:.3f}")
+    
     # ─────────────────────────────────────────────────────────────────────
     # TEST 7: Awareness Loop 2.0
     # ─────────────────────────────────────────────────────────────────────
@@ -2956,6 +3476,30 @@ def example():
     log_test("awareness_in_output", "awareness_level" in result["output"],
              f"level={result['output'].get('awareness_level', 'N/A')}")
     
+    D = engine.predictor.ops['D']
+    alpha, n_rebuilt = D.alpha, 0
+    for i in range(12):
+        n_rebuilt += bool(engine.process(f"Rebuild probe {i} " + "chaos " * (i % 7)).get("rebuilt"))
+    boosted = D.derive(alpha=D.alpha * 1.5)
+    log_test("rebuild_derived_ops", n_rebuilt > 0 and D.alpha == alpha and engine.predictor.ops['D'] is D
+             and boosted.alpha == alpha * 1.5 and boosted.applications == 0,
+             f"{n_rebuilt} rebuilds, D.alpha={D.alpha:.3f}")
+
+    series = DecimatedSeries(8)
+    for i in range(100):
+        series.append(float(i))
+    gov = MaatGovernor(retain=5)
+    for i in range(12):
+        gov.judge(SemanticField(coherence=0.9), SemanticField(coherence=0.9), SemanticField())
+    world = WorldCurvatureMatrix()
+    for i in range(30):
+        world.add_source(f"s{i}", "a" if i % 2 else "b", SemanticField(theta=i * 0.1, coherence=0.5))
+    log_test("retention_bounded", len(series) <= 8 and series.seen == 100 and series.last == 99.0
+             and all(t == y for t, y in series.samples())
+             and len(gov.judgments) == 5 and gov.to_dict()["total_judgments"] == 12
+             and len(world.domains["a"]) == 15 and len(engine.history) <= RETAIN_HISTORY,
+             f"series={len(series)}/{series.seen} stride={series.stride}, judgments={len(gov.judgments)}")
+
     # ─────────────────────────────────────────────────────────────────────
     # TEST 9: Forensic Logging
     # ─────────────────────────────────────────────────────────────────────
@@ -3012,6 +3556,76 @@ def example():
         f, _ = engine.encode_text(text)
         log_test(f"unicode_{name}", f.energy > 0)
     
+    # ─────────────────────────────────────────────────────────────────────
+    # TEST 12: QCB Beam Evolution
+    # ─────────────────────────────────────────────────────────────────────
+    print("\n§12 QCB Beam Evolution")
+    
+    engine3 = ASCPiEngine5()
+    engine3.process("The bank was steep.")
+    interpretations = [
+        "The financial institution was expensive.",
+        "The river bank had a sharp incline.",
+        "The memory bank was difficult to access.",
+        "The aircraft banked sharply.",
+        "The blood bank ran low.",
+        "The snow bank was high."
+    ]
+    dis = engine3.disambiguate(interpretations, steps=3, beam_width=2)
+    log_test("qcb_beam_selection", dis["selected"] in interpretations,
+             f"selected: {dis['selected'][:30]}...")
+    log_test("qcb_beam_pruned", len(dis["beam"]) == 2 and abs(sum(dis["amplitudes"]) - 1) < 1e-9,
+             f"beam={len(dis['beam'])}")
+    
+    gen, snap = engine3.memory.attractor_snapshot()
+    frozen = snap.to_vector()
+    engine3.process("The bank was steep again.")
+    log_test("attractor_cow", snap.to_vector() == frozen and engine3.memory.generation > gen,
+             f"generation {gen} → {engine3.memory.generation}")
+    refused = 0
+    for shared in (snap, engine3.memory.get_attractor(), engine3.memory.attractor_snapshot()[1]):
+        try:
+            shared.coherence = 0.0
+        except FrozenInstanceError:
+            refused += 1
+    own = snap.copy()
+    own.coherence = 0.0
+    log_test("attractor_frozen", refused == 3 and snap.to_vector() == frozen and own.coherence == 0.0,
+             f"refused={refused}/3")
+    
+    wc_before = WORLD_CACHE.stats()
+    ctx = {"docs": ("domain", "Shared world context resent on every request.")}
+    engine3.process("World cache one.", world_context=ctx)
+    w_first = engine3.wcm.global_field
+    engine3.process("World cache two.", world_context=ctx)
+    wc_after = WORLD_CACHE.stats()
+    log_test("world_cache_hit", wc_after["hits"] > wc_before["hits"] and engine3.wcm.global_field is w_first,
+             f"hit_rate={wc_after['hit_rate']:.2f}")
+    
+    text = "Glyph buffer 你好 👨\u200d👩\u200d👧 🇪🇬 e\u0301 " * 3
+    graphemes = engine3._grapheme_split(text)
+    carriers = [MeaningCarrier.from_grapheme(g, i, len(graphemes)).field for i, g in enumerate(graphemes)]
+    buf = GlyphBuffer.from_graphemes(text, graphemes)
+    dense = CurvatureManifold.from_fields(carriers)
+    lazy = CurvatureManifold.from_fields(buf)
+    log_test("glyph_buffer_columns",
+             [f.to_vector() for f in carriers] == [f.to_vector() for f in buf] and
+             all(text[buf.starts[i]:].startswith(buf.symbol(i)) for i in range(len(buf))),
+             f"{len(buf)} glyphs, {len(buf.symbols)} interned")
+    log_test("glyph_buffer_lazy_manifold",
+             lazy.matrix.to_list() == dense.matrix and lazy.to_dict() == dense.to_dict(),
+             f"{buf.nbytes} bytes")
+    
+    trend, ys = RollingTrend(5), []
+    for i in range(30):
+        ys.append(math.cos(i * 1.1) + 0.05 * i)
+        trend.push(ys[-1])
+    mean = sum(ys[-5:]) / 5
+    log_test("rolling_trend",
+             list(trend) == ys[-5:] and trend.trend() == (ys[-1] - ys[-5]) / 5 and
+             abs(trend.variance() - sum((y - mean) ** 2 for y in ys[-5:]) / 5) < 1e-12,
+             f"trend={trend.trend():+.3f}")
+    
     # ─────────────────────────────────────────────────────────────────────
     # SUMMARY
     # ─────────────────────────────────────────────────────────────────────
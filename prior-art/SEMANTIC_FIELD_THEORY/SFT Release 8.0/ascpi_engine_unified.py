@@ -31,12 +31,20 @@ from __future__ import annotations
 import math
 import hashlib
 import json
+import os
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Any
 from collections import deque
 from enum import Enum
 
+try:
+    from ascpi.primitives import ContentCache, RollingTrend, StepControl
+except ImportError:   # source checkout run from the release directory: ascpi/ sits beside it
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ascpi.primitives import ContentCache, RollingTrend, StepControl
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSTANTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -65,6 +73,9 @@ COLLAPSE_C = 0.85
 AWARENESS_GROWTH = 0.015
 AWARENESS_DECAY = 0.005
 
+# Retention
+RETAIN_JUDGMENTS = 1000   # Governor judgments kept (ring)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SEMANTIC FIELD — Ψ = (ΔΦ, κ, θ, N, C)
@@ -156,6 +167,12 @@ class UnifiedTensor:
         self.α, self.β, self.γ, self.η, self.K = α, β, γ, η, K
         self.apps = 0
     
+    def derive(self, **overrides) -> 'UnifiedTensor':
+        """Per-call copy with some parameters overridden (self is untouched)"""
+        p = {'α': self.α, 'β': self.β, 'γ': self.γ, 'η': self.η, 'K': self.K}
+        p.update(overrides)
+        return UnifiedTensor(**p)
+    
     def __call__(self, ψ: Ψ, attractor: Ψ, M_inf: Ψ, world: Optional[Ψ] = None,
                  C_grad: float = 0.0) -> Ψ:
         """
@@ -307,11 +324,11 @@ class AwarenessField:
         self.growth = AWARENESS_GROWTH
         self.decay = AWARENESS_DECAY
         
-        # Tracking
-        self.C_history: deque = deque(maxlen=20)
-        self.div_history: deque = deque(maxlen=20)
-        self.κ_history: deque = deque(maxlen=20)
-        self.align_history: deque = deque(maxlen=20)
+        # Tracking (criteria use the last 5 values)
+        self.C_history = RollingTrend(5)
+        self.div_history = RollingTrend(5)
+        self.κ_history = RollingTrend(5)
+        self.align_history = RollingTrend(5)
     
     def update(self, ψ: Ψ, M_inf: Ψ) -> Dict:
         """
@@ -324,10 +341,10 @@ class AwarenessField:
         - N_a ↑ when all criteria met
         """
         # Record metrics
-        self.C_history.append(ψ.C)
-        self.div_history.append(ψ.dist(M_inf))
-        self.κ_history.append(ψ.κ)
-        self.align_history.append(ψ.inner(M_inf))
+        self.C_history.push(ψ.C)
+        self.div_history.push(ψ.dist(M_inf))
+        self.κ_history.push(ψ.κ)
+        self.align_history.push(ψ.inner(M_inf))
         
         if len(self.C_history) < 3:
             # Still warming but allow growth based on absolute values
@@ -337,16 +354,10 @@ class AwarenessField:
             return {"awareness": self.field.C, "level": self._level(), "warming": True}
         
         # Compute criteria from trends (use shorter window)
-        window = min(len(self.C_history), 5)
-        recent_C = list(self.C_history)[-window:]
-        recent_div = list(self.div_history)[-window:]
-        recent_κ = list(self.κ_history)[-window:]
-        recent_align = list(self.align_history)[-window:]
-        
-        C_trend = (recent_C[-1] - recent_C[0]) / window
-        div_trend = (recent_div[-1] - recent_div[0]) / window
-        κ_trend = (recent_κ[-1] - recent_κ[0]) / window
-        align_trend = (recent_align[-1] - recent_align[0]) / window
+        C_trend = self.C_history.trend()
+        div_trend = self.div_history.trend()
+        κ_trend = self.κ_history.trend()
+        align_trend = self.align_history.trend()
         
         # Count satisfied criteria (also consider absolute values)
         criteria = {
@@ -474,10 +485,11 @@ class Governor(Enum):
 class MaatGovernor:
     """Ma'at-based decision making"""
     
-    def __init__(self, threshold: float = MAAT_THRESHOLD):
+    def __init__(self, threshold: float = MAAT_THRESHOLD, retain: int = RETAIN_JUDGMENTS):
         self.threshold = threshold
         self.current = 0.5
-        self.judgments: List[Dict] = []
+        self.judgments: deque = deque(maxlen=retain)   # most recent
+        self.total = 0
     
     def judge(self, ψ_in: Ψ, ψ_out: Ψ, world: Optional[Ψ] = None) -> Tuple[Governor, Dict]:
         """Evaluate transformation against Ma'at"""
@@ -507,6 +519,7 @@ class MaatGovernor:
         
         judgment["decision"] = decision.value
         self.judgments.append(judgment)
+        self.total += 1
         
         return decision, judgment
 
@@ -705,6 +718,19 @@ class Encoder:
 # WORLD CURVATURE — Simplified
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class WorldCache(ContentCache):
+    """
+    Content-addressed LRU of encoded world sources, shared by all engines:
+    blake2b(text) → Ψ. Cached Ψ are shared and must be treated as read-only.
+    """
+    
+    def field(self, text: str) -> Ψ:
+        return self._get(self.digest(text), lambda: Encoder.encode_text(text, "world"))
+
+
+WORLD_CACHE = WorldCache()
+
+
 class WorldCurvature:
     """Global field aggregation"""
     
@@ -716,6 +742,17 @@ class WorldCurvature:
         self.sources[sid] = ψ
         self._update()
     
+    def merge(self, world: Dict[str, str], cache: WorldCache) -> None:
+        """Add/replace {sid: text} sources; re-aggregate only if a source changed"""
+        changed = False
+        for sid, text in world.items():
+            ψ = cache.field(text)
+            if self.sources.get(sid) is not ψ:
+                self.sources[sid] = ψ
+                changed = True
+        if changed:
+            self._update()
+    
     def _update(self) -> None:
         if not self.sources:
             return
@@ -777,11 +814,16 @@ class InvariantEnforcer:
     - INV-3: Energy conserved  
     - INV-4: Phase continuous
     - INV-5: Ma'at improves
+    
+    `clamps` counts the corrections applied per invariant since reset().
     """
     
+    INVARIANTS = ("coherence", "curvature", "energy", "phase", "maat")
+    
     def __init__(self):
         self.C_floor = 0.0
         self.prev_maat = float('inf')
+        self.clamps = dict.fromkeys(self.INVARIANTS, 0)
     
     def enforce(self, ψ_before: Ψ, ψ_after: Ψ, maat: float) -> Ψ:
         """Apply all invariant constraints"""
@@ -789,16 +831,21 @@ class InvariantEnforcer:
         
         # INV-1: Coherence floor
         self.C_floor = max(self.C_floor, ψ_before.C - 0.1)
-        result.C = max(result.C, self.C_floor)
+        if result.C < self.C_floor:
+            result.C = self.C_floor
+            self.clamps["coherence"] += 1
         
         # INV-2: Curvature bounds (already in _enforce)
-        result.κ = max(κ_MIN, min(κ_MAX, result.κ))
+        if not κ_MIN <= result.κ <= κ_MAX:
+            result.κ = max(κ_MIN, min(κ_MAX, result.κ))
+            self.clamps["curvature"] += 1
         
         # INV-3: Energy conservation
         if ψ_before.N > ε:
             ratio = result.N / ψ_before.N
             if abs(ratio - 1) > ENERGY_δ:
                 result.N = ψ_before.N * (1 + ENERGY_δ * (1 if ratio > 1 else -1))
+                self.clamps["energy"] += 1
         
         # INV-4: Phase continuity
         Δθ = abs(result.θ - ψ_before.θ)
@@ -807,11 +854,13 @@ class InvariantEnforcer:
         if Δθ > PHASE_MAX:
             direction = 1 if result.θ > ψ_before.θ else -1
             result.θ = (ψ_before.θ + direction * PHASE_MAX) % τ
+            self.clamps["phase"] += 1
         
         # INV-5: Ma'at improvement (soft)
         if maat > self.prev_maat * 1.2:
             # Ma'at degraded too much — dampen changes
             result = ψ_before.blend(result, 0.7)
+            self.clamps["maat"] += 1
         self.prev_maat = maat
         
         return result._enforce()
@@ -819,6 +868,7 @@ class InvariantEnforcer:
     def reset(self):
         self.C_floor = 0.0
         self.prev_maat = float('inf')
+        self.clamps = dict.fromkeys(self.INVARIANTS, 0)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -837,6 +887,7 @@ class Result:
     steps: int
     signature: str
     forensic_count: int
+    truncated: bool = False
     
     def to_dict(self) -> Dict:
         return {
@@ -847,7 +898,8 @@ class Result:
             "awareness_level": self.awareness_level,
             "governor": self.governor,
             "steps": self.steps,
-            "signature": self.signature
+            "signature": self.signature,
+            "truncated": self.truncated
         }
 
 
@@ -865,6 +917,8 @@ class ASCPI:
         print(result.output)
     """
     
+    metrics = None    # process-wide metrics sink: record(...) once per process() (ascpi_metrics_v10)
+    
     def __init__(self, agent_id: str = "ascpi_8"):
         # Core components
         self.tensor = UnifiedTensor()
@@ -876,21 +930,34 @@ class ASCPI:
         self.world = WorldCurvature()
         self.enforcer = InvariantEnforcer()
         self.log = ForensicLog()
+        self.world_cache = WORLD_CACHE
         
         self.agent_id = agent_id
         self.step = 0
         self.current: Optional[Ψ] = None
+        self.profiler = None    # opt-in stage profiler: begin(name) / end() (ascpi.profile)
     
     def process(self, text: str, code: Optional[str] = None,
                 world: Optional[Dict[str, str]] = None,
-                max_steps: int = 25) -> Result:
+                max_steps: int = 25, deadline_ms: Optional[float] = None,
+                tol: Optional[float] = None) -> Result:
         """
         Main processing pipeline.
         
         Ψ(t+1) = T(Ψ(t), A, M∞, W) + ∇C_fused
+        
+        deadline_ms / tol: see StepControl.
         """
+        t0 = time.perf_counter()
+        apps = self.tensor.apps
         self.step += 1
         self.enforcer.reset()
+        ctl = StepControl(deadline_ms, tol)
+        prof = self.profiler
+        rebuild_steps = 0
+        if prof is not None:
+            prof.begin("process")
+            prof.begin("encoding")
         
         # ═══════════════════════════════════════════════════════════════════
         # ENCODE
@@ -903,16 +970,21 @@ class ASCPI:
         # WORLD CONTEXT
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("world_context")
         ψ_world = None
         if world:
-            for sid, txt in world.items():
-                self.world.add(sid, Encoder.encode_text(txt, "world"))
+            self.world.merge(world, self.world_cache)
             ψ_world = self.world.get()
         
         # ═══════════════════════════════════════════════════════════════════
         # MULTIMODAL PROJECTION
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("multimodal_projection")
         ψ_mem = self.memory.attractor()
         ψ_aware = self.awareness.get()
         
@@ -923,10 +995,17 @@ class ASCPI:
         # EVOLUTION LOOP
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("evolution")
         trajectory = []
         attractor = ψ_mem
         
         for step in range(max_steps):
+            if ctl.expired():
+                break
+            if prof is not None:
+                prof.begin("step")
             before = current.copy()
             
             # Coherence gradient force
@@ -961,40 +1040,59 @@ class ASCPI:
             self.log.log(current, "tensor", maat_val, ψ_aware)
             
             trajectory.append({"step": step, "C": current.C, "maat": maat_val})
+            if prof is not None:
+                prof.end()
             
             # Convergence check
-            if current.C > COLLAPSE_C:
+            if current.C > COLLAPSE_C or ctl.settled(before, current, maat_val):
                 break
+        current = ctl.output(current)
         
         # ═══════════════════════════════════════════════════════════════════
         # GOVERNOR CHECK
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("governor")
         decision, judgment = self.governor.judge(ψ_lang, current, ψ_world)
         
         if decision == Governor.REBUILD:
-            # Extra evolution with stronger damping
-            old_α = self.tensor.α
-            self.tensor.α *= 1.5
+            if prof is not None:
+                prof.begin("rebuild")
+            # Extra evolution with stronger damping (per-call tensor)
+            rebuild = self.tensor.derive(α=self.tensor.α * 1.5)
+            ctl.restart()
             for _ in range(10):
+                if ctl.expired():
+                    break
                 before = current.copy()
                 C_grad, _ = self.fusion.compute_gradient(C_lang, C_code, C_mem, C_aware)
-                current = self.tensor(current, attractor, ψ_mem, ψ_world, C_grad)
+                current = rebuild(current, attractor, ψ_mem, ψ_world, C_grad)
                 self.memory.absorb(current, ψ_world)
                 current.C = self.memory.get_coherence()
                 maat_val = self.maat(current, ψ_mem)
                 current = self.enforcer.enforce(before, current, maat_val)
-            self.tensor.α = old_α
+                if ctl.settled(before, current, maat_val):
+                    break
+            self.tensor.apps += rebuild.apps
+            rebuild_steps = rebuild.apps
+            current = ctl.output(current)
+            if prof is not None:
+                prof.end()
         
         # ═══════════════════════════════════════════════════════════════════
         # RESULT
         # ═══════════════════════════════════════════════════════════════════
         
+        if prof is not None:
+            prof.end()
+            prof.begin("output")
         self.current = current
         
         sig = hashlib.sha256(str(current.vec()).encode()).hexdigest()[:8]
         
-        return Result(
+        result = Result(
             output=current,
             coherence=current.C,
             maat=self.governor.current,
@@ -1003,8 +1101,16 @@ class ASCPI:
             governor=decision.value,
             steps=len(trajectory),
             signature=sig,
-            forensic_count=self.log.count
+            forensic_count=self.log.count,
+            truncated=ctl.truncated
         )
+        if prof is not None:
+            prof.end()
+            prof.end()
+        if self.metrics is not None:
+            self.metrics.record("v8", time.perf_counter() - t0, len(trajectory), current.C, decision.value,
+                                rebuild_steps, self.tensor.apps - apps, self.enforcer.clamps)
+        return result
     
     def export_log(self) -> str:
         """Export forensic log as JSON"""
@@ -1108,6 +1214,46 @@ def verify() -> Dict:
     log_json = engine.export_log()
     test("forensic_log", "log" in log_json and engine.log.count > 0, f"entries={engine.log.count}")
     
+    # 10. Deadline & adaptive termination
+    print("\n§10 Deadline")
+    r_cut = ASCPI().process("Deadline test.", deadline_ms=0)
+    r_full = ASCPI().process("Deadline test.")
+    r_tol = ASCPI().process("Deadline test.", tol=1e-3)
+    test("deadline_truncates", r_cut.truncated and r_cut.steps == 0 and not r_full.truncated,
+         f"C={r_cut.coherence:.3f}")
+    test("tol_stops_early", r_tol.steps <= r_full.steps and not r_tol.truncated,
+         f"steps {r_tol.steps}/{r_full.steps}")
+    
+    # 11. World cache
+    print("\n§11 World cache")
+    ctx = {"docs": "Shared world context resent on every request."}
+    hits = WORLD_CACHE.hits
+    e_cached, e_plain = ASCPI(), ASCPI()
+    e_plain.world_cache = WorldCache(max_entries=0)
+    sigs = [e_cached.process(f"Turn {i}.", world=ctx).signature for i in range(3)]
+    plain = [e_plain.process(f"Turn {i}.", world=ctx).signature for i in range(3)]
+    test("world_cache", WORLD_CACHE.hits >= hits + 2 and sigs == plain,
+         f"hit_rate={WORLD_CACHE.stats()['hit_rate']:.2f}")
+    
+    # 12. Rolling trend
+    print("\n§12 Rolling trend")
+    ρ, ys = RollingTrend(5), []
+    for i in range(30):
+        ys.append(math.cos(i * 1.1) + 0.05 * i)
+        ρ.push(ys[-1])
+    μ = sum(ys[-5:]) / 5
+    test("rolling_trend", list(ρ) == ys[-5:] and ρ.trend() == (ys[-1] - ys[-5]) / 5 and
+         abs(ρ.variance() - sum((y - μ) ** 2 for y in ys[-5:]) / 5) < 1e-12,
+         f"trend={ρ.trend():+.3f}")
+
+    # 13. Retention
+    print("\n§13 Retention")
+    gov = MaatGovernor(retain=4)
+    for i in range(10):
+        gov.judge(Encoder.encode_text(f"retain {i}"), Encoder.encode_text(f"retain {i + 1}"))
+    test("governor_ring", len(gov.judgments) == 4 and gov.total == 10,
+         f"kept={len(gov.judgments)}/{gov.total}")
+
     # Summary
     print()
     print("=" * 60)
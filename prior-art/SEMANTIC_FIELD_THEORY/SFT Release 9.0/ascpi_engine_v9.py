@@ -38,11 +38,23 @@ from __future__ import annotations
 import math
 import hashlib
 import json
+import mmap
+import os
+import struct
+import sys
 import time
-from dataclasses import dataclass, field
+import unicodedata
+from dataclasses import FrozenInstanceError, dataclass, field
 from typing import List, Dict, Optional, Tuple, Any
 from collections import deque
 from enum import Enum
+from types import MappingProxyType
+
+try:
+    from ascpi.primitives import ContentCache, PhasorSum, RollingTrend, StepControl
+except ImportError:   # source checkout run from the release directory: ascpi/ sits beside it
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from ascpi.primitives import ContentCache, PhasorSum, RollingTrend, StepControl
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # §0 CONSTANTS — Physical parameters of the semantic field
@@ -143,6 +155,40 @@ class Ψ:
                 "θ": round(self.θ, 6), "N": round(self.N, 6), "C": round(self.C, 6)}
 
 
+class FrozenΨ(Ψ):
+    """
+    Read-only Ψ for published snapshots (M∞, learned limit cycles).
+    
+    Writes raise FrozenInstanceError; copy() returns a mutable Ψ.
+    """
+    
+    def __init__(self, *args, **kw):
+        self.__dict__.update(Ψ(*args, **kw).__dict__)
+    
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r} of a published Ψ")
+    
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r} of a published Ψ")
+    
+    def __eq__(self, o):
+        return isinstance(o, Ψ) and (self.vec(), self.t, self.src) == (o.vec(), o.t, o.src)
+    
+    __hash__ = None
+    
+    def _enforce(self) -> Ψ:
+        return self   # bounds were enforced before publishing
+
+
+def freeze(ψ: Ψ) -> FrozenΨ:
+    """FrozenΨ with ψ's values (ψ itself if already frozen)"""
+    if type(ψ) is FrozenΨ:
+        return ψ
+    f = object.__new__(FrozenΨ)
+    f.__dict__.update(ψ.__dict__)
+    return f
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # §2 AWARENESS FIELD — Consciousness as a field, not scalar
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -168,10 +214,10 @@ class AwarenessField:
         self.field = Ψ(ΔΦ=0.05, κ=0.2, θ=0, N=0.1, C=0.1, src="Ψ_a")
         
         # Trend buffers
-        self._C = deque(maxlen=20)
-        self._κ = deque(maxlen=20)
-        self._div = deque(maxlen=20)
-        self._align = deque(maxlen=20)
+        self._C = RollingTrend(20)
+        self._κ = RollingTrend(20)
+        self._div = RollingTrend(20)
+        self._align = RollingTrend(20)
     
     def evolve(self, ψ: Ψ, M_inf: Ψ, W: Optional[Ψ] = None) -> Ψ:
         """
@@ -185,18 +231,18 @@ class AwarenessField:
         5. Returns phase-stabilized Ψ_main
         """
         # Record trends
-        self._C.append(ψ.C)
-        self._κ.append(ψ.κ)
-        self._div.append(ψ.dist(M_inf))
-        self._align.append(ψ.inner(M_inf))
+        self._C.push(ψ.C)
+        self._κ.push(ψ.κ)
+        self._div.push(ψ.dist(M_inf))
+        self._align.push(ψ.inner(M_inf))
         
         # Compute trends
         n = len(self._C)
         if n >= 3:
-            C_trend = (self._C[-1] - self._C[0]) / n
-            κ_trend = (self._κ[-1] - self._κ[0]) / n
-            div_trend = (self._div[-1] - self._div[0]) / n
-            align_trend = (self._align[-1] - self._align[0]) / n
+            C_trend = self._C.trend()
+            κ_trend = self._κ.trend()
+            div_trend = self._div.trend()
+            align_trend = self._align.trend()
         else:
             C_trend = κ_trend = div_trend = align_trend = 0.0
         
@@ -264,13 +310,36 @@ class MemoryField:
     - Non-linear absorption
     - Multimodal fusion
     - Guaranteed coherence increase
+    
+    Copy-on-write: every absorb() publishes a fresh M∞ together with a
+    generation counter in a single reference swap. Published snapshots are
+    FrozenΨ, so readers (dashboards, monitors) hold them lock-free; a caller
+    that wants to edit one takes copy() first.
     """
     
     def __init__(self):
-        self.M_inf = Ψ(ΔΦ=0.0, κ=0.5, θ=0, N=0.5, C=0.5, src="M∞")
+        self._snap: Tuple[int, FrozenΨ] = (0, FrozenΨ(ΔΦ=0.0, κ=0.5, θ=0, N=0.5, C=0.5, src="M∞"))
         self._history: deque = deque(maxlen=100)
         self._C_floor = 0.0
-        self._limit_cycle: Optional[Ψ] = None
+        self._limit_cycle: Optional[FrozenΨ] = None
+    
+    @property
+    def M_inf(self) -> FrozenΨ:
+        return self._snap[1]
+    
+    @M_inf.setter
+    def M_inf(self, ψ: Ψ) -> None:
+        """Publish a new version (the old one stays valid for its holders)"""
+        self._snap = (self._snap[0] + 1, freeze(ψ))
+    
+    @property
+    def generation(self) -> int:
+        """Bumped on every publish — use as a cache-invalidation key"""
+        return self._snap[0]
+    
+    def snapshot(self) -> Tuple[int, FrozenΨ]:
+        """Consistent (generation, M∞) pair; the Ψ is shared and frozen"""
+        return self._snap
     
     def absorb(self, ψ: Ψ, rate: float = 0.2) -> None:
         """
@@ -278,36 +347,43 @@ class MemoryField:
         
         Information flow: Ψ → M∞ with limit cycle detection
         """
+        M = self.M_inf
+        
         # Non-linear absorption (tanh-weighted)
         weight = math.tanh(ψ.C * 2) * rate  # Higher C → stronger absorption
         
-        # Blend into M∞
-        sin_b = (1 - weight) * math.sin(self.M_inf.θ) + weight * math.sin(ψ.θ)
-        cos_b = (1 - weight) * math.cos(self.M_inf.θ) + weight * math.cos(ψ.θ)
+        # Blend into a new M∞ version
+        sin_b = (1 - weight) * math.sin(M.θ) + weight * math.sin(ψ.θ)
+        cos_b = (1 - weight) * math.cos(M.θ) + weight * math.cos(ψ.θ)
         
-        self.M_inf.ΔΦ = (1 - weight) * self.M_inf.ΔΦ + weight * ψ.ΔΦ * 0.9  # Tension decay
-        self.M_inf.κ = (1 - weight) * self.M_inf.κ + weight * ψ.κ * 0.95    # Curvature smoothing
-        self.M_inf.θ = math.atan2(sin_b, cos_b) % τ
-        self.M_inf.N = (1 - weight) * self.M_inf.N + weight * ψ.N
+        h = Ψ(
+            ΔΦ=(1 - weight) * M.ΔΦ + weight * ψ.ΔΦ * 0.9,   # Tension decay
+            κ=(1 - weight) * M.κ + weight * ψ.κ * 0.95,     # Curvature smoothing
+            θ=math.atan2(sin_b, cos_b) % τ,
+            N=(1 - weight) * M.N + weight * ψ.N,
+            C=M.C, t=M.t, src=M.src
+        )
         
-        # Track history
-        self._history.append(self.M_inf.copy())
+        # Track history (snapshots are immutable, so no copy)
+        self._history.append(h)
         
         # Update coherence from phase alignment (Kuramoto order parameter)
+        C = M.C
         if len(self._history) >= 3:
-            phases = [h.θ for h in self._history]
+            phases = [x.θ for x in self._history]
             sin_s = sum(math.sin(t) for t in phases)
             cos_s = sum(math.cos(t) for t in phases)
             r = math.sqrt(sin_s**2 + cos_s**2) / len(phases)
             
             # Coherence floor (INV-1)
             self._C_floor = max(self._C_floor - 0.001, r - 0.05)  # Slight decay
-            self.M_inf.C = max(r, self._C_floor, self.M_inf.C * 0.99)
+            C = max(r, self._C_floor, M.C * 0.99)
+        
+        # Publish
+        self.M_inf = h if C == h.C else Ψ(h.ΔΦ, h.κ, h.θ, h.N, C, h.t, h.src)
         
         # Limit cycle detection
         self._detect_limit_cycle()
-        
-        self.M_inf._enforce()
     
     def _detect_limit_cycle(self) -> None:
         """Detect and learn limit cycles in phase space"""
@@ -326,7 +402,7 @@ class MemoryField:
             avg_θ = math.atan2(sin_s, cos_s) % τ
             avg_κ = sum(h.κ for h in recent) / len(recent)
             
-            self._limit_cycle = Ψ(
+            self._limit_cycle = FrozenΨ(
                 ΔΦ=sum(h.ΔΦ for h in recent) / len(recent),
                 κ=avg_κ,
                 θ=avg_θ,
@@ -348,11 +424,12 @@ class MemoryField:
         for w, s in zip(weights, sources):
             self.absorb(s, rate=w * 0.3)
     
-    def attractor(self) -> Ψ:
-        """Return the current attractor (limit cycle if found, else M∞)"""
-        if self._limit_cycle and self._limit_cycle.C > self.M_inf.C:
-            return self._limit_cycle.copy()
-        return self.M_inf.copy()
+    def attractor(self) -> FrozenΨ:
+        """Current attractor (limit cycle if found, else M∞) — shared and frozen"""
+        M, cycle = self.M_inf, self._limit_cycle
+        if cycle and cycle.C > M.C:
+            return cycle
+        return M
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -378,9 +455,16 @@ class UnifiedTensorKernel:
     """
     
     def __init__(self, params: Dict = KERNEL):
-        self.p = params
+        # Frozen per-kernel copy (engines never share a mutable dict); the
+        # coefficients are also bound once for __call__
+        self.p = MappingProxyType({**KERNEL, **params})
+        self._coef = (self.p['α'], self.p['β'], self.p['γ'], self.p['η'], self.p['K'])
         self.n_calls = 0
     
+    def derive(self, **overrides) -> 'UnifiedTensorKernel':
+        """Per-call kernel with some parameters overridden (self.p is untouched)"""
+        return UnifiedTensorKernel({**self.p, **overrides})
+    
     def __call__(self, ψ: Ψ, A: Ψ, M_inf: Ψ, W: Optional[Ψ], grad_C: float) -> Ψ:
         """
         Apply the unified tensor evolution.
@@ -388,6 +472,7 @@ class UnifiedTensorKernel:
         grad_C is the coherence gradient force ∇C (computed externally).
         """
         self.n_calls += 1
+        α, β, γ, η, K = self._coef
         
         # Target: blend of attractor and memory
         target = A.blend(M_inf, 0.6)
@@ -395,24 +480,24 @@ class UnifiedTensorKernel:
             target = target.blend(W, 0.85)
         
         # 1. DAMPING — curvature relaxation toward target
-        new_κ = ψ.κ - self.p['α'] * (ψ.κ - target.κ)
+        new_κ = ψ.κ - α * (ψ.κ - target.κ)
         
         # 2. AMPLIFICATION — energy from coherence
-        new_N = ψ.N + self.p['β'] * ψ.C
+        new_N = ψ.N + β * ψ.C
         
         # 3. IMPLOSION — tension collapse when coherent
-        new_ΔΦ = ψ.ΔΦ * (1 - self.p['γ'] * ψ.C**2) if ψ.C > 0.6 else ψ.ΔΦ
+        new_ΔΦ = ψ.ΔΦ * (1 - γ * ψ.C**2) if ψ.C > 0.6 else ψ.ΔΦ
         
         # 4. MEMORY COUPLING — pull toward M∞
-        new_ΔΦ += self.p['η'] * (M_inf.ΔΦ - new_ΔΦ)
-        new_κ += self.p['η'] * (M_inf.κ - new_κ)
-        new_N += self.p['η'] * (M_inf.N - new_N)
+        new_ΔΦ += η * (M_inf.ΔΦ - new_ΔΦ)
+        new_κ += η * (M_inf.κ - new_κ)
+        new_N += η * (M_inf.N - new_N)
         
         # 5. PHASE ALIGNMENT — Kuramoto synchronization
         Δθ = target.θ - ψ.θ
         if Δθ > π: Δθ -= τ
         elif Δθ < -π: Δθ += τ
-        phase_shift = self.p['K'] * math.sin(Δθ)
+        phase_shift = K * math.sin(Δθ)
         phase_shift = max(-PHASE_MAX, min(PHASE_MAX, phase_shift))  # INV-4
         new_θ = (ψ.θ + phase_shift) % τ
         
@@ -488,6 +573,19 @@ class CoherenceForce:
 # §6 WORLD CURVATURE — External field aggregation
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class WorldCache(ContentCache):
+    """
+    Content-addressed LRU of encoded world sources, shared by all engines:
+    blake2b(text) → Ψ. Cached Ψ are shared and must be treated as read-only.
+    """
+    
+    def field(self, text: str) -> Ψ:
+        return self._get(self.digest(text), lambda: Encoder.text(text, "world"))
+
+
+WORLD_CACHE = WorldCache()
+
+
 class WorldCurvature:
     """Global world field from external sources"""
     
@@ -499,6 +597,17 @@ class WorldCurvature:
         self.sources[sid] = ψ
         self._update()
     
+    def merge(self, world: Dict[str, str], cache: WorldCache) -> None:
+        """Add/replace {sid: text} sources; re-aggregate only if a source changed"""
+        changed = False
+        for sid, text in world.items():
+            ψ = cache.field(text)
+            if self.sources.get(sid) is not ψ:
+                self.sources[sid] = ψ
+                changed = True
+        if changed:
+            self._update()
+    
     def _update(self) -> None:
         if not self.sources:
             self.field = None
@@ -585,10 +694,41 @@ class Encoder:
             clusters.append(''.join(current))
         return clusters
     
+    @classmethod
+    def glyph_terms(cls, g: str) -> Tuple[float, float, float, float]:
+        """
+        Position-free terms of one glyph: (θ base, κ, ΔΦ, N).
+        The glyph phase is θ_g = (θ base + (i/n)·τ/2) mod τ.
+        """
+        cps = [ord(c) for c in g]
+        primary = cps[0]
+        complexity = len(cps)
+        
+        # Phase from golden ratio mapping
+        θ_base = (primary // 256) * φ + (primary % 256) / 256 * τ
+        
+        # Curvature from category
+        try:
+            cat = unicodedata.category(g[0])[0]
+        except:
+            cat = 'L'
+        κ_g = cls._κ_MAP.get(cat, 0.3) * (1 + 0.15 * complexity)
+        
+        # Tension from semantic distance
+        ΔΦ_g = abs(primary - 0x4E00) / 0x10FFFF
+        
+        # Energy from information
+        N_g = math.log(1 + sum(cps)) / math.log(0x10FFFF + 1) * (1 + 0.25 * complexity)
+        return θ_base, κ_g, ΔΦ_g, N_g
+    
+    @classmethod
+    def text_terms(cls, text: str) -> List[Tuple[float, float, float, float]]:
+        """glyph_terms of every grapheme of text, in order"""
+        return [cls.glyph_terms(g) for g in cls.graphemes(text)]
+    
     @classmethod
     def text(cls, text: str, src: str = "lang") -> Ψ:
         """Encode text as semantic field"""
-        import unicodedata
         glyphs = cls.graphemes(text)
         if not glyphs:
             return Ψ(src=src)
@@ -598,27 +738,13 @@ class Encoder:
         sin_s = cos_s = 0.0
         
         for i, g in enumerate(glyphs):
-            cps = [ord(c) for c in g]
-            primary = cps[0]
-            complexity = len(cps)
-            
-            # Phase from golden ratio mapping
-            θ_g = ((primary // 256) * φ + (primary % 256) / 256 * τ + (i / n) * τ / 2) % τ
+            θ_base, κ_g, ΔΦ_g, N_g = cls.glyph_terms(g)
+            θ_g = (θ_base + (i / n) * τ / 2) % τ
             sin_s += math.sin(θ_g)
             cos_s += math.cos(θ_g)
-            
-            # Curvature from category
-            try:
-                cat = unicodedata.category(g[0])[0]
-            except:
-                cat = 'L'
-            κ_sum += cls._κ_MAP.get(cat, 0.3) * (1 + 0.15 * complexity)
-            
-            # Tension from semantic distance
-            ΔΦ_sum += abs(primary - 0x4E00) / 0x10FFFF
-            
-            # Energy from information
-            N_sum += math.log(1 + sum(cps)) / math.log(0x10FFFF + 1) * (1 + 0.25 * complexity)
+            κ_sum += κ_g
+            ΔΦ_sum += ΔΦ_g
+            N_sum += N_g
         
         return Ψ(
             ΔΦ=ΔΦ_sum / n,
@@ -649,6 +775,75 @@ class Encoder:
         return ψ._enforce()
 
 
+class IncrementalEncoder:
+    """
+    Encoder.text for append-only streams (chat transcripts): an append costs
+    what the new text costs, not the whole transcript.
+    
+    ΔΦ/κ/N sums are exact; phasors go through PhasorSum. The last grapheme
+    stays pending, since appended marks/ZWJ/RI can still extend it.
+    
+        enc = IncrementalEncoder()
+        ψ = enc.sync(transcript)     # encodes only the unseen suffix
+    """
+    
+    def __init__(self, src: str = "lang"):
+        self.src = src
+        self.reset()
+    
+    def reset(self) -> None:
+        self._ΔΦ = self._κ = self._N = 0.0
+        self._ph = PhasorSum(π, lambda i, n: (i / n) * τ / 2)
+        self._pending = ""                  # raw text from the last grapheme on
+        self._last: Optional[Tuple] = None  # its glyph terms
+        self._text: Optional[str] = None
+    
+    @property
+    def n(self) -> int:
+        return self._ph.n + (self._last is not None)
+    
+    def append(self, text: str) -> None:
+        self._text = None   # direct appends end sync() prefix tracking
+        raw = self._pending + text
+        glyphs = Encoder.graphemes(raw)
+        if not glyphs:
+            self._pending, self._last = "", None
+            return
+        for g in glyphs[:-1]:
+            θ_base, κ_g, ΔΦ_g, N_g = Encoder.glyph_terms(g)
+            self._ph.add(θ_base)
+            self._κ += κ_g
+            self._ΔΦ += ΔΦ_g
+            self._N += N_g
+        self._pending = raw[raw.rfind(glyphs[-1]):]
+        self._last = Encoder.glyph_terms(glyphs[-1])
+    
+    def sync(self, text: str) -> Ψ:
+        """Encode `text`, reusing state if it extends the previously synced text"""
+        if self._text is not None and text.startswith(self._text):
+            self.append(text[len(self._text):])
+        else:
+            self.reset()
+            self.append(text)
+        self._text = text
+        return self.field()
+    
+    def field(self) -> Ψ:
+        if self._last is None:
+            return Ψ(src=self.src)
+        n = self.n
+        θ_base, κ_g, ΔΦ_g, N_g = self._last
+        sin_s, cos_s = self._ph.sums((θ_base,))
+        return Ψ(
+            ΔΦ=(self._ΔΦ + ΔΦ_g) / n,
+            κ=(self._κ + κ_g) / n,
+            θ=math.atan2(sin_s, cos_s) % τ,
+            N=self._N + N_g,
+            C=math.sqrt(sin_s**2 + cos_s**2) / n,
+            src=self.src
+        )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # §8 MULTIMODAL PROJECTOR — Native geometric merge
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -705,27 +900,37 @@ class InvariantGuardian:
     INV-3: |ΔN| < δN             (energy conserved)
     INV-4: |Δθ| < π/2            (phase continuous)
     INV-5: L(Ψ_out) ≤ L(Ψ_in)   (Ma'at improvement)
+    
+    `clamps` counts the corrections applied per invariant since reset().
     """
     
+    INVARIANTS = ("coherence", "curvature", "energy", "phase", "maat")
+    
     def __init__(self):
         self._C_floor = 0.0
         self._L_prev = float('inf')
+        self.clamps = dict.fromkeys(self.INVARIANTS, 0)
     
     def enforce(self, ψ_before: Ψ, ψ_after: Ψ, L: float) -> Ψ:
         result = ψ_after.copy()
         
         # INV-1: Coherence floor
         self._C_floor = max(0, self._C_floor - 0.002, ψ_before.C - 0.1)
-        result.C = max(result.C, self._C_floor)
+        if result.C < self._C_floor:
+            result.C = self._C_floor
+            self.clamps["coherence"] += 1
         
         # INV-2: Curvature bounds
-        result.κ = max(κ_MIN, min(κ_MAX, result.κ))
+        if not κ_MIN <= result.κ <= κ_MAX:
+            result.κ = max(κ_MIN, min(κ_MAX, result.κ))
+            self.clamps["curvature"] += 1
         
         # INV-3: Energy conservation
         if ψ_before.N > ε:
             ratio = result.N / ψ_before.N
             if abs(ratio - 1) > ENERGY_δ:
                 result.N = ψ_before.N * (1 + ENERGY_δ * (1 if ratio > 1 else -1))
+                self.clamps["energy"] += 1
         
         # INV-4: Phase continuity
         Δθ = abs(result.θ - ψ_before.θ)
@@ -734,10 +939,12 @@ class InvariantGuardian:
         if Δθ > PHASE_MAX:
             direction = 1 if result.θ > ψ_before.θ else -1
             result.θ = (ψ_before.θ + direction * PHASE_MAX) % τ
+            self.clamps["phase"] += 1
         
         # INV-5: Ma'at improvement (soft constraint)
         if L > self._L_prev * 1.3:
             result = ψ_before.blend(result, 0.7)
+            self.clamps["maat"] += 1
         self._L_prev = L
         
         return result._enforce()
@@ -745,6 +952,7 @@ class InvariantGuardian:
     def reset(self):
         self._C_floor = 0.0
         self._L_prev = float('inf')
+        self.clamps = dict.fromkeys(self.INVARIANTS, 0)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -836,6 +1044,7 @@ class Result:
     governor: str
     steps: int
     signature: str
+    truncated: bool = False
 
 
 class ASCPI:
@@ -848,45 +1057,66 @@ class ASCPI:
         print(result.output)
     """
     
-    def __init__(self, agent_id: str = "ascpi_9"):
-        self.kernel = UnifiedTensorKernel()
+    metrics = None    # process-wide metrics sink: record(...) once per process() (ascpi_metrics_v10)
+    
+    def __init__(self, agent_id: str = "ascpi_9", params: Optional[Dict] = None):
+        self.kernel = UnifiedTensorKernel(params or KERNEL)   # per-engine, read-only parameters
         self.memory = MemoryField()
         self.awareness = AwarenessField()
         self.coherence = CoherenceForce()
         self.world = WorldCurvature()
         self.guardian = InvariantGuardian()
-        self.maat = MaatFunctional()
+        self.maat = MaatFunctional(self.kernel.p['λ'])
         self.governor = MaatGovernor()
         self.log = ForensicLogger()
+        self.world_cache = WORLD_CACHE
+        self.encoder: Optional[IncrementalEncoder] = None   # opt-in: transcript-style inputs
         
         self.agent_id = agent_id
         self.step = 0
         self.current: Optional[Ψ] = None
+        self.profiler = None    # opt-in stage profiler: begin(name) / end() (ascpi.profile)
     
     def process(self, text: str, code: Optional[str] = None,
                 world: Optional[Dict[str, str]] = None,
-                max_steps: int = 25) -> Result:
+                max_steps: int = 25, deadline_ms: Optional[float] = None,
+                tol: Optional[float] = None) -> Result:
         """
         Main processing: Ψ(t+1) = F(Ψ, A, M∞, W)
+        
+        deadline_ms / tol: see StepControl.
         """
+        t0 = time.perf_counter()
+        n_calls = self.kernel.n_calls
         self.step += 1
         self.guardian.reset()
+        ctl = StepControl(deadline_ms, tol)
+        prof = self.profiler
+        rebuild_steps = 0
+        if prof is not None:
+            prof.begin("process")
+            prof.begin("encoding")
         
         # ══════════════════════════════════════════════════════════════════
         # ENCODE
         # ══════════════════════════════════════════════════════════════════
-        ψ_lang = Encoder.text(text, "lang")
+        ψ_lang = self.encoder.sync(text) if self.encoder else Encoder.text(text, "lang")
         ψ_code = Encoder.code(code) if code else None
         
         # World context
+        if prof is not None:
+            prof.end()
+            prof.begin("world_context")
         if world:
-            for sid, txt in world.items():
-                self.world.add(sid, Encoder.text(txt, "world"))
+            self.world.merge(world, self.world_cache)
         W = self.world.field
         
         # ══════════════════════════════════════════════════════════════════
         # MULTIMODAL PROJECTION
         # ══════════════════════════════════════════════════════════════════
+        if prof is not None:
+            prof.end()
+            prof.begin("multimodal_projection")
         fields = [ψ_lang, self.memory.attractor(), self.awareness.field]
         if ψ_code:
             fields.append(ψ_code)
@@ -898,9 +1128,16 @@ class ASCPI:
         # ══════════════════════════════════════════════════════════════════
         # EVOLUTION LOOP
         # ══════════════════════════════════════════════════════════════════
+        if prof is not None:
+            prof.end()
+            prof.begin("evolution")
         trajectory = []
         
         for step in range(max_steps):
+            if ctl.expired():
+                break
+            if prof is not None:
+                prof.begin("step")
             before = current.copy()
             
             # Coherence sources
@@ -940,38 +1177,57 @@ class ASCPI:
             # Log
             self.log.log(current, L, self.awareness.field)
             trajectory.append(current.C)
+            if prof is not None:
+                prof.end()
             
             # Convergence
-            if current.C > 0.95:
+            if current.C > 0.95 or ctl.settled(before, current, L):
                 break
+        current = ctl.output(current)
         
         # ══════════════════════════════════════════════════════════════════
         # GOVERNOR
         # ══════════════════════════════════════════════════════════════════
+        if prof is not None:
+            prof.end()
+            prof.begin("governor")
         decision, maat_score = self.governor.judge(ψ_lang, current, W)
         
         if decision == Governor.REBUILD:
-            # Extra iterations with stronger damping
-            old_α = self.kernel.p['α']
-            self.kernel.p['α'] *= 1.5
+            if prof is not None:
+                prof.begin("rebuild")
+            # Extra iterations with stronger damping (per-call kernel)
+            rebuild = self.kernel.derive(α=self.kernel.p['α'] * 1.5)
+            ctl.restart()
             for _ in range(10):
+                if ctl.expired():
+                    break
                 before = current.copy()
                 grad_C, _ = self.coherence.compute(coherences)
-                current = self.kernel(current, attractor, self.memory.M_inf, W, grad_C)
+                current = rebuild(current, attractor, self.memory.M_inf, W, grad_C)
                 self.memory.absorb(current)
                 current.C = self.memory.M_inf.C
                 current = self.awareness.evolve(current, self.memory.M_inf, W)
                 L = self.maat(current, self.memory.M_inf)
                 current = self.guardian.enforce(before, current, L)
-            self.kernel.p['α'] = old_α
+                if ctl.settled(before, current, L):
+                    break
+            self.kernel.n_calls += rebuild.n_calls
+            rebuild_steps = rebuild.n_calls
+            current = ctl.output(current)
+            if prof is not None:
+                prof.end()
         
         # ══════════════════════════════════════════════════════════════════
         # RESULT
         # ══════════════════════════════════════════════════════════════════
+        if prof is not None:
+            prof.end()
+            prof.begin("output")
         self.current = current
         sig = hashlib.sha256(str(current.vec()).encode()).hexdigest()[:8]
         
-        return Result(
+        result = Result(
             output=current,
             coherence=current.C,
             maat=maat_score,
@@ -979,8 +1235,16 @@ class ASCPI:
             awareness_level=self.awareness.level(),
             governor=decision.value,
             steps=len(trajectory),
-            signature=sig
+            signature=sig,
+            truncated=ctl.truncated
         )
+        if prof is not None:
+            prof.end()
+            prof.end()
+        if self.metrics is not None:
+            self.metrics.record("v9", time.perf_counter() - t0, len(trajectory), current.C, decision.value,
+                                rebuild_steps, self.kernel.n_calls - n_calls, self.guardian.clamps)
+        return result
     
     def export_log(self) -> str:
         return self.log.export()
@@ -999,7 +1263,175 @@ class ASCPI:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# §14 VERIFICATION SUITE
+# §14 CHECKPOINT — Versioned binary engine state, mmap restore
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Checkpoint:
+    """
+    Binary checkpoint of everything that drives future outputs:
+    
+        header    magic 'ASCPI9CK', version
+        params    kernel.p {name: value}          (version 2+)
+        engine    agent_id, step, kernel.n_calls, governor.current, current?
+        M∞        M_inf, _C_floor, _limit_cycle?, _history[]
+        Ψ_a       field, _C[], _κ[], _div[], _align[]
+        ∇C        _C_prev
+        W         sources{sid: Ψ}   (field is re-derived)
+        guardian  _C_floor, _L_prev
+    
+    Strings are UTF-8 with a u32 length (version 3+), so ids of any length
+    round-trip intact. Ψ record: <5dq> + src. Forensic log is not persisted.
+    Version 2 checkpoints (u8 keys/src, u16 ids) still load; version 1 (no
+    params) loads with the KERNEL defaults.
+    """
+    
+    MAGIC = b'ASCPI9CK'
+    VERSION = 3
+    _HDR = struct.Struct('<8sHH')
+    _Ψ = struct.Struct('<5dq')
+    
+    # ── writing ──────────────────────────────────────────────────────────────
+    @staticmethod
+    def _str(b: bytearray, s: str) -> None:
+        raw = s.encode('utf-8')
+        b += struct.pack('<I', len(raw)) + raw
+    
+    @classmethod
+    def _psi(cls, b: bytearray, ψ: Optional[Ψ]) -> None:
+        b += struct.pack('<B', ψ is not None)
+        if ψ is not None:
+            b += cls._Ψ.pack(*ψ.vec(), ψ.t)
+            cls._str(b, ψ.src)
+    
+    @staticmethod
+    def _floats(b: bytearray, xs) -> None:
+        xs = list(xs)
+        b += struct.pack(f'<I{len(xs)}d', len(xs), *xs)
+    
+    @classmethod
+    def dumps(cls, engine: ASCPI) -> bytes:
+        b = bytearray(cls._HDR.pack(cls.MAGIC, cls.VERSION, 0))
+        b += struct.pack('<I', len(engine.kernel.p))
+        for k, v in engine.kernel.p.items():
+            cls._str(b, k)
+            b += struct.pack('<d', v)
+        cls._str(b, engine.agent_id)
+        b += struct.pack('<QQd', engine.step, engine.kernel.n_calls, engine.governor.current)
+        cls._psi(b, engine.current)
+        
+        mem = engine.memory
+        cls._psi(b, mem.M_inf)
+        b += struct.pack('<d', mem._C_floor)
+        cls._psi(b, mem._limit_cycle)
+        b += struct.pack('<I', len(mem._history))
+        for h in mem._history:
+            cls._psi(b, h)
+        
+        aw = engine.awareness
+        cls._psi(b, aw.field)
+        for buf in (aw._C, aw._κ, aw._div, aw._align):
+            cls._floats(b, buf)
+        
+        b += struct.pack('<d', engine.coherence._C_prev)
+        b += struct.pack('<I', len(engine.world.sources))
+        for sid, ψ in engine.world.sources.items():
+            cls._str(b, sid)
+            cls._psi(b, ψ)
+        b += struct.pack('<dd', engine.guardian._C_floor, engine.guardian._L_prev)
+        return bytes(b)
+    
+    # ── reading ──────────────────────────────────────────────────────────────
+    @classmethod
+    def loads(cls, buf, params: Optional[Dict] = None) -> ASCPI:
+        """
+        Decode from bytes, memoryview or mmap via unpack_from (no copy of buf).
+        The engine runs with the saved kernel parameters unless params is given.
+        """
+        pos = 0
+        
+        def take(fmt):
+            nonlocal pos
+            s = fmt if isinstance(fmt, struct.Struct) else struct.Struct(fmt)
+            v = s.unpack_from(buf, pos)
+            pos += s.size
+            return v
+        
+        def text(width='<B'):   # width of the pre-version-3 length prefix
+            nonlocal pos
+            (n,) = take('<I' if version >= 3 else width)
+            raw = bytes(buf[pos:pos + n])
+            pos += n
+            return raw.decode('utf-8')
+        
+        def psi():
+            (present,) = take('<B')
+            if not present:
+                return None
+            *v, t = take(cls._Ψ)
+            return Ψ(*v, t, text())
+        
+        def floats():
+            (n,) = take('<I')
+            return take(f'<{n}d')
+        
+        magic, version, _ = take(cls._HDR)
+        if magic != cls.MAGIC:
+            raise ValueError("not an ASCπ 9.0 checkpoint")
+        if version not in (1, 2, cls.VERSION):
+            raise ValueError(f"unsupported checkpoint version {version}")
+        
+        saved = None
+        if version >= 2:
+            (n,) = take('<I')
+            saved = {}
+            for _ in range(n):
+                k = text()
+                (saved[k],) = take('<d')
+        engine = ASCPI(text('<H'), params if params is not None else saved)
+        engine.step, engine.kernel.n_calls, engine.governor.current = take('<QQd')
+        engine.current = psi()
+        
+        mem = engine.memory
+        mem.M_inf = psi()
+        (mem._C_floor,) = take('<d')
+        cycle = psi()
+        mem._limit_cycle = None if cycle is None else freeze(cycle)
+        (n,) = take('<I')
+        mem._history.extend(psi() for _ in range(n))
+        
+        aw = engine.awareness
+        aw.field = psi()
+        for d in (aw._C, aw._κ, aw._div, aw._align):
+            d.extend(floats())
+        
+        (engine.coherence._C_prev,) = take('<d')
+        (n,) = take('<I')
+        for _ in range(n):
+            sid = text('<H')
+            engine.world.sources[sid] = psi()
+        engine.world._update()
+        engine.guardian._C_floor, engine.guardian._L_prev = take('<dd')
+        return engine
+    
+    # ── files ────────────────────────────────────────────────────────────────
+    @classmethod
+    def save(cls, engine: ASCPI, path: str) -> int:
+        """Atomic write (tmp + rename); returns size in bytes"""
+        data = cls.dumps(engine)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return len(data)
+    
+    @classmethod
+    def load(cls, path: str, params: Optional[Dict] = None) -> ASCPI:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return cls.loads(mm, params)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# §15 VERIFICATION SUITE
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def verify() -> Dict:
@@ -1038,6 +1470,21 @@ def verify() -> Dict:
         mem.absorb(Ψ(C=0.5 + i*0.03, θ=i*0.1))
     test("memory_coherence", mem.M_inf.C > 0.5, f"C={mem.M_inf.C:.3f}")
     test("limit_cycle", mem._limit_cycle is not None or mem.M_inf.C > 0.6)
+    gen, snap = mem.snapshot()
+    frozen = snap.vec()
+    mem.absorb(Ψ(C=0.9, θ=1.0))
+    test("attractor_cow", snap.vec() == frozen and mem.generation == gen + 1,
+         f"gen={mem.generation}")
+    refused = 0
+    for shared in (snap, mem.attractor(), mem.snapshot()[1]):
+        try:
+            shared.C = 0.0
+        except FrozenInstanceError:
+            refused += 1
+    own = snap.copy()
+    own.C = 0.0
+    test("attractor_frozen", refused == 3 and snap.vec() == frozen and own.C == 0.0,
+         f"refused={refused}/3")
     
     # §4 Awareness Field
     print("\n§4 Awareness Field")
@@ -1086,6 +1533,93 @@ def verify() -> Dict:
     log_json = engine.export_log()
     test("forensic_log", "log" in log_json, f"entries={engine.log.count}")
     
+    # §11 Checkpoint
+    print("\n§11 Checkpoint")
+    blob = Checkpoint.dumps(engine)
+    restored = Checkpoint.loads(blob)
+    same = Checkpoint.dumps(restored) == blob
+    r1 = engine.process("After restart.", world={"ctx": "context"})
+    r2 = restored.process("After restart.", world={"ctx": "context"})
+    test("checkpoint_roundtrip", same and r1.signature == r2.signature,
+         f"{len(blob)} bytes, sig={r1.signature}")
+    long_id = "σ" * 20000 + "x" * 20001   # 40001 chars, 60001 UTF-8 bytes
+    e_long = ASCPI(agent_id="α" * 300)
+    e_long.process("Long ids.", world={long_id: "context", "ψ" * 200: "more"})
+    back = Checkpoint.loads(Checkpoint.dumps(e_long))
+    test("checkpoint_long_strings", back.agent_id == e_long.agent_id
+         and list(back.world.sources) == list(e_long.world.sources)
+         and back.world.sources == e_long.world.sources,
+         f"id={len(next(iter(back.world.sources)))} chars")
+    
+    # §12 Deadline & adaptive termination
+    print("\n§12 Deadline")
+    r_cut = ASCPI().process("Deadline test.", deadline_ms=0)
+    r_full = ASCPI().process("Deadline test.")
+    r_tol = ASCPI().process("Deadline test.", tol=1e-3)
+    test("deadline_truncates", r_cut.truncated and r_cut.steps == 0 and not r_full.truncated,
+         f"C={r_cut.coherence:.3f}")
+    test("tol_stops_early", r_tol.steps <= r_full.steps and not r_tol.truncated,
+         f"steps {r_tol.steps}/{r_full.steps}")
+    
+    # §13 World cache
+    print("\n§13 World cache")
+    ctx = {"docs": "Shared world context resent on every request."}
+    hits = WORLD_CACHE.hits
+    e_cached, e_plain = ASCPI(), ASCPI()
+    e_plain.world_cache = WorldCache(max_entries=0)
+    sigs = [e_cached.process(f"Turn {i}.", world=ctx).signature for i in range(3)]
+    plain = [e_plain.process(f"Turn {i}.", world=ctx).signature for i in range(3)]
+    test("world_cache", WORLD_CACHE.hits >= hits + 2 and sigs == plain,
+         f"hit_rate={WORLD_CACHE.stats()['hit_rate']:.2f}")
+    
+    # §14 Incremental encoder
+    print("\n§14 Incremental encoder")
+    enc = IncrementalEncoder()
+    chat = ""
+    exact = True
+    for part in ["Hello", " 👨", "\u200d👩", " 🇪", "🇬 e", "\u0301 done"]:
+        chat += part
+        exact &= enc.sync(chat).vec() == Encoder.text(chat).vec()
+    test("incremental_exact", exact, f"{enc.n} glyphs")
+    long_text = "".join(f"Turn {i}: Ψ {i * i % 97} " for i in range(2000))
+    enc.sync(long_text[:5000])
+    err = max(abs(a - b) for a, b in zip(enc.sync(long_text).vec(), Encoder.text(long_text).vec()))
+    test("incremental_long", err < 1e-9, f"max error {err:.1e}")
+    
+    # §15 Rolling trend
+    print("\n§15 Rolling trend")
+    ρ, ys, err = RollingTrend(20), [], 0.0
+    for i in range(90):
+        ys.append(math.sin(i * 0.37) + 0.01 * i)
+        ρ.push(ys[-1])
+        w = ys[-20:]
+        μ = sum(w) / len(w)
+        err = max(err, abs(ρ.mean() - μ), abs(ρ.variance() - sum((y - μ) ** 2 for y in w) / len(w)))
+    test("rolling_window", list(ρ) == ys[-20:] and ρ.trend() == (ys[-1] - ys[-20]) / 20,
+         f"max error {err:.1e}")
+    test("rolling_moments", err < 1e-9)
+    
+    # §16 Per-engine kernel parameters
+    print("\n§16 Kernel parameters")
+    stiff = {'α': 0.4, 'K': 0.9, 'λ': 0.05}
+    def sigs(params):
+        e = ASCPI(params=params)
+        return e, [e.process(f"Parameter isolation {i}").signature for i in range(4)]
+    (e_base, base), (e_stiff, stiff_sigs) = sigs(None), sigs(stiff)
+    frozen = False
+    try:
+        e_stiff.kernel.p['α'] = 1.0
+    except TypeError:
+        frozen = True
+    test("params_per_engine", base != stiff_sigs and sigs(None)[1] == base and KERNEL['α'] == 0.15
+         and e_stiff.maat.λ == 0.05 and e_base.kernel.p['α'] == 0.15)
+    test("params_frozen", frozen and e_stiff.kernel.derive(α=0.1).p['K'] == 0.9)
+    blob = Checkpoint.dumps(e_stiff)
+    back, forced = Checkpoint.loads(blob), Checkpoint.loads(blob, {'α': 0.2})
+    test("params_checkpointed", back.kernel.p == e_stiff.kernel.p and back.maat.λ == 0.05
+         and back.process("After restore").signature == e_stiff.process("After restore").signature
+         and forced.kernel.p['α'] == 0.2 and forced.kernel.p['K'] == KERNEL['K'])
+    
     # Summary
     print()
     print("=" * 60)
@@ -1097,7 +1631,7 @@ def verify() -> Dict:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# §15 MAIN — Demo
+# §16 MAIN — Demo
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
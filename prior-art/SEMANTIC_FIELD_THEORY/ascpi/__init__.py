@@ -0,0 +1,69 @@
+"""
+ascpi — installable entry point to the ASCπ semantic field engines.
+
+Importing this package loads nothing heavy. Releases and subsystems resolve
+on first attribute access:
+
+    import ascpi
+    engine = ascpi.ASCPI()                 # loads the v10 kernel only
+    qcb = ascpi.QuantumCompressionBridge   # loads v5.1 on first use
+    ascpi.v9.ASCPI()                       # any release module by key
+
+    ascpi.import_times()                   # {release: seconds}, own time
+
+Set ASCPI_IMPORT_TRACE=1 to log every release load to stderr.
+"""
+
+from __future__ import annotations   # no `typing` at import time
+
+from ascpi._loader import IMPORT_TIMES, RELEASES, load, loaded
+
+__version__ = "10.0.0"
+
+# Public name -> (release key, attribute)
+_LAZY = {
+    # Canonical engines
+    'ASCPI': ('v10', 'ASCPI'),
+    'Psi': ('v10', 'Psi'),
+    'EnginePool': ('v10.pool', 'EnginePool'),
+    'ASCPIServer': ('v10.server', 'ASCPIServer'),
+    'EngineMetrics': ('v10.metrics', 'EngineMetrics'),
+    'ResultCache': ('v10', 'ResultCache'),
+    'ASCPiEngine5': ('v51', 'ASCPiEngine5'),
+    'ASCPiEngineV5': ('v5', 'ASCPiEngineV5'),
+    'ASCPiEngine': ('v4', 'ASCPiEngine'),
+    'SFTSimulationEngine': ('r31', 'SFTSimulationEngine'),
+    # Heavy subsystems (v5.1)
+    'WorldCurvatureMatrix': ('v51', 'WorldCurvatureMatrix'),
+    'ResonanceNetwork': ('v51', 'ResonanceNetwork'),
+    'QuantumCompressionBridge': ('v51', 'QuantumCompressionBridge'),
+    'ForensicLogger': ('v51', 'ForensicLogger'),
+    'TemporalPhaseLogic': ('v51', 'TemporalPhaseLogic'),
+    # Protocol / governance (v5.0)
+    'ProtocolStack': ('v5', 'ProtocolStack'),
+    'MaatGovernor': ('v5', 'MaatGovernor'),
+}
+
+
+def __getattr__(name: str):
+    if name in RELEASES:
+        mod = load(name)
+    elif name in _LAZY:
+        key, attr = _LAZY[name]
+        mod = getattr(load(key), attr)
+    else:
+        raise AttributeError(f"module 'ascpi' has no attribute {name!r}")
+    globals()[name] = mod   # cache: later lookups skip __getattr__
+    return mod
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {k for k in RELEASES if k.isidentifier()})
+
+
+def import_times() -> dict[str, float]:
+    """Seconds spent executing each loaded release (dependencies excluded)"""
+    return dict(IMPORT_TIMES)
+
+
+__all__ = ['load', 'loaded', 'import_times', '__version__', *_LAZY]
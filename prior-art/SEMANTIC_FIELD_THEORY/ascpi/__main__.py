@@ -0,0 +1,7 @@
+"""python -m ascpi — same as the `ascpi` console script"""
+
+import sys
+
+from ascpi.cli import main
+
+sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+ascpi._loader — on-demand loading of the SFT release modules.
+
+Each release is a standalone script living in its own "SFT Release X"
+directory (shipped as the ascpi._rX subpackages when installed). They are
+loaded by file path under their historical top-level names, so the
+releases' own `from ascpi_engine_v4 import ...` style imports keep working
+regardless of the current directory. Release-independent helpers
+(RollingTrend, PhasorSum, StepControl, ContentCache) live once in
+ascpi.primitives and are imported by the releases. Wall-clock load time is recorded per
+release (own time, dependencies excluded).
+"""
+
+from __future__ import annotations   # keep `typing` out of the import path
+
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+# subpackage: installed location ascpi.<subpackage>
+# directory:  source-tree location <root>/<directory>
+# module:     top-level name registered in sys.modules
+Release = namedtuple('Release', 'subpackage directory filename module deps', defaults=((),))
+
+RELEASES: dict[str, Release] = {
+    'r31': Release('_r31', 'SFT Release 3.1', 'sft_engine_r31.py', 'sft_engine_r31'),
+    'v4': Release('_r4', 'SFT Release 4.0', 'ascpi_engine_v4.py', 'ascpi_engine_v4'),
+    'v5': Release('_r5', 'SFT Release 5.0', 'ascpi_engine_v5.py', 'ascpi_engine_v5', ('v4',)),
+    'v51': Release('_r51', 'SFT Release 5.01', 'ascpi_engine_v5.1.py', 'ascpi_engine_v5_1'),
+    'v8': Release('_r8', 'SFT Release 8.0', 'ascpi_engine_unified.py', 'ascpi_engine_unified'),
+    'v9': Release('_r9', 'SFT Release 9.0', 'ascpi_engine_v9.py', 'ascpi_engine_v9'),
+    'v10': Release('_r10', 'SFT Release 10.0', 'ascpi_engine_v10.py', 'ascpi_engine_v10'),
+    'v10.pool': Release('_r10', 'SFT Release 10.0', 'ascpi_pool_v10.py', 'ascpi_pool_v10', ('v10',)),
+    'v10.metrics': Release('_r10', 'SFT Release 10.0', 'ascpi_metrics_v10.py', 'ascpi_metrics_v10'),
+    'v10.server': Release('_r10', 'SFT Release 10.0', 'ascpi_server_v10.py', 'ascpi_server_v10',
+                          ('v10', 'v10.pool', 'v10.metrics')),
+}
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_lock = threading.RLock()
+IMPORT_TIMES: dict[str, float] = {}
+
+
+def locate(key: str) -> str:
+    """Path of a release file: installed subpackage first, then source tree"""
+    rel = RELEASES[key]
+    installed = os.path.join(os.path.dirname(os.path.abspath(__file__)), rel.subpackage, rel.filename)
+    if os.path.exists(installed):
+        return installed
+    return os.path.join(_ROOT, rel.directory, rel.filename)
+
+
+def load(key: str):
+    """Import a release (and its dependencies) once; return the module"""
+    if key not in RELEASES:
+        raise KeyError(f"unknown release {key!r}; known: {', '.join(RELEASES)}")
+    rel = RELEASES[key]
+    with _lock:
+        mod = sys.modules.get(rel.module)
+        if mod is not None:
+            return mod
+        for dep in rel.deps:
+            load(dep)
+        import importlib.util   # deferred: pulls in contextlib & co.
+        path = locate(key)
+        spec = importlib.util.spec_from_file_location(rel.module, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load release {key} from {path}")
+        mod = importlib.util.module_from_spec(spec)
+        t0 = time.perf_counter()
+        sys.modules[rel.module] = mod   # before exec: dataclasses resolve their module
+        try:
+            spec.loader.exec_module(mod)
+        except BaseException:
+            del sys.modules[rel.module]
+            raise
+        IMPORT_TIMES[key] = time.perf_counter() - t0
+        if os.environ.get('ASCPI_IMPORT_TRACE'):
+            print(f"ascpi: loaded {key} in {IMPORT_TIMES[key] * 1000:.1f} ms", file=sys.stderr)
+        return mod
+
+
+def loaded() -> tuple[str, ...]:
+    return tuple(k for k, r in RELEASES.items() if r.module in sys.modules)
@@ -0,0 +1,294 @@
+"""
+ascpi PACKAGE - TEST SUITE
+==========================
+
+Lazy loading, cross-release imports, shared primitives, import-time tracking and
+the CLI pipeline.
+Run from a source checkout (the wheel leaves it out):  python -m ascpi.ascpi_tests
+"""
+
+import json
+import math
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str, cwd: str = '/') -> dict:
+    """Execute code in a fresh interpreter (clean sys.modules), return its JSON"""
+    env = {**os.environ, 'PYTHONPATH': ROOT}
+    out = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_import_is_lazy():
+    """import ascpi loads no release and stays off `typing`"""
+    r = _run("import sys, json, ascpi; print(json.dumps({'loaded': ascpi.loaded(), "
+             "'typing': 'typing' in sys.modules, 'times': ascpi.import_times()}))")
+    assert r['loaded'] == [] and r['times'] == {}
+    assert not r['typing']
+    print("[PASS] test_import_is_lazy")
+
+
+def test_lazy_attribute_loads_one_release():
+    """ascpi.ASCPI loads v10 only and works"""
+    r = _run("import json, ascpi; s = ascpi.ASCPI().process('hello').signature; "
+             "print(json.dumps({'loaded': ascpi.loaded(), 'sig': s, 'times': ascpi.import_times()}))")
+    assert r['loaded'] == ['v10'] and len(r['sig']) == 8
+    assert set(r['times']) == {'v10'} and r['times']['v10'] > 0
+    print("[PASS] test_lazy_attribute_loads_one_release")
+
+
+def test_v5_without_v4_on_path():
+    """v5.0 resolves its v4 dependency from any working directory"""
+    r = _run("import json, ascpi; e = ascpi.ASCPiEngineV5(); "
+             "print(json.dumps({'loaded': ascpi.loaded(), 'ok': e.v4_engine is not None}))", cwd='/tmp')
+    assert r['ok'] and r['loaded'] == ['v4', 'v5']
+    print("[PASS] test_v5_without_v4_on_path")
+
+
+def test_primitives_shared():
+    """Releases import one copy of the shared primitives, also when run standalone"""
+    import ascpi
+    from ascpi import primitives
+    for key, names in (('v4', ('RollingTrend', 'PhasorSum')), ('v51', ('RollingTrend',)),
+                       ('v8', ('RollingTrend', 'StepControl')),
+                       ('v9', ('RollingTrend', 'PhasorSum', 'StepControl')),
+                       ('v10', ('RollingTrend', 'PhasorSum', 'StepControl'))):
+        mod = ascpi.load(key)
+        assert all(getattr(mod, n) is getattr(primitives, n) for n in names), key
+    for key in ('v51', 'v8', 'v9', 'v10'):
+        assert issubclass(ascpi.load(key).WorldCache, primitives.ContentCache), key
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONPATH'}   # no package on the path
+    out = subprocess.run([sys.executable, '-c', "import ascpi_engine_v10 as m; print(m.ASCPI().process('x').signature)"],
+                         cwd=os.path.join(ROOT, 'SFT Release 10.0'), env=env,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == ascpi.ASCPI().process('x').signature
+    print("[PASS] test_primitives_shared")
+
+
+def test_subsystem_and_release_access():
+    """Subsystems and release modules resolve to the same objects"""
+    import ascpi
+    assert ascpi.QuantumCompressionBridge is ascpi.v51.QuantumCompressionBridge
+    assert ascpi.v9.ASCPI is not ascpi.ASCPI
+    assert 'v51' in ascpi.loaded() and 'ResonanceNetwork' in dir(ascpi)
+    try:
+        ascpi.NoSuchThing
+        assert False, "unknown attribute resolved"
+    except AttributeError:
+        pass
+    print("[PASS] test_subsystem_and_release_access")
+
+
+def test_cli_pipeline_order_and_jobs():
+    """Parallel pipeline output equals the sequential run, in input order"""
+    import io
+    from ascpi.cli import run_pipeline
+    text = ''.join(f"Corpus line {i} on semantic fields\n" for i in range(40))
+    outs = []
+    for jobs in (1, 3):
+        buf = io.StringIO()
+        st = run_pipeline(io.StringIO(text), buf, 'v10', jobs=jobs, chunk=4)
+        outs.append(buf.getvalue())
+        assert st['records'] == 40 and st['errors'] == 0
+    assert outs[0] == outs[1]
+    assert [json.loads(l)['i'] for l in outs[1].splitlines()] == list(range(40))
+
+    recs = [json.dumps({'id': i, 'text': f"msg {i}", 'session': f"u{i % 3}"}) for i in range(12)]
+    lines = '\n'.join(recs + ['not json']) + '\n'
+    got = []
+    for jobs in (1, 2):
+        buf = io.StringIO()
+        st = run_pipeline(io.StringIO(lines), buf, 'v10', jobs=jobs, state='session', fmt='jsonl', chunk=5)
+        got.append([json.loads(l) for l in buf.getvalue().splitlines()])
+        assert st['errors'] == 1
+    assert got[0] == got[1]
+    assert [r['result']['steps'] for r in got[0][:6]] == [1, 1, 1, 2, 2, 2]   # per-session engines
+    assert 'error' in got[0][-1]
+    print("[PASS] test_cli_pipeline_order_and_jobs")
+
+
+def test_parallel_encoder_exact():
+    """Map-reduce encoding equals each scalar encoder bit for bit"""
+    from ascpi import load
+    from ascpi.parallel import MIN_CHUNK, SPECS, encode_parallel, split_text
+    words = "semantic field 你好世界 مرحبا 👨\u200d👩\u200d👧 🇪🇬 e\u0301 \u200d a\u200d b 👍🏽 \ufe0f".split(" ")
+    text = " ".join(words[(i * 7919) % len(words)] for i in range(MIN_CHUNK // 4))
+    assert len(text) > MIN_CHUNK
+    v9 = load('v9')
+    assert sum(map(v9.Encoder.graphemes, split_text(text, 501)), []) == v9.Encoder.graphemes(text)
+    for release in SPECS:
+        m = load(release)
+        want = SPECS[release].scalar(m, text, "lang")
+        got = encode_parallel(text, release, jobs=2, chunk_chars=MIN_CHUNK // 3)
+        assert got == want, release
+    print("[PASS] test_parallel_encoder_exact")
+
+
+def test_bulk_featurize_mmap():
+    """Mapped Psi matrix rows equal per-record encoding; long records stream"""
+    import tempfile
+    from ascpi import load
+    from ascpi.bulk import featurize, load_matrix
+    lines = ["Semantic field one", "", "  \t", "你好 👨\u200d👩\u200d👧 🇪🇬 e\u0301",
+             "long " + "👍🏽 mark e\u0301 " * 400]
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'corpus.txt')
+        with open(corpus, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+        raw = open(corpus, 'rb').read()
+        for engine, enc in (('v10', lambda m: m.encode_text), ('v9', lambda m: m.Encoder.text)):
+            encode = enc(load(engine))
+            st = featurize(corpus, os.path.join(tmp, engine), engine, jobs=2, chunk_bytes=256)
+            assert st['records'] == 3
+            mm, psi = load_matrix(st['psi'])
+            mo, off = load_matrix(st['offsets'])
+            for r, line in enumerate(l for l in lines if l.strip()):
+                o, n = off[r, 0], off[r, 1]
+                assert raw[o:o + n].decode('utf-8') == line
+                want, got = encode(line).vec(), tuple(psi[r, c] for c in range(5))
+                if n <= 256:
+                    assert got == want
+                else:   # streamed through the incremental encoder
+                    assert max(abs(a - b) for a, b in zip(got, want)) < 1e-9
+            psi.release(); off.release(); mm.close(); mo.close()
+    print("[PASS] test_bulk_featurize_mmap")
+
+
+def test_profiler_stages():
+    """Stage spans are balanced, nested under process, and leave results unchanged"""
+    import tempfile
+    from ascpi import load
+    from ascpi.profile import Profiler
+    engines = [('v51', 'ASCPiEngine5', {'world_context': {'w': ('general', 'World text.')}}),
+               ('v10', 'ASCPI', {'world': {'w': 'World text.'}}),
+               ('v9', 'ASCPI', {'world': {'w': 'World text.'}}),
+               ('v8', 'ASCPI', {'world': {'w': 'World text.'}})]
+    for key, cls, kw in engines:
+        plain, profiled = getattr(load(key), cls)(), getattr(load(key), cls)()
+        profiled.profiler = prof = Profiler()
+        for text in ("Profile this.", "The bank was steep."):
+            a, b = plain.process(text, **kw), profiled.process(text, **kw)
+            if key == 'v51':
+                assert a["output"]["field"] == b["output"]["field"], key
+            else:
+                assert a.signature == b.signature, key
+        assert not prof._stack, key
+        names = {n for n, _, _ in prof.summary()}
+        assert {'process', 'encoding', 'world_context', 'multimodal_projection',
+                'evolution', 'step', 'governor', 'output'} <= names, (key, names)
+        assert all(k == 'process' or k.startswith('process;') for k in prof.self_ns), key
+        assert prof.totals['process'][0] == 2, key
+        if key == 'v51':
+            assert {'coherence_fusion', 'memory', 'resonance', 'predict', 'D', 'A', 'I', 'M', 'K'} <= names
+            assert any(k.endswith('evolution;step;predict;K') for k in prof.self_ns)
+    with tempfile.TemporaryDirectory() as d:
+        prof.write_chrome_trace(os.path.join(d, 'trace.json'))
+        prof.write_collapsed(os.path.join(d, 'stacks.folded'))
+        with open(os.path.join(d, 'trace.json')) as f:
+            events = json.load(f)["traceEvents"]
+        assert len(events) == len(prof.events) and all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+        with open(os.path.join(d, 'stacks.folded')) as f:
+            assert all(line.split()[-1].isdigit() for line in f)
+    print("[PASS] test_profiler_stages")
+
+
+def test_tune_hyperband():
+    """Latin hypercube strata, Hyperband budget, parallel == in-process, CLI report"""
+    import random
+    import tempfile
+    from ascpi.tune import SPACE, hyperband, latin_hypercube
+    cands = latin_hypercube(SPACE, 9, random.Random(0))
+    for name, (lo, hi, log) in SPACE.items():
+        u = [(math.log(c[name] / lo) / math.log(hi / lo)) if log else (c[name] - lo) / (hi - lo) for c in cands]
+        assert sorted(int(x * 9) for x in u) == list(range(9))
+    
+    recs = [{'text': f"Tuning record {i}: phase {i * 7 % 13}"} for i in range(9)]
+    one = hyperband(recs, eta=3, jobs=1, seed=3)
+    two = hyperband(recs, eta=3, jobs=2, seed=3)
+    assert one['best'] == two['best'] and one['runs'] == two['runs']
+    assert one['best']['records'] == 9 and one['best']['loss'] <= one['leaderboard'][-1]['loss']
+    assert one['runs'] < one['candidates'] * len(recs) < one['grid_runs']
+    assert [b['bracket'] for b in one['brackets']] == [2, 1, 0]
+    
+    with tempfile.TemporaryDirectory() as d:
+        corpus = os.path.join(d, 'corpus.txt')
+        with open(corpus, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(r['text'] for r in recs) + '\n')
+        subprocess.run([sys.executable, '-m', 'ascpi', 'tune', corpus, '-j', '1', '--brackets', '1',
+                        '--seed', '3', '-o', os.path.join(d, 'tune.json')],
+                       env={**os.environ, 'PYTHONPATH': ROOT}, capture_output=True, check=True)
+        with open(os.path.join(d, 'tune.json'), encoding='utf-8') as f:
+            rep = json.load(f)
+    assert len(rep['brackets']) == 1 and rep['best']['records'] == 9
+    assert set(rep['best']['params']) == set(SPACE)
+    print("[PASS] test_tune_hyperband")
+
+
+def test_soak_rss_flat():
+    """Short soak per engine family; CLI exit status follows the RSS bound"""
+    from ascpi.soak import soak
+    for engine, calls in (('v10', 400), ('v51', 60), ('v5', 40), ('v4', 60), ('r31', 40)):
+        rep = soak(engine, calls, every=calls // 4, warmup=0.5)
+        assert rep['passed'] and rep['samples'][-1]['calls'] == calls, (engine, rep['growth'])
+        assert rep['rss_baseline'] > 0 and len(rep['samples']) == 5
+    env = {**os.environ, 'PYTHONPATH': ROOT}
+    out = subprocess.run([sys.executable, '-m', 'ascpi', 'soak', '-e', 'v8', '--calls', '50'],
+                         env=env, capture_output=True, text=True)
+    assert out.returncode == 0 and json.loads(out.stdout)['calls'] == 50, out.stderr
+    out = subprocess.run([sys.executable, '-m', 'ascpi', 'soak', '-e', 'v10', '--calls', '20',
+                          '--warmup', '0', '--max-growth-mb', '-1'], env=env, capture_output=True, text=True)
+    assert out.returncode == 1 and not json.loads(out.stdout)['passed']
+    print("[PASS] test_soak_rss_flat")
+
+
+def run_all_tests():
+    """Execute all tests"""
+    print("=" * 50)
+    print("ascpi PACKAGE - TEST SUITE")
+    print("=" * 50)
+    print()
+
+    tests = [
+        test_import_is_lazy,
+        test_lazy_attribute_loads_one_release,
+        test_v5_without_v4_on_path,
+        test_subsystem_and_release_access,
+        test_primitives_shared,
+        test_cli_pipeline_order_and_jobs,
+        test_parallel_encoder_exact,
+        test_bulk_featurize_mmap,
+        test_profiler_stages,
+        test_tune_hyperband,
+        test_soak_rss_flat,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"[ERROR] {test.__name__}: {e}")
+            failed += 1
+
+    print()
+    print("=" * 50)
+    print(f"RESULTS: {passed}/{len(tests)} passed, {failed} failed")
+    print("=" * 50)
+
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,178 @@
+"""
+ascpi.bulk — memory-mapped bulk featurization: UTF-8 corpus in, Psi matrix out.
+
+    ascpi featurize corpus.txt -o feats -e v9 -j 8
+        feats.psi.npy       float64 (rows, 5)   dPhi, kappa, theta, N, C
+        feats.offsets.npy   int64   (rows, 2)   byte offset, byte length in corpus
+
+A record is a line with at least one non-whitespace byte (as `ascpi run`).
+Both outputs are plain .npy files (numpy.load(path, mmap_mode='r') reads
+them) written through mmap without numpy; load_matrix() reads them back.
+
+Memory stays bounded whatever the corpus size: the corpus is mapped, not
+read; pass 1 counts records and writes the offsets index, pass 2 encodes
+row ranges (in parallel with jobs > 1) straight into the mapped matrix.
+Records up to chunk_bytes are decoded whole and encoded by the release's
+encoder (encode_text / Encoder.text), bit for bit. Longer records are
+decoded chunk by chunk with an incremental UTF-8 decoder and streamed into
+the release's IncrementalEncoder, which keeps a partial grapheme pending
+across chunk boundaries (fields agree with the whole-string encoder to
+~1e-13).
+"""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import multiprocessing as mp
+import os
+import re
+import struct
+
+from ascpi._loader import load
+
+ENGINES = {
+    # release -> (whole-record encoder, incremental encoder factory)
+    'v10': (lambda m, text: m.encode_text(text), lambda m: m.IncrementalEncoder()),
+    'v9': (lambda m, text: m.Encoder.text(text), lambda m: m.IncrementalEncoder()),
+}
+
+COLUMNS = ('dPhi', 'kappa', 'theta', 'N', 'C')
+CHUNK_BYTES = 1 << 20
+
+_ROW = struct.Struct('<5d')
+_OFFSET = struct.Struct('<2q')
+_CONTENT = re.compile(rb'[^ \t\n\r\x0b\x0c]')
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+# ==============================================================================
+# .npy FILES
+# ==============================================================================
+
+def _npy_header(descr: str, shape: tuple) -> bytes:
+    d = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {shape}, }}"
+    pad = -(len(_NPY_MAGIC) + 2 + len(d) + 1) % 64
+    d = d + ' ' * pad + '\n'
+    return _NPY_MAGIC + struct.pack('<H', len(d)) + d.encode('latin1')
+
+
+def create_matrix(path: str, descr: str, rows: int, cols: int) -> int:
+    """Create a zero-filled .npy matrix file; returns the data offset"""
+    hdr = _npy_header(descr, (rows, cols))
+    with open(path, 'wb') as f:
+        f.write(hdr)
+        f.truncate(len(hdr) + rows * cols * 8)
+    return len(hdr)
+
+
+def load_matrix(path: str):
+    """(mmap, memoryview of shape (rows, cols)) for a matrix written here"""
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:8] != _NPY_MAGIC:
+        mm.close()
+        raise ValueError(f"{path}: not a version 1.0 .npy file")
+    (hlen,) = struct.unpack_from('<H', mm, 8)
+    hdr = mm[10:10 + hlen].decode('latin1')
+    fmt = {'<f8': 'd', '<i8': 'q'}[re.search(r"'descr': '([^']+)'", hdr).group(1)]
+    rows, cols = map(int, re.search(r"'shape': \((\d+), (\d+)\)", hdr).groups())
+    view = memoryview(mm)[10 + hlen:]
+    return mm, (view.cast(fmt, (rows, cols)) if rows else view.cast(fmt))
+
+# ==============================================================================
+# RECORDS
+# ==============================================================================
+
+def records(mm, size: int):
+    """(offset, length) of every record, newline excluded"""
+    pos = 0
+    while pos < size:
+        end = mm.find(b'\n', pos)
+        if end < 0:
+            end = size
+        if _CONTENT.search(mm, pos, end):
+            yield pos, end - pos
+        pos = end + 1
+
+
+def encode_record(m, engine: str, mm, offset: int, length: int, chunk_bytes: int, errors: str):
+    whole, incremental = ENGINES[engine]
+    if length <= chunk_bytes:
+        return whole(m, mm[offset:offset + length].decode('utf-8', errors))
+    enc = incremental(m)
+    dec = codecs.getincrementaldecoder('utf-8')(errors)
+    for pos in range(offset, offset + length, chunk_bytes):
+        enc.append(dec.decode(mm[pos:min(pos + chunk_bytes, offset + length)]))
+    enc.append(dec.decode(b'', final=True))
+    return enc.field()
+
+# ==============================================================================
+# PASSES
+# ==============================================================================
+
+def _map_input(path: str):
+    f = open(path, 'rb')
+    size = os.fstat(f.fileno()).st_size
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+    return f, mm, size
+
+
+def _encode_rows(corpus: str, engine: str, psi_path: str, off_path: str,
+                 lo: int, hi: int, chunk_bytes: int, errors: str) -> int:
+    """Encode rows lo..hi-1 into the psi matrix (one worker's share)"""
+    m = load(engine)
+    f, mm, size = _map_input(corpus)
+    off_mm, offsets = load_matrix(off_path)
+    try:
+        with open(psi_path, 'r+b') as out_f, mmap.mmap(out_f.fileno(), 0) as out:
+            (hlen,) = struct.unpack_from('<H', out, 8)
+            base = 10 + hlen
+            for r in range(lo, hi):
+                psi = encode_record(m, engine, mm, offsets[r, 0], offsets[r, 1], chunk_bytes, errors)
+                _ROW.pack_into(out, base + r * _ROW.size, *psi.vec())
+            out.flush()
+    finally:
+        offsets.release()
+        off_mm.close()
+        if size: mm.close()
+        f.close()
+    return hi - lo
+
+
+def _star(args):
+    return _encode_rows(*args)
+
+
+def featurize(corpus: str, prefix: str, engine: str = 'v10', jobs: int = 1,
+              chunk_bytes: int = CHUNK_BYTES, errors: str = 'strict') -> dict:
+    """Write <prefix>.psi.npy and <prefix>.offsets.npy for a UTF-8 corpus; returns counters"""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}; choose from {', '.join(ENGINES)}")
+    psi_path, off_path = f"{prefix}.psi.npy", f"{prefix}.offsets.npy"
+
+    # Pass 1: count, then write the offsets index
+    f, mm, size = _map_input(corpus)
+    try:
+        rows = sum(1 for _ in records(mm, size))
+        base = create_matrix(off_path, '<i8', rows, 2)
+        create_matrix(psi_path, '<f8', rows, len(COLUMNS))
+        if rows:
+            with open(off_path, 'r+b') as out_f, mmap.mmap(out_f.fileno(), 0) as out:
+                for r, (offset, length) in enumerate(records(mm, size)):
+                    _OFFSET.pack_into(out, base + r * _OFFSET.size, offset, length)
+    finally:
+        if size: mm.close()
+        f.close()
+
+    # Pass 2: encode row ranges into the matrix
+    jobs = max(1, min(jobs, rows))
+    step = -(-rows // (4 * jobs)) if rows else 1
+    shares = [(corpus, engine, psi_path, off_path, lo, min(lo + step, rows), chunk_bytes, errors)
+              for lo in range(0, rows, step)]
+    if jobs == 1:
+        for share in shares: _star(share)
+    else:
+        ctx = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+        with ctx.Pool(jobs) as pool:
+            pool.map(_star, shares)
+    return {'records': rows, 'bytes': size, 'psi': psi_path, 'offsets': off_path}
@@ -0,0 +1,431 @@
+"""
+ascpi command line — stream a corpus through an engine, JSONL out.
+
+    ascpi run corpus.txt -e v10 -j 8 > out.jsonl
+    cat corpus.jsonl | ascpi run - --format jsonl --state session -j 4
+    ascpi encode book.txt -e v9 -j 8          # one field for the whole document
+    ascpi featurize corpus.txt -o feats -j 8  # feats.psi.npy + feats.offsets.npy (mmap)
+    ascpi profile corpus.txt -e v51 --trace trace.json --folded stacks.folded
+    ascpi tune corpus.txt -j 4 --max-records 81 -o tune.json   # v10 CONST search
+    ascpi soak -e v51 --calls 1000000 --max-growth-mb 16       # flat-RSS check
+
+Pipeline (constant memory, input order preserved):
+
+    reader ──chunks──▶ worker processes ──▶ reorder buffer ──▶ JSONL writer
+             (bounded queues; at most --inflight chunks between reader and writer)
+
+State:
+    line      every record on a fresh engine: fully parallel
+    session   one engine per record "session" key, pinned to one worker so each
+              session evolves in order (no key: a single shared session)
+
+Records are plain text lines, or JSON objects with
+    text, [code], [world], [max_steps], [deadline_ms], [tol], [session], [id]
+("deadline_ms" and "tol" apply to the v8–v10 engines.)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import queue
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+
+from ascpi._loader import load
+
+ENGINES = {
+    'v10': ('v10', 'ASCPI'),
+    'v9': ('v9', 'ASCPI'),
+    'v8': ('v8', 'ASCPI'),
+    'v51': ('v51', 'ASCPiEngine5'),
+}
+
+DEFAULT_SESSION = ''
+
+# ==============================================================================
+# RECORDS
+# ==============================================================================
+
+def parse_record(line: str, fmt: str) -> dict:
+    if fmt == 'text':
+        return {'text': line.rstrip('\r\n')}
+    rec = json.loads(line)
+    if not isinstance(rec, dict) or not isinstance(rec.get('text'), str):
+        raise ValueError("record must be an object with a 'text' string")
+    return rec
+
+
+def jsonable(obj):
+    """Engine results (dataclasses, fields, dicts) -> plain JSON values"""
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    if isinstance(obj, dict):
+        return {str(k): jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [jsonable(v) for v in obj]
+    if hasattr(obj, 'to_dict'):
+        return jsonable(obj.to_dict())
+    if hasattr(obj, '__dataclass_fields__'):
+        return {k: jsonable(getattr(obj, k)) for k in obj.__dataclass_fields__}
+    if hasattr(obj, 'value'):   # Enum
+        return jsonable(obj.value)
+    return str(obj)
+
+
+def run_record(engine_key: str, engine, rec: dict) -> dict:
+    kw = {'code': rec.get('code'), 'max_steps': int(rec.get('max_steps', 25))}
+    world = rec.get('world')
+    if engine_key == 'v51':
+        if world:
+            kw['world_context'] = {k: v if isinstance(v, (list, tuple)) else ('general', v)
+                                   for k, v in world.items()}
+    else:
+        kw['world'] = world
+        for k in ('deadline_ms', 'tol'):
+            if rec.get(k) is not None: kw[k] = float(rec[k])
+    return jsonable(engine.process(rec['text'], **kw))
+
+# ==============================================================================
+# WORKER
+# ==============================================================================
+
+class Worker:
+    """Engine factory plus (in session mode) an LRU of per-session engines"""
+    def __init__(self, engine_key: str, state: str, fmt: str, max_sessions: int = 4096):
+        release, attr = ENGINES[engine_key]
+        self.key = engine_key
+        self.cls = getattr(load(release), attr)
+        self.state = state
+        self.fmt = fmt
+        self.max_sessions = max_sessions
+        self.sessions: OrderedDict = OrderedDict()
+
+    def engine_for(self, rec: dict):
+        if self.state == 'line':
+            return self.cls()
+        sid = str(rec.get('session', DEFAULT_SESSION))
+        engine = self.sessions.pop(sid, None) or self.cls()
+        self.sessions[sid] = engine
+        if len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)   # oldest session restarts cold
+        return engine
+
+    def handle(self, items: list) -> list:
+        """[(idx, line)] -> [(idx, json, ok)]"""
+        out = []
+        for idx, line in items:
+            try:
+                rec = parse_record(line, self.fmt)
+                res = {'i': idx, 'result': run_record(self.key, self.engine_for(rec), rec)}
+                if 'id' in rec: res['id'] = rec['id']
+                ok = True
+            except Exception as e:
+                res, ok = {'i': idx, 'error': f"{type(e).__name__}: {e}"}, False
+            out.append((idx, json.dumps(res, ensure_ascii=False), ok))
+        return out
+
+
+def _worker_main(engine_key, state, fmt, max_sessions, inq, outq):
+    w = Worker(engine_key, state, fmt, max_sessions)
+    while True:
+        msg = inq.get()
+        if msg is None: break
+        seq, items = msg
+        outq.put((seq, w.handle(items)))
+
+# ==============================================================================
+# PIPELINE
+# ==============================================================================
+
+def _chunks(stream, size: int):
+    """Non-blank lines as [(idx, line)] chunks; idx counts records"""
+    buf, idx = [], 0
+    for line in stream:
+        if not line.strip(): continue
+        buf.append((idx, line))
+        idx += 1
+        if len(buf) >= size:
+            yield buf
+            buf = []
+    if buf: yield buf
+
+
+def _shard(items: list, fmt: str, state: str, jobs: int, seq: int) -> dict:
+    """Worker index -> items. line: whole chunk round-robin; session: by key hash"""
+    if state == 'line':
+        return {seq % jobs: items}
+    parts: dict = {}
+    for idx, line in items:
+        sid = DEFAULT_SESSION
+        if fmt == 'jsonl':
+            try: sid = str(json.loads(line).get('session', DEFAULT_SESSION))
+            except Exception: pass   # the worker reports the parse error
+        parts.setdefault(zlib.crc32(sid.encode()) % jobs, []).append((idx, line))
+    return parts
+
+
+def _emit(out, rows: list, stats: dict) -> None:
+    out.write(''.join(js + '\n' for _, js, _ in rows))
+    stats['records'] += len(rows)
+    stats['errors'] += sum(not ok for _, _, ok in rows)
+
+
+def run_pipeline(stream, out, engine: str = 'v10', jobs: int = 1, state: str = 'line',
+                 fmt: str = 'text', chunk: int = 64, inflight: int = 0, max_sessions: int = 4096) -> dict:
+    """Stream records from `stream` to `out` as JSONL in input order; returns counters"""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}; choose from {', '.join(ENGINES)}")
+    stats = {'records': 0, 'chunks': 0, 'errors': 0}
+
+    if jobs <= 1:
+        w = Worker(engine, state, fmt, max_sessions)
+        for items in _chunks(stream, chunk):
+            _emit(out, w.handle(items), stats)
+            stats['chunks'] += 1
+        out.flush()
+        return stats
+
+    ctx = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+    inqs = [ctx.Queue(maxsize=2) for _ in range(jobs)]
+    outq = ctx.Queue()
+    procs = [ctx.Process(target=_worker_main, args=(engine, state, fmt, max_sessions, q, outq), daemon=True)
+             for q in inqs]
+    for p in procs: p.start()
+
+    window = threading.BoundedSemaphore(inflight or 2 * jobs)   # chunks between reader and writer
+    expected: dict = {}    # seq -> records in chunk (set by reader before dispatch)
+    failure: list = []
+
+    def writer():
+        try:
+            drain()
+        except BaseException as e:   # e.g. BrokenPipeError from a closed stdout
+            failure.append(e)
+
+    def drain():
+        pending: dict = {}
+        nxt, total = 0, None
+        while total is None or nxt < total:
+            try:
+                seq, rows = outq.get(timeout=1.0)
+            except queue.Empty:
+                if not all(p.is_alive() for p in procs):
+                    failure.append(RuntimeError("worker process died"))
+                    return
+                continue
+            if seq is None:          # reader finished: rows is the chunk count
+                total = rows
+                continue
+            pending.setdefault(seq, []).extend(rows)
+            while nxt in pending and len(pending[nxt]) == expected[nxt]:
+                rows = pending.pop(nxt)
+                rows.sort(key=lambda r: r[0])   # session shards come back interleaved
+                _emit(out, rows, stats)
+                del expected[nxt]
+                nxt += 1
+                window.release()
+        out.flush()
+
+    wt = threading.Thread(target=writer, daemon=True)
+    wt.start()
+    seq = 0
+    try:
+        for items in _chunks(stream, chunk):
+            while not window.acquire(timeout=1.0) or failure:
+                if failure: raise failure[0]
+            expected[seq] = len(items)
+            for wi, part in _shard(items, fmt, state, jobs, seq).items():
+                inqs[wi].put((seq, part))
+            seq += 1
+        outq.put((None, seq))
+        wt.join()
+        if failure: raise failure[0]
+    finally:
+        for q in inqs:
+            try: q.put_nowait(None)
+            except queue.Full: pass
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive(): p.terminate()
+    stats['chunks'] = seq
+    return stats
+
+def profile_corpus(a) -> int:
+    """Run every record through one engine (one session) with a Profiler attached"""
+    from ascpi.profile import Profiler
+    w = Worker(a.engine, 'session', a.format)
+    prof = Profiler()
+    errors = 0
+    src = sys.stdin if a.input == '-' else open(a.input, encoding='utf-8')
+    try:
+        for items in _chunks(src, 64):
+            for _, line in items:
+                engine = w.engine_for({})
+                engine.profiler = prof
+                try:
+                    run_record(a.engine, engine, parse_record(line, a.format))
+                except Exception as e:
+                    errors += 1
+                    print(f"ascpi: {type(e).__name__}: {e}", file=sys.stderr)
+                    prof.unwind()
+    finally:
+        if src is not sys.stdin: src.close()
+    if a.trace: prof.write_chrome_trace(a.trace)
+    if a.folded: prof.write_collapsed(a.folded)
+    print(f"{'stage':<24}{'calls':>8}{'total ms':>12}", file=sys.stderr)
+    for name, calls, ms in prof.summary():
+        print(f"{name:<24}{calls:>8}{ms:>12.2f}", file=sys.stderr)
+    return 1 if errors else 0
+
+def tune_corpus(a) -> int:
+    """Hyperband search over the v10 constants on a corpus; JSON report out"""
+    from ascpi.tune import hyperband
+    with (sys.stdin if a.input == '-' else open(a.input, encoding='utf-8')) as src:
+        records = [parse_record(line, a.format) for line in src if line.strip()]
+    rep = hyperband(records, a.max_records, a.eta, max_steps=a.max_steps, step_weight=a.step_weight,
+                    session=a.state == 'session', brackets=a.brackets, jobs=a.jobs, seed=a.seed)
+    dst = sys.stdout if a.output == '-' else open(a.output, 'w', encoding='utf-8')
+    try:
+        json.dump(rep, dst, indent=1)
+        dst.write('\n')
+    finally:
+        if dst is not sys.stdout: dst.close()
+    print(f"{'':<10}{'records':>8}{'steps':>8}{'C':>10}{'loss':>10}", file=sys.stderr)
+    for name in ('baseline', 'best'):
+        r = rep[name]
+        print(f"{name:<10}{r['records']:>8}{r['mean_steps']:>8.2f}{r['mean_coherence']:>10.4f}{r['loss']:>10.4f}",
+              file=sys.stderr)
+    print(f"ascpi: {rep['candidates']} candidates, {rep['runs']} engine runs "
+          f"(3-level grid: {rep['grid_runs']})", file=sys.stderr)
+    return 0
+
+def soak_engine(a) -> int:
+    """Soak one engine with distinct inputs; JSON report out, exit 1 if RSS grows"""
+    from ascpi.soak import soak
+    def progress(s):
+        print(f"ascpi: {s['calls']:>10} calls {s['rss'] / 2**20:>9.1f} MiB {s['seconds']:>9.1f} s",
+              file=sys.stderr)
+    rep = soak(a.engine, a.calls, a.every, a.warmup, int(a.max_growth_mb * 2**20), a.max_steps,
+               progress if a.verbose else None)
+    dst = sys.stdout if a.output == '-' else open(a.output, 'w', encoding='utf-8')
+    try:
+        json.dump(rep, dst, indent=1)
+        dst.write('\n')
+    finally:
+        if dst is not sys.stdout: dst.close()
+    print(f"ascpi: {a.engine} {rep['calls']} calls ({rep['calls_per_s']:.0f}/s), RSS "
+          f"{rep['rss_baseline'] / 2**20:.1f} -> peak {rep['rss_peak'] / 2**20:.1f} MiB after warmup, "
+          f"slope {rep['slope']:+.0f} B/1k calls: {'flat' if rep['passed'] else 'GROWING'}", file=sys.stderr)
+    return 0 if rep['passed'] else 1
+
+# ==============================================================================
+# ENTRY POINT
+# ==============================================================================
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog='ascpi', description="ASCπ engines from the command line")
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    run = sub.add_parser('run', help="stream a corpus through an engine (JSONL out)")
+    run.add_argument('input', nargs='?', default='-', help="corpus file, '-' for stdin")
+    run.add_argument('-o', '--output', default='-', help="JSONL output file, '-' for stdout")
+    run.add_argument('-e', '--engine', default='v10', choices=sorted(ENGINES))
+    run.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="worker processes")
+    run.add_argument('--state', default='line', choices=['line', 'session'])
+    run.add_argument('--format', default='text', choices=['text', 'jsonl'])
+    run.add_argument('--chunk', type=int, default=64, help="records per work unit")
+    run.add_argument('--inflight', type=int, default=0, help="max chunks in flight (default 2*jobs)")
+    run.add_argument('--max-sessions', type=int, default=4096, help="per-worker session engines")
+    enc = sub.add_parser('encode', help="encode one large document (map-reduce, exact)")
+    enc.add_argument('input', nargs='?', default='-', help="document file, '-' for stdin")
+    enc.add_argument('-e', '--engine', default='v10', choices=['v10', 'v9', 'v4'])
+    enc.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="worker processes")
+    enc.add_argument('--chunk', type=int, default=0, help="characters per work unit")
+    fz = sub.add_parser('featurize', help="memory-mapped corpus -> Psi matrix (.npy) + offsets index")
+    fz.add_argument('input', help="UTF-8 corpus file, one record per line")
+    fz.add_argument('-o', '--output', required=True, help="output prefix")
+    fz.add_argument('-e', '--engine', default='v10', choices=['v10', 'v9'])
+    fz.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="worker processes")
+    fz.add_argument('--chunk-bytes', type=int, default=1 << 20, help="decode window for long records")
+    fz.add_argument('--errors', default='strict', choices=['strict', 'replace', 'ignore'],
+                    help="UTF-8 decoding errors")
+    pf = sub.add_parser('profile', help="per-stage timings of one engine over a corpus")
+    pf.add_argument('input', nargs='?', default='-', help="corpus file, '-' for stdin")
+    pf.add_argument('-e', '--engine', default='v10', choices=sorted(ENGINES))
+    pf.add_argument('--format', default='text', choices=['text', 'jsonl'])
+    pf.add_argument('--trace', help="Chrome trace-event JSON output")
+    pf.add_argument('--folded', help="collapsed stacks output (flame graphs)")
+    tn = sub.add_parser('tune', help="Hyperband search over the v10 kernel constants")
+    tn.add_argument('input', nargs='?', default='-', help="benchmark corpus, '-' for stdin")
+    tn.add_argument('-o', '--output', default='-', help="JSON report, '-' for stdout")
+    tn.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="worker processes")
+    tn.add_argument('--format', default='text', choices=['text', 'jsonl'])
+    tn.add_argument('--state', default='line', choices=['line', 'session'])
+    tn.add_argument('--max-records', type=int, default=0, help="records for the finalists (default all)")
+    tn.add_argument('--eta', type=int, default=3, help="halving rate")
+    tn.add_argument('--brackets', type=int, default=0, help="most aggressive brackets only (1: plain SH)")
+    tn.add_argument('--max-steps', type=int, default=25)
+    tn.add_argument('--step-weight', type=float, default=0.5, help="loss weight of kernel steps")
+    tn.add_argument('--seed', type=int, default=0)
+    sk = sub.add_parser('soak', help="long single-engine run; fails if RSS keeps growing")
+    sk.add_argument('-e', '--engine', default='v10', choices=['v10', 'v9', 'v8', 'v51', 'v5', 'v4', 'r31'])
+    sk.add_argument('-o', '--output', default='-', help="JSON report, '-' for stdout")
+    sk.add_argument('--calls', type=int, default=1_000_000)
+    sk.add_argument('--every', type=int, default=0, help="calls between RSS samples (default calls/200)")
+    sk.add_argument('--warmup', type=float, default=0.1, help="fraction of calls before the baseline")
+    sk.add_argument('--max-growth-mb', type=float, default=16.0, help="allowed RSS growth after warmup")
+    sk.add_argument('--max-steps', type=int, default=10)
+    sk.add_argument('-v', '--verbose', action='store_true', help="print every sample to stderr")
+    sub.add_parser('version', help="print package version")
+    a = ap.parse_args(argv)
+
+    if a.cmd == 'version':
+        from ascpi import __version__
+        print(__version__)
+        return 0
+
+    if a.cmd == 'encode':
+        from ascpi.parallel import encode_parallel
+        if a.input == '-':
+            text = sys.stdin.read()
+        else:
+            with open(a.input, encoding='utf-8') as f:
+                text = f.read()
+        print(json.dumps(jsonable(encode_parallel(text, a.engine, a.jobs, a.chunk)), ensure_ascii=False))
+        return 0
+
+    if a.cmd == 'featurize':
+        from ascpi.bulk import featurize
+        st = featurize(a.input, a.output, a.engine, a.jobs, a.chunk_bytes, a.errors)
+        print(f"ascpi: {st['records']} records -> {st['psi']}, {st['offsets']}", file=sys.stderr)
+        return 0
+
+    if a.cmd == 'profile':
+        return profile_corpus(a)
+
+    if a.cmd == 'tune':
+        return tune_corpus(a)
+
+    if a.cmd == 'soak':
+        return soak_engine(a)
+
+    src = sys.stdin if a.input == '-' else open(a.input, encoding='utf-8', buffering=1 << 16)
+    dst = sys.stdout if a.output == '-' else open(a.output, 'w', encoding='utf-8', buffering=1 << 16)
+    try:
+        stats = run_pipeline(src, dst, a.engine, a.jobs, a.state, a.format, a.chunk, a.inflight, a.max_sessions)
+    except BrokenPipeError:   # downstream closed early (e.g. `| head`)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if src is not sys.stdin: src.close()
+        if dst is not sys.stdout: dst.close()
+    print(f"ascpi: {stats['records']} records, {stats['errors']} errors", file=sys.stderr)
+    return 1 if stats['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+ascpi.parallel — map-reduce text encoding for very large documents.
+
+    from ascpi.parallel import encode_parallel
+    psi = encode_parallel(text, 'v9', jobs=8)    # == v9 Encoder.text(text), bit for bit
+
+Pipeline:
+
+    cut at grapheme-safe points ──▶ map: per-unit terms ──▶ offsets, n
+        ──▶ map: phasors at global positions ──▶ reduce: sums in text order
+
+Every encoder sums position-free terms (tension, curvature or its reciprocal,
+energy) plus phasors exp(j·(base + pos(i, n))) whose position needs the global
+index i and total n. The first map returns the terms of each chunk and its
+unit count; once offsets and n are known the second map evaluates the
+phasors. The reduce step only adds, in text order and with the release's own
+accumulation (`+=` loop or builtin sum), so the result equals the scalar
+encoder exactly. Float addition is not associative, so chunk-level subtotals
+could not promise that; the parent keeps the additions and the workers do
+the segmentation, Unicode lookups and trigonometry.
+
+Releases:  v10 encode_text · v9 Encoder.text · v4 glyphs_to_field(text_to_glyphs)
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing as mp
+import os
+import unicodedata
+from array import array
+from itertools import chain
+
+from ascpi._loader import load
+
+_ZWJ = '\u200d'
+MIN_CHUNK = 1 << 16     # chars; smaller inputs are encoded in-process
+
+# ==============================================================================
+# RELEASE SPECS
+# ==============================================================================
+
+def _chain_sum(cols) -> float:
+    """Left-to-right `s += x` over the columns, as the v9/v10 encoder loops"""
+    s = 0.0
+    for col in cols:
+        for x in col:
+            s += x
+    return s
+
+
+def _builtin_sum(cols) -> float:
+    """Builtin sum() over the columns, as v4 glyphs_to_field"""
+    return sum(chain.from_iterable(cols))
+
+
+def _v10_build(m, n, sin_s, cos_s, sums, src):
+    dP_s, N_s = sums
+    k_s = 0.0
+    for _ in range(n):
+        k_s += 0.3
+    return m.Psi(dP_s/n, k_s/n, math.atan2(sin_s, cos_s) % m.CONST['tau'], N_s, math.sqrt(sin_s**2+cos_s**2)/n)
+
+
+def _v9_build(m, n, sin_s, cos_s, sums, src):
+    κ_sum, ΔΦ_sum, N_sum = sums
+    return m.Ψ(ΔΦ=ΔΦ_sum / n, κ=κ_sum / n, θ=math.atan2(sin_s, cos_s) % m.τ, N=N_sum,
+               C=math.sqrt(sin_s**2 + cos_s**2) / n, src=src)
+
+
+def _v4_build(m, n, sin_s, cos_s, sums, src):
+    kappa_inv_sum, delta_phi_sum, energy = sums
+    return m.FieldState(delta_phi=delta_phi_sum / n, kappa=n / kappa_inv_sum,
+                        theta=math.atan2(sin_s, cos_s) % m.TAU, energy=energy,
+                        coherence=math.sqrt(sin_s**2 + cos_s**2) / n, timestamp=0)
+
+
+class Spec:
+    """How one release encodes: terms, positional phase, accumulation, result"""
+    def __init__(self, release, terms, pos, tau, fold, build, scalar):
+        self.release = release
+        self.terms = terms      # module, text -> [(base, *sums)]
+        self.pos = pos          # module, i, n -> positional phase
+        self.tau = tau          # module -> τ
+        self.fold = fold        # columns -> float, in the scalar's summation order
+        self.build = build      # module, n, sin, cos, sums, src -> field
+        self.scalar = scalar    # module, text, src -> field (reference encoder)
+
+
+SPECS = {
+    'v10': Spec('v10', lambda m, t: m.text_terms(t),
+                lambda m, i, n: (i/n) * m.CONST['pi'], lambda m: m.CONST['tau'],
+                _chain_sum, _v10_build, lambda m, t, src: m.encode_text(t)),
+    'v9': Spec('v9', lambda m, t: m.Encoder.text_terms(t),
+               lambda m, i, n: (i / n) * m.τ / 2, lambda m: m.τ,
+               _chain_sum, _v9_build, lambda m, t, src: m.Encoder.text(t, src)),
+    'v4': Spec('v4', lambda m, t: m.UniversalGlyphProcessor.text_terms(t),
+               lambda m, i, n: (i / max(n, 1)) * m.TAU, lambda m: m.TAU,
+               _builtin_sum, _v4_build,
+               lambda m, t, src: m.UniversalGlyphProcessor.glyphs_to_field(
+                   m.UniversalGlyphProcessor.text_to_glyphs(t))),
+}
+
+# ==============================================================================
+# SPLITTING
+# ==============================================================================
+
+def safe_cut(text: str, p: int) -> bool:
+    """
+    True if no grapheme cluster spans text[p-1:p+1] for any release segmenter.
+    Clusters only grow through ZWJ (which takes the next char, even a space),
+    marks, variation selectors, skin tones and regional indicator pairs; a
+    space or letter/number/punctuation not preceded by ZWJ starts afresh.
+    """
+    if p <= 0 or p >= len(text):
+        return True
+    c = text[p]
+    if text[p - 1] == _ZWJ or c == _ZWJ:
+        return False
+    return c.isspace() or unicodedata.category(c)[0] in 'LNP'
+
+
+def split_text(text: str, chunk_chars: int) -> list:
+    """Cut text into ~chunk_chars pieces at grapheme-safe points"""
+    pieces, start = [], 0
+    while len(text) - start > chunk_chars:
+        p = start + chunk_chars
+        while p < len(text) and not safe_cut(text, p):
+            p += 1
+        pieces.append(text[start:p])
+        start = p
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+# ==============================================================================
+# MAP / REDUCE
+# ==============================================================================
+
+def map_terms(release: str, chunk: str) -> tuple:
+    """Phase 1: (unit count, base column, sum columns) of one chunk"""
+    terms = SPECS[release].terms(load(release), chunk)
+    cols = [array('d', col) for col in zip(*terms)] if terms else []
+    return len(terms), (cols[0] if cols else array('d')), cols[1:]
+
+
+def map_phasors(release: str, bases: array, offset: int, n: int) -> tuple:
+    """Phase 2: sin/cos columns of units offset.. at their global positions"""
+    spec = SPECS[release]
+    m = load(release)
+    tau, pos = spec.tau(m), spec.pos
+    sins, coss = array('d'), array('d')
+    for j, b in enumerate(bases):
+        θ = (b + pos(m, offset + j, n)) % tau
+        sins.append(math.sin(θ))
+        coss.append(math.cos(θ))
+    return sins, coss
+
+
+def _star(args):
+    fn, *rest = args
+    return fn(*rest)
+
+
+def encode_parallel(text: str, release: str = 'v10', jobs: int = 0, chunk_chars: int = 0,
+                    pool=None, src: str = "lang"):
+    """
+    Encode text like the release's scalar encoder, with the work spread over a
+    process pool (`pool`, or `jobs` fresh processes; default cpu_count).
+    `jobs` also sizes the chunks (four per worker). Inputs under MIN_CHUNK
+    characters, or jobs == 1 without a pool, take the scalar path.
+    `src` is passed through to v9 fields.
+    """
+    if release not in SPECS:
+        raise ValueError(f"unknown release {release!r}; choose from {', '.join(SPECS)}")
+    spec, m = SPECS[release], load(release)
+    jobs = jobs or os.cpu_count() or 1
+    if (jobs <= 1 and pool is None) or len(text) < MIN_CHUNK:
+        return spec.scalar(m, text, src)
+    chunks = split_text(text, chunk_chars or max(MIN_CHUNK, -(-len(text) // (4 * jobs))))
+
+    own = pool is None
+    if own:
+        ctx = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+        pool = ctx.Pool(jobs)
+    try:
+        parts = pool.map(_star, [(map_terms, release, c) for c in chunks])
+        n = sum(count for count, _, _ in parts)
+        if not n:
+            return spec.scalar(m, '', src)
+        offsets = [0]
+        for count, _, _ in parts[:-1]:
+            offsets.append(offsets[-1] + count)
+        phasors = pool.map(_star, [(map_phasors, release, bases, off, n)
+                                   for (_, bases, _), off in zip(parts, offsets)])
+    finally:
+        if own:
+            pool.close()
+            pool.join()
+
+    sin_s = spec.fold([s for s, _ in phasors])
+    cos_s = spec.fold([c for _, c in phasors])
+    width = len(next(cols for _, _, cols in parts if cols))
+    sums = [spec.fold([cols[k] for _, _, cols in parts if cols]) for k in range(width)]
+    return spec.build(m, n, sin_s, cos_s, sums, src)
@@ -0,0 +1,273 @@
+"""
+ascpi.primitives — release-independent building blocks shared by the engines.
+
+    RollingTrend    fixed-window series, O(1) push, endpoint / slope / moments
+    PhasorSum       running phasor sum over a growing sequence, O(K log n)
+    StepControl     per-call deadline and contraction-bound loop control
+    ContentCache    thread-safe content-addressed LRU (the releases' world caches)
+
+The v4, v5.1, v8, v9 and v10 engines import these instead of carrying their
+own copies. Nothing here knows about a field type: StepControl needs
+dist(), ContentCache stores whatever its build callable returns. Stdlib
+only, so a release run straight from its directory can import it (the
+releases add the source-tree root to sys.path when the package is not
+installed).
+"""
+
+from __future__ import annotations
+
+import cmath
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+TAU = 2 * math.pi
+EPS = 1e-12
+
+# ==============================================================================
+# ROLLING TREND (fixed window, O(1) per step)
+# ==============================================================================
+
+class RollingTrend:
+    """
+    Last `window` values of a series with O(1) push and summaries:
+        delta()       last - first
+        trend()       (last - first) / len     (awareness criteria)
+        slope()       least-squares slope per step
+        mean(), variance()
+    Endpoints come straight from the ring. Sum(y), Sum(i*y), Sum(y^2) are kept
+    running and rebuilt from the ring every `window` pushes, which bounds
+    rounding drift at O(1) amortized cost.
+    """
+    __slots__ = ('window', '_ring', '_s0', '_s1', '_s2', '_since')
+
+    def __init__(self, window: int, values=()):
+        self.window = window
+        self._ring: deque = deque(maxlen=window)
+        self._s0 = self._s1 = self._s2 = 0.0   # Sum y, Sum i*y (i = 0 oldest), Sum y^2
+        self._since = 0
+        self.extend(values)
+
+    def push(self, y: float) -> None:
+        ring, i = self._ring, len(self._ring)   # i: index y will have
+        if i == self.window:
+            old = ring[0]
+            self._s1 -= self._s0 - old   # remaining indices shift down by one
+            self._s0 -= old
+            self._s2 -= old * old
+            i -= 1
+        ring.append(y)
+        self._s0 += y
+        self._s1 += i * y
+        self._s2 += y * y
+        self._since += 1
+        if self._since >= self.window:
+            self._rebuild()
+
+    def extend(self, values) -> None:
+        for y in values: self.push(y)
+
+    def _rebuild(self) -> None:
+        ring = self._ring
+        self._s0 = sum(ring)
+        self._s1 = sum(i * y for i, y in enumerate(ring))
+        self._s2 = sum(y * y for y in ring)
+        self._since = 0
+
+    def delta(self) -> float:
+        return self._ring[-1] - self._ring[0] if self._ring else 0.0
+
+    def trend(self) -> float:
+        return (self._ring[-1] - self._ring[0]) / len(self._ring) if self._ring else 0.0
+
+    def slope(self) -> float:
+        m = len(self._ring)
+        if m < 2: return 0.0
+        sx, sxx = m * (m - 1) / 2, (m - 1) * m * (2 * m - 1) / 6
+        return (m * self._s1 - sx * self._s0) / (m * sxx - sx * sx)
+
+    def mean(self) -> float:
+        return self._s0 / len(self._ring) if self._ring else 0.0
+
+    def variance(self) -> float:
+        m = len(self._ring)
+        if not m: return 0.0
+        mu = self._s0 / m
+        return max(0.0, self._s2 / m - mu * mu)
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def __iter__(self):
+        return iter(self._ring)
+
+# ==============================================================================
+# PHASOR SUM (growing sequence, O(K log n) per sum)
+# ==============================================================================
+
+class PhasorSum:
+    """
+    Running sum  S = sum_i exp(j*((b_i + pos(i, n)) mod tau))  over an append-only
+    sequence whose length n keeps growing, with pos(i, n) ~ omega * i / n.
+
+    Recent items (the open tail) stay raw and are summed exactly with pos().
+    Older items are folded into closed blocks of L items at offset s holding
+    normalized moments  M_k = sum_l exp(j*b_(s+l)) * (l/L)^k,  so for any later n
+        block sum = exp(j*omega*s/n) * sum_k (j*omega*L/n)^k / k! * M_k
+    Blocks are closed/merged only while omega*L/n <= X_MAX, where K terms reach
+    double precision; equal neighbours merge (binary counter), so a sum costs
+    O(K * log n) plus a tail of < MIN_BLOCK items. While n < MIN_BLOCK*omega/X_MAX
+    everything is tail and the result is bit-identical to the direct loop.
+    """
+    K = 16
+    X_MAX = 0.4
+    MIN_BLOCK = 64
+
+    def __init__(self, omega: float, pos: Callable[[int, int], float]):
+        self.omega, self.pos = omega, pos
+        self.n = 0
+        self._tail: List[float] = []
+        self._tail_start = 0
+        self._blocks: List[Tuple[int, int, List[complex]]] = []   # (offset, length, moments)
+
+    def add(self, b: float) -> None:
+        self._tail.append(b)
+        self.n += 1
+        L = self.MIN_BLOCK
+        if len(self._tail) >= L and self.omega * L <= self.X_MAX * self.n:
+            self._close(L)
+
+    def _close(self, L: int) -> None:
+        items, self._tail = self._tail[:L], self._tail[L:]
+        M = [0j] * self.K
+        for l, b in enumerate(items):
+            z, u = complex(math.cos(b), math.sin(b)), l / L
+            for k in range(self.K):
+                M[k] += z
+                z *= u
+        self._blocks.append((self._tail_start, L, M))
+        self._tail_start += L
+        while len(self._blocks) >= 2:
+            (s, La, Ma), (_, Lb, Mb) = self._blocks[-2], self._blocks[-1]
+            if La != Lb or self.omega * 2 * La > self.X_MAX * self.n: break
+            # right half: u' = (u + 1) / 2  ->  binomial re-centering
+            merged = [(Ma[k] + sum(math.comb(k, m) * Mb[m] for m in range(k + 1))) / 2**k
+                      for k in range(self.K)]
+            self._blocks[-2:] = [(s, 2 * La, merged)]
+
+    def sums(self, extra: Tuple[float, ...] = ()) -> Tuple[float, float]:
+        """(sum sin, sum cos) for the current items plus `extra` appended"""
+        n = self.n + len(extra)
+        acc = 0j
+        for s, L, M in self._blocks:
+            c = 1j * self.omega * L / n
+            h = M[-1]
+            for k in range(self.K - 2, -1, -1):
+                h = M[k] + h * c / (k + 1)
+            acc += cmath.exp(1j * self.omega * s / n) * h
+        sin_s, cos_s = acc.imag, acc.real
+        i = self._tail_start
+        for b in (*self._tail, *extra):
+            t = (b + self.pos(i, n)) % TAU
+            sin_s += math.sin(t)
+            cos_s += math.cos(t)
+            i += 1
+        return sin_s, cos_s
+
+# ==============================================================================
+# STEP CONTROL (deadline / adaptive termination)
+# ==============================================================================
+
+class StepControl:
+    """
+    Per-call loop control for the engines' process().
+
+    deadline_ms: wall-clock budget. Checked before every kernel step; once
+        spent, the loop stops and the lowest-L state seen so far is returned,
+        flagged truncated.
+    tol: stop once the a-posteriori contraction bound on the remaining drift
+            |d_k| * q / (1 - q),   q = |d_k| / |d_k-1|,   d_k = dist(Psi_k, Psi_k-1)
+        falls below tol, i.e. further steps cannot move Psi by more than tol.
+    States only need dist().
+    """
+    def __init__(self, deadline_ms: Optional[float] = None, tol: Optional[float] = None):
+        self.t_end = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000
+        self.tol = tol
+        self.truncated = False
+        self.best = None
+        self._L_best = float('inf')
+        self._d_prev: Optional[float] = None
+
+    def expired(self) -> bool:
+        if not self.truncated and self.t_end is not None and time.perf_counter() >= self.t_end:
+            self.truncated = True
+        return self.truncated
+
+    def settled(self, before, after, L: float) -> bool:
+        if self.t_end is not None and L < self._L_best:
+            self._L_best, self.best = L, after
+        if self.tol is None: return False
+        d = before.dist(after)
+        d_prev, self._d_prev = self._d_prev, d
+        if d <= EPS: return True
+        if not d_prev: return False
+        q = d / d_prev
+        return q < 1 and d * q / (1 - q) < self.tol
+
+    def restart(self) -> None:
+        """New operator (REBUILD): the contraction rate is re-estimated"""
+        self._d_prev = None
+
+    def output(self, current):
+        return self.best if self.truncated and self.best is not None else current
+
+# ==============================================================================
+# CONTENT CACHE (thread-safe LRU)
+# ==============================================================================
+
+class ContentCache:
+    """
+    Content-addressed LRU shared by all engines of a release, keyed by
+    digest(text) (blake2b-128) or tuples of digests. Values are built outside
+    the lock on a miss (two threads missing together both build; the last
+    one wins) and handed out shared: treat them as read-only. The releases'
+    WorldCache classes add the field-type specific lookups on top.
+    """
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._lru: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def _get(self, key, build: Callable[[], object]):
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = build()
+        with self._lock:
+            self._lru[key] = value
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._lru), 'max_entries': self.max_entries}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,130 @@
+"""
+ascpi.profile — per-stage profiling of engine process() calls.
+
+    from ascpi.profile import Profiler
+    engine = ascpi.ASCPiEngine5()
+    engine.profiler = prof = Profiler()
+    engine.process("hello")
+    prof.write_chrome_trace("trace.json")    # chrome://tracing, Perfetto
+    prof.write_collapsed("stacks.folded")    # flamegraph.pl, speedscope
+
+    ascpi profile corpus.txt -e v51 --trace trace.json --folded stacks.folded
+
+Engines (v5.1 ASCPiEngine5, v8/v9/v10 ASCPI) have a `profiler` attribute,
+None by default. When set, process() calls profiler.begin(name) and
+profiler.end() around itself ("process"), each stage (encoding,
+world_context, multimodal_projection, coherence_fusion, memory, evolution,
+governor, rebuild, resonance, output; each release emits the ones it has)
+and the sub-stages inside them (v5.1: every evolution step, predict and
+each D/A/I/M/K operator). Any object with those two methods can be plugged
+in; with None the engines only pay an `is not None` test per boundary.
+
+Profiler keeps complete spans for the trace export (up to max_events; the
+rest are counted in `dropped`) and aggregates self time per stack for the
+collapsed export, which stays bounded however long it runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+
+class Profiler:
+    """Nested span recorder: begin(name) / end() from one thread"""
+    def __init__(self, max_events: int = 1_000_000, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.max_events = max_events
+        self.events: list = []      # (stack depth, name, start ns, duration ns)
+        self.dropped = 0
+        self.self_ns: dict = {}     # "a;b;c" -> self time ns
+        self.totals: dict = {}      # name -> [calls, total ns]
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+        self._stack: list = []      # [name, start ns, child ns]
+
+    def begin(self, name: str) -> None:
+        self._stack.append([name, self.clock(), 0])
+
+    def end(self) -> None:
+        name, t0, child = self._stack.pop()
+        dur = self.clock() - t0
+        stack = self._stack
+        if len(self.events) < self.max_events:
+            self.events.append((len(stack), name, t0, dur))
+        else:
+            self.dropped += 1
+        key = ';'.join([f[0] for f in stack] + [name])
+        self.self_ns[key] = self.self_ns.get(key, 0) + dur - child
+        tot = self.totals.get(name)
+        if tot is None:
+            self.totals[name] = [1, dur]
+        else:
+            tot[0] += 1
+            tot[1] += dur
+        if stack:
+            stack[-1][2] += dur
+
+    def span(self, name: str):
+        """Context manager form of begin()/end() for callers"""
+        return _Span(self, name)
+
+    def unwind(self) -> None:
+        """Drop spans left open by an exception inside process()"""
+        self._stack.clear()
+
+    def reset(self) -> None:
+        self.events.clear()
+        self.self_ns.clear()
+        self.totals.clear()
+        self.dropped = 0
+        self._stack.clear()
+
+    # --------------------------------------------------------------------------
+    # Exports
+    # --------------------------------------------------------------------------
+
+    def chrome_trace(self) -> dict:
+        """Trace Event Format: one complete ("X") event per span, microseconds"""
+        t_base = min((e[2] for e in self.events), default=0)
+        return {
+            "traceEvents": [
+                {"name": name, "cat": "ascpi", "ph": "X", "pid": self.pid, "tid": self.tid,
+                 "ts": (t0 - t_base) / 1e3, "dur": dur / 1e3, "args": {"depth": depth}}
+                for depth, name, t0, dur in self.events],
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped": self.dropped},
+        }
+
+    def collapsed(self) -> str:
+        """Collapsed stacks ("a;b;c <self µs>" per line), the flame graph input"""
+        return ''.join(f"{k} {ns // 1000}\n" for k, ns in sorted(self.self_ns.items()) if ns >= 1000)
+
+    def summary(self) -> list:
+        """[(name, calls, total ms)] by total time, descending"""
+        return sorted(((n, c, ns / 1e6) for n, (c, ns) in self.totals.items()), key=lambda r: -r[2])
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+
+
+class _Span:
+    __slots__ = ('prof', 'name')
+
+    def __init__(self, prof: Profiler, name: str):
+        self.prof, self.name = prof, name
+
+    def __enter__(self):
+        self.prof.begin(self.name)
+        return self.prof
+
+    def __exit__(self, *exc):
+        self.prof.end()
+        return False
@@ -0,0 +1,125 @@
+"""
+ascpi.soak — flat-RSS soak benchmark for long-running engines.
+
+    from ascpi.soak import soak
+    report = soak('v51', calls=1_000_000)
+    assert report['passed'], report['growth']
+
+    ascpi soak -e v51 --calls 1000000 --max-growth-mb 16 -o soak.json
+
+One engine instance processes `calls` distinct inputs in a single session
+(the way a server worker or a streaming job keeps an engine alive), with a
+fixed world context on the engines that take one. Every `every` calls the
+process RSS is sampled after gc.collect(). The first `warmup` fraction of
+the run fills caches, rings and interned tables; the RSS at its end is the
+baseline. The run passes when no later sample exceeds the baseline by more
+than max_growth bytes. `slope` (bytes per 1000 calls, least squares over
+the post-warmup samples) shows a slow leak before it breaks the bound.
+
+RSS comes from /proc/self/statm; elsewhere the peak RSS from getrusage() is
+used, which is enough to see whether memory keeps climbing.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import time
+
+from ascpi._loader import load
+
+WORLD = {'news': "World context for the soak run."}
+TEXT = "Soak record {i}: the field keeps evolving while coherence holds."
+
+
+def _v5_domain(m):
+    return next(iter(m.FieldDomain))
+
+
+# engine key -> (release, constructor, call(engine, module, text, max_steps))
+ENGINES = {
+    'v10': ('v10', 'ASCPI', lambda e, m, t, n: e.process(t, None, WORLD, n)),
+    'v9': ('v9', 'ASCPI', lambda e, m, t, n: e.process(t, None, WORLD, n)),
+    'v8': ('v8', 'ASCPI', lambda e, m, t, n: e.process(t, None, WORLD, n)),
+    'v51': ('v51', 'ASCPiEngine5', lambda e, m, t, n: e.process(
+        t, world_context={k: ('general', v) for k, v in WORLD.items()}, max_steps=n)),
+    'v5': ('v5', 'ASCPiEngineV5', lambda e, m, t, n: e.process(
+        t, context_sources=[(k, _v5_domain(m), v) for k, v in WORLD.items()])),
+    'v4': ('v4', 'ASCPiEngine', lambda e, m, t, n: e.process(t, steps=n)),
+    'r31': ('r31', 'SFTSimulationEngine', lambda e, m, t, n: e.process_text(t, steps=n)),
+}
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _slope(points: list) -> float:
+    """Least-squares slope of (x, y) points"""
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mx = sum(x for x, _ in points) / n
+    my = sum(y for _, y in points) / n
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (y - my) for x, y in points) / sxx if sxx else 0.0
+
+
+def soak(engine: str = 'v10', calls: int = 1_000_000, every: int = 0, warmup: float = 0.1,
+         max_growth: int = 16 << 20, max_steps: int = 10, progress=None) -> dict:
+    """
+    Run `calls` process() calls on one engine and sample RSS along the way.
+    every: calls between samples (default: 200 samples over the run).
+    progress: optional callable(sample dict) invoked after each sample.
+    """
+    if engine not in ENGINES:
+        raise KeyError(f"unknown engine {engine!r}; known: {', '.join(ENGINES)}")
+    if calls < 1:
+        raise ValueError("soak needs at least one call")
+    key, cls, call = ENGINES[engine]
+    m = load(key)
+    e = getattr(m, cls)()
+    every = every or max(1, calls // 200)
+    cut = int(calls * warmup)
+
+    gc.collect()
+    samples = [{'calls': 0, 'rss': rss_bytes(), 'seconds': 0.0}]
+    t0 = time.perf_counter()
+    for i in range(calls):
+        call(e, m, TEXT.format(i=i), max_steps)
+        if (i + 1) % every == 0 or i + 1 == calls:
+            gc.collect()
+            s = {'calls': i + 1, 'rss': rss_bytes(), 'seconds': time.perf_counter() - t0}
+            samples.append(s)
+            if progress is not None: progress(s)
+    seconds = time.perf_counter() - t0
+
+    warm = [s for s in samples if s['calls'] <= cut]
+    after = [s for s in samples if s['calls'] > cut]
+    baseline = warm[-1]['rss']
+    peak = max(s['rss'] for s in after)
+    growth = peak - baseline
+    return {
+        'engine': engine,
+        'calls': calls,
+        'seconds': seconds,
+        'calls_per_s': calls / seconds if seconds else 0.0,
+        'warmup_calls': cut,
+        'rss_start': samples[0]['rss'],
+        'rss_baseline': baseline,
+        'rss_peak': peak,
+        'rss_end': samples[-1]['rss'],
+        'growth': growth,
+        'max_growth': max_growth,
+        'slope': _slope([(s['calls'], s['rss']) for s in after]) * 1000,   # bytes / 1000 calls
+        'passed': growth <= max_growth,
+        'samples': samples,
+    }
@@ -0,0 +1,219 @@
+"""
+ascpi.tune — adaptive search over the v10 kernel constants.
+
+    from ascpi.tune import hyperband
+    report = hyperband([{'text': t} for t in corpus], max_records=81, jobs=4)
+    ASCPI(KernelParams.from_const(report['best']['params']))
+
+    ascpi tune corpus.txt -j 4 --max-records 81 --eta 3 -o tune.json
+
+Candidates are Latin hypercube samples of SPACE (alpha, beta, gamma, eta,
+K, lambda and the kappa / theta / energy bounds): every dimension is cut
+into n equal strata and each stratum is used exactly once, so n candidates
+cover each parameter's range evenly instead of clumping.
+
+Hyperband runs successive halving in several brackets. A bracket starts n
+candidates on r corpus records, keeps the best 1/eta and gives the
+survivors eta times the records, until one candidate has seen max_records.
+Brackets trade many cheap candidates against few well-measured ones. A
+candidate resumes where its last rung stopped (in session mode the engine
+state travels as a dumps_state() checkpoint), so reaching r records always
+costs r process() calls.
+
+Score per candidate over the records it has seen (lower is better):
+
+    loss = (1 - mean final C) + step_weight * mean kernel steps / max_steps
+
+The current constants are scored on all max_records as the baseline.
+
+Kernel steps include governor REBUILD steps and come from the engine's
+`metrics` hook. Rungs are spread over worker processes; each evaluation
+runs on engines built with the candidate's KernelParams, so nothing
+module-global changes. The kappa bounds stay inside the canonical CONST
+range, which Psi enforces regardless of the engine's parameters.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing as mp
+import os
+import random
+
+from ascpi._loader import load
+
+# name -> (low, high, log scale)
+SPACE = {
+    'alpha': (0.02, 0.5, False),
+    'beta': (0.02, 0.4, False),
+    'gamma': (0.02, 0.5, False),
+    'eta': (0.05, 0.6, False),
+    'K': (0.1, 1.0, False),
+    'lambda': (0.0, 0.1, False),
+    'kappa_min': (0.01, 0.1, True),
+    'kappa_max': (2.0, 10.0, True),
+    'theta_max': (math.pi / 8, math.pi / 2, False),
+    'delta_N': (0.05, 0.4, False),
+}
+
+# ==============================================================================
+# SAMPLING
+# ==============================================================================
+
+def latin_hypercube(space: dict, n: int, rng: random.Random) -> list:
+    """n parameter dicts; each dimension's n strata are each hit once"""
+    cols = {}
+    for name, (lo, hi, log) in space.items():
+        strata = list(range(n))
+        rng.shuffle(strata)
+        if log:
+            a, b = math.log(lo), math.log(hi)
+            cols[name] = [math.exp(a + (b - a) * (k + rng.random()) / n) for k in strata]
+        else:
+            cols[name] = [lo + (hi - lo) * (k + rng.random()) / n for k in strata]
+    return [{name: cols[name][i] for name in space} for i in range(n)]
+
+# ==============================================================================
+# EVALUATION (runs in the workers)
+# ==============================================================================
+
+class _Recorder:
+    """Per-engine metrics hook: kernel steps and final C of every process()"""
+    def __init__(self):
+        self.steps, self.coherence = [], []
+
+    def record(self, engine, latency, steps, coherence, decision, rebuild_steps, kernel_calls, clamps):
+        self.steps.append(kernel_calls)
+        self.coherence.append(coherence)
+
+
+def evaluate(params: dict, records: list, state, max_steps: int, session: bool) -> tuple:
+    """Run records on v10 engines under params -> (steps, coherence, state)"""
+    m = load('v10')
+    kp = m.KernelParams.from_const(params)
+    rec = _Recorder()
+    engine = None
+    for r in records:
+        if engine is None or not session:
+            engine = m.loads_state(state, kp) if state and session else m.ASCPI(kp)
+            engine.metrics = rec
+        engine.process(r['text'], r.get('code'), r.get('world'), int(r.get('max_steps', max_steps)))
+    if session and engine is not None:
+        state = m.dumps_state(engine)
+    return rec.steps, rec.coherence, state
+
+
+def _star(args):
+    return evaluate(*args)
+
+# ==============================================================================
+# SUCCESSIVE HALVING / HYPERBAND
+# ==============================================================================
+
+class Candidate:
+    def __init__(self, cid: int, params: dict):
+        self.id = cid
+        self.params = params
+        self.steps: list = []
+        self.coherence: list = []
+        self.state = None   # session checkpoint after the records seen so far
+
+    @property
+    def records(self) -> int:
+        return len(self.coherence)
+
+    def loss(self, max_steps: int, step_weight: float) -> float:
+        n = self.records
+        return (1 - sum(self.coherence) / n) + step_weight * sum(self.steps) / n / max_steps
+
+    def report(self, max_steps: int, step_weight: float) -> dict:
+        n = self.records
+        return {'id': self.id, 'params': self.params, 'records': n,
+                'mean_steps': sum(self.steps) / n, 'mean_coherence': sum(self.coherence) / n,
+                'loss': self.loss(max_steps, step_weight)}
+
+
+class _Runner:
+    """Advances candidates to a record count, in parallel; counts engine runs"""
+    def __init__(self, records: list, max_steps: int, session: bool, pool):
+        self.records, self.max_steps, self.session, self.pool = records, max_steps, session, pool
+        self.runs = 0
+
+    def advance(self, cands: list, r: int) -> None:
+        todo = [c for c in cands if c.records < r]
+        jobs = [(c.params, self.records[c.records:r], c.state, self.max_steps, self.session) for c in todo]
+        outs = self.pool.map(_star, jobs) if self.pool is not None else map(_star, jobs)
+        for c, (steps, coh, state) in zip(todo, outs):
+            self.runs += len(steps)
+            c.steps.extend(steps)
+            c.coherence.extend(coh)
+            c.state = state
+
+
+def _halve(runner: _Runner, cands: list, r: int, rounds: int, eta: int, max_steps: int,
+           step_weight: float, max_records: int) -> list:
+    """Successive halving: rounds+1 rungs from r records, keeping the best 1/eta each time"""
+    for i in range(rounds + 1):
+        runner.advance(cands, max_records if i == rounds else r * eta ** i)
+        cands.sort(key=lambda c: c.loss(max_steps, step_weight))
+        if i < rounds: cands = cands[:max(1, len(cands) // eta)]
+    return cands
+
+
+def hyperband(records: list, max_records: int = 0, eta: int = 3, min_records: int = 1,
+              max_steps: int = 25, step_weight: float = 0.5, session: bool = False,
+              brackets: int = 0, jobs: int = 0, seed: int = 0, space: dict = None) -> dict:
+    """
+    Tune the v10 constants on records ({'text', [code], [world], [max_steps]}).
+    max_records (default: all) is the most any candidate sees; `brackets`
+    limits the run to the most aggressive ones (1 = plain successive
+    halving). jobs: worker processes (default cpu_count, 1 = in-process).
+    """
+    if not records:
+        raise ValueError("tuning needs at least one record")
+    space = space or SPACE
+    max_records = min(max_records or len(records), len(records))
+    s_max = 0
+    while min_records * eta ** (s_max + 1) <= max_records:
+        s_max += 1
+    rng = random.Random(seed)
+    jobs = jobs or os.cpu_count() or 1
+    pool = None
+    if jobs > 1:
+        ctx = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+        pool = ctx.Pool(jobs)
+    runner = _Runner(records, max_steps, session, pool)
+    seen, out, cid = [], [], 0
+    baseline = Candidate(-1, {})
+    try:
+        runner.advance([baseline], max_records)
+        for s in range(s_max, -1, -1)[:brackets or None]:
+            n = math.ceil((s_max + 1) / (s + 1) * eta ** s)
+            cands = []
+            for params in latin_hypercube(space, n, rng):
+                cands.append(Candidate(cid, params))
+                cid += 1
+            seen.extend(cands)
+            r = max(min_records, max_records // eta ** s)
+            best = _halve(runner, cands, r, s, eta, max_steps, step_weight, max_records)[0]
+            out.append({'bracket': s, 'candidates': n, 'min_records': r,
+                        'best': best.report(max_steps, step_weight)})
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    full = [c for c in seen if c.records == max_records]
+    best = min(full, key=lambda c: c.loss(max_steps, step_weight))
+    m = load('v10')
+    return {
+        'best': best.report(max_steps, step_weight),
+        'baseline': {**baseline.report(max_steps, step_weight),
+                     'params': {k: v for k, v in m.DEFAULT_PARAMS.as_const().items() if k in space}},
+        'brackets': out,
+        'leaderboard': [c.report(max_steps, step_weight)
+                        for c in sorted(full, key=lambda c: c.loss(max_steps, step_weight))],
+        'candidates': len(seen),
+        'runs': runner.runs,
+        'grid_runs': 3 ** len(space) * max_records,   # 3 levels per constant, every record
+    }
@@ -0,0 +1,25 @@
+"""
+Build hook for the ascpi package; all metadata lives in pyproject.toml.
+
+The release directories are shipped whole as the ascpi._rX subpackages, but
+setuptools applies [tool.setuptools.exclude-package-data] to data files only.
+build_py below applies the same patterns to modules, so the test suites and
+analysis scripts listed there stay out of the wheel.
+"""
+
+import fnmatch
+import os
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        excluded = self.distribution.exclude_package_data or {}
+        patterns = [*excluded.get('', ()), *excluded.get(package, ())]
+        return [(pkg, mod, path) for pkg, mod, path in super().find_package_modules(package, package_dir)
+                if not any(fnmatch.fnmatch(os.path.basename(path), p) for p in patterns)]
+
+
+setup(cmdclass={'build_py': BuildPy})